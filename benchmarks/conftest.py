@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+SIZES = [100, 10_000]
+
+_COUNTRY_NAMES = ["United States", "United Kingdom", "Germany", "Japan", "Switzerland", "US", "GB"]
+_CURRENCIES = ["USD", "GBP", "EUR", "JPY", "CHF"]
+
+
+def _luhn_isin_check(body: str) -> str:
+    digits = "".join(str(int(ch, 36)) for ch in body)
+    total = 0
+    for i, ch in enumerate(reversed(digits)):
+        d = int(ch)
+        if i % 2 == 0:
+            d *= 2
+            if d > 9:
+                d -= 9
+        total += d
+    return str((10 - total % 10) % 10)
+
+
+def _make_isins(n: int) -> list[str]:
+    bodies = [f"US{i:09d}" for i in range(n)]
+    return [body + _luhn_isin_check(body) for body in bodies]
+
+
+def _make_figis(n: int) -> list[str]:
+    figis = []
+    for i in range(n):
+        body = f"BBG{i:08d}"
+        total = 0
+        for j, ch in enumerate(reversed(body)):
+            val = int(ch, 36)
+            if j % 2 == 1:
+                val *= 2
+            total += val % 10 + val // 10
+        figis.append(body + str((10 - total % 10) % 10))
+    return figis
+
+
+def _make_candles(n: int) -> list[dict]:
+    start = datetime(2000, 1, 3)
+    return [
+        {
+            "date": start + timedelta(days=i),
+            "open": 100.0 + i % 7,
+            "high": 102.0 + i % 7,
+            "low": 99.0 + i % 7,
+            "close": 101.0 + i % 7,
+            "volume": 1_000.0 + i,
+        }
+        for i in range(n)
+    ]
+
+
+def _make_securities(n: int) -> list[dict]:
+    isins = _make_isins(n)
+    figis = _make_figis(n)
+    return [
+        {
+            "symbol": f"SYM{i}",
+            "name": f"Security {i}",
+            "exchange": "NSQ",
+            "country": _COUNTRY_NAMES[i % len(_COUNTRY_NAMES)],
+            "currency": _CURRENCIES[i % len(_CURRENCIES)],
+            "asset_class": "Equity",
+            "isin": isins[i],
+            "figi": figis[i],
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.fixture(params=SIZES, ids=lambda n: f"n={n}")
+def size(request) -> int:
+    return request.param
+
+
+# Generated inputs, sized by `size`; fresh per test so benchmarks cannot share mutations
+
+
+@pytest.fixture
+def candles(size) -> list[dict]:
+    return _make_candles(size)
+
+
+@pytest.fixture
+def securities(size) -> list[dict]:
+    return _make_securities(size)
+
+
+@pytest.fixture
+def isins(size) -> list[str]:
+    return _make_isins(size)
+
+
+@pytest.fixture
+def figis(size) -> list[str]:
+    return _make_figis(size)
@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from pydantic_market_data import (
+    History,
+    Security,
+    validate_candles_json,
+    validate_securities_json,
+)
+
+_SECURITY = {"symbol": "AAPL", "name": "Apple Inc", "country": "US", "currency": "USD"}
+
+
+@pytest.fixture
+def history_json(candles):
+    history = History.model_validate({"security": _SECURITY, "candles": candles})
+    return history.model_dump_json().encode()
+
+
+@pytest.fixture
+def candles_json(history_json):
+    return json.dumps(json.loads(history_json)["candles"]).encode()
+
+
+def test_history_validate_json_loads(benchmark, history_json):
+    benchmark(lambda: History.model_validate(json.loads(history_json)))
+
+
+def test_history_validate_json(benchmark, history_json):
+    benchmark(History.model_validate_json, history_json)
+
+
+def test_validate_candles_json(benchmark, candles_json):
+    benchmark(validate_candles_json, candles_json)
+
+
+@pytest.fixture
+def securities_json(securities):
+    models = [Security.model_validate(row) for row in securities]
+    return json.dumps([s.model_dump(mode="json") for s in models]).encode()
+
+
+def test_securities_validate_json_loads(benchmark, securities_json):
+    benchmark(lambda: [Security.model_validate(row) for row in json.loads(securities_json)])
+
+
+def test_validate_securities_json(benchmark, securities_json):
+    benchmark(validate_securities_json, securities_json)
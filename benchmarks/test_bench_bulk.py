@@ -0,0 +1,26 @@
+import pandas as pd
+import pytest
+
+from pydantic_market_data import Security, load_securities, validate_securities
+
+
+@pytest.fixture
+def master(securities):
+    return pd.DataFrame(securities)
+
+
+def test_security_per_row(benchmark, master):
+    rows = master.to_dict("records")
+    benchmark(lambda: [Security.model_validate(row) for row in rows])
+
+
+def test_load_securities(benchmark, master):
+    benchmark(load_securities, master)
+
+
+def test_load_securities_trusted(benchmark, master):
+    benchmark(load_securities, master, trusted=True)
+
+
+def test_validate_securities(benchmark, master):
+    benchmark(validate_securities, master)
@@ -0,0 +1,43 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from pydantic_market_data import iter_columns, read_columns
+from pydantic_market_data.synthetic import generate_columns, generate_histories, generate_securities
+
+_END = date(2024, 6, 28)
+
+
+@pytest.fixture(scope="module")
+def candles_csv(tmp_path_factory):
+    # ~20k five-minute candles
+    path = tmp_path_factory.mktemp("ingest") / "candles.csv"
+    generate_columns("1y", "5m", "NYSE", _END, seed=1).to_pandas().to_csv(path)
+    return path
+
+
+@pytest.fixture(scope="module")
+def universe_csv(tmp_path_factory):
+    # 100 securities x 1y of daily candles, grouped by symbol
+    path = tmp_path_factory.mktemp("ingest") / "universe.csv"
+    histories = generate_histories(generate_securities(100, seed=1), "1y", "1d", _END, seed=1)
+    frames = [h.to_pandas().reset_index().assign(Symbol=str(h.security.symbol)) for h in histories]
+    pd.concat(frames).to_csv(path, index=False)
+    return path
+
+
+def test_read_csv_dataframe(benchmark, candles_csv):
+    benchmark(pd.read_csv, candles_csv, index_col=0, parse_dates=True)
+
+
+def test_read_columns_csv(benchmark, candles_csv):
+    benchmark(read_columns, candles_csv, chunk_rows=10_000)
+
+
+def test_read_columns_csv_threads(benchmark, candles_csv):
+    benchmark(read_columns, candles_csv, chunk_rows=10_000, workers=2)
+
+
+def test_iter_columns_universe(benchmark, universe_csv):
+    benchmark(lambda: list(iter_columns(universe_csv)))
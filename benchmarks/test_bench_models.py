@@ -0,0 +1,45 @@
+import pytest
+
+from pydantic_market_data import OHLCV, History, Security
+
+_SECURITY = {"symbol": "AAPL", "name": "Apple Inc", "country": "US", "currency": "USD"}
+
+
+@pytest.fixture
+def history_data(candles):
+    return {"security": _SECURITY, "candles": candles}
+
+
+@pytest.fixture
+def history(history_data):
+    return History.model_validate(history_data)
+
+
+def test_ohlcv_construction(benchmark, candles):
+    benchmark(lambda: [OHLCV(**c) for c in candles])
+
+
+def test_history_construction(benchmark, history_data):
+    benchmark(History.model_validate, history_data)
+
+
+def test_history_to_pandas(benchmark, history):
+    benchmark(history.to_pandas)
+
+
+def test_history_json_dump(benchmark, history):
+    benchmark(history.model_dump_json)
+
+
+def test_history_json_load(benchmark, history):
+    payload = history.model_dump_json()
+    benchmark(History.model_validate_json, payload)
+
+
+def test_security_validation(benchmark, securities):
+    benchmark(lambda: [Security.model_validate(row) for row in securities])
+
+
+def test_security_json_round_trip(benchmark, securities):
+    payloads = [Security.model_validate(row).model_dump_json() for row in securities]
+    benchmark(lambda: [Security.model_validate_json(p) for p in payloads])
@@ -0,0 +1,21 @@
+from datetime import date
+
+from pydantic_market_data import History
+from pydantic_market_data.synthetic import generate_columns, generate_securities
+
+_END = date(2024, 6, 28)
+
+
+def test_generate_securities(benchmark, size):
+    benchmark(generate_securities, size, 1)
+
+
+def test_generate_columns_intraday(benchmark):
+    # ~100k one-minute candles
+    benchmark(generate_columns, "1y", "1m", "NYSE", _END, seed=1)
+
+
+def test_generate_history(benchmark):
+    security = generate_securities(1, seed=1)[0]
+    columns = generate_columns("max", "1d", security.exchange, _END, seed=1)
+    benchmark(History.from_columns, security, columns)
@@ -0,0 +1,36 @@
+from datetime import date, timedelta
+
+from pydantic_market_data.models import (
+    parse_date,
+    parse_datetime,
+    validate_country_code,
+    validate_figi,
+    validate_isin,
+)
+
+_COUNTRIES = ["United States", "United Kingdom", "Germany", "Japan", "US", "GB", "DE", "JP"]
+
+
+def test_validate_isin(benchmark, isins):
+    benchmark(lambda: [validate_isin(v) for v in isins])
+
+
+def test_validate_figi(benchmark, figis):
+    benchmark(lambda: [validate_figi(v) for v in figis])
+
+
+def test_validate_country_code(benchmark, size):
+    names = [_COUNTRIES[i % len(_COUNTRIES)] for i in range(size)]
+    benchmark(lambda: [validate_country_code(v) for v in names])
+
+
+def test_parse_date(benchmark, size):
+    start = date(2000, 1, 1)
+    values = [(start + timedelta(days=i)).isoformat() for i in range(size)]
+    benchmark(lambda: [parse_date(v) for v in values])
+
+
+def test_parse_datetime(benchmark, size):
+    start = date(2000, 1, 1)
+    values = [f"{start + timedelta(days=i)} 09:30:00" for i in range(size)]
+    benchmark(lambda: [parse_datetime(v) for v in values])
@@ -0,0 +1,50 @@
+from datetime import date
+
+from pydantic_market_data import (
+    Price,
+    PriceVerificationError,
+    StrictDate,
+    Symbol,
+    new_date,
+    new_price,
+    new_symbol,
+)
+
+
+def test_price_construction(benchmark, size):
+    values = [100.0 + i / 100 for i in range(size)]
+    benchmark(lambda: [Price(v) for v in values])
+
+
+def test_price_fast_construction(benchmark, size):
+    values = [100.0 + i / 100 for i in range(size)]
+    benchmark(lambda: [new_price(v) for v in values])
+
+
+def test_symbol_construction(benchmark, size):
+    values = [f"SYM{i}" for i in range(size)]
+    benchmark(lambda: [Symbol(v) for v in values])
+
+
+def test_symbol_fast_construction(benchmark, size):
+    values = [f"SYM{i}" for i in range(size)]
+    benchmark(lambda: [new_symbol(v) for v in values])
+
+
+def test_date_construction(benchmark, size):
+    values = [date(2024, 1, 1 + i % 28) for i in range(size)]
+    benchmark(lambda: [StrictDate(v) for v in values])
+
+
+def test_date_fast_construction(benchmark, size):
+    values = [date(2024, 1, 1 + i % 28) for i in range(size)]
+    benchmark(lambda: [new_date(v) for v in values])
+
+
+def test_price_verification_error(benchmark, size):
+    benchmark(
+        lambda: [
+            PriceVerificationError("Out of range", "AAPL", "2024-01-02", 150.0, 140.0, 145.0, 143.0)
+            for _ in range(size)
+        ]
+    )
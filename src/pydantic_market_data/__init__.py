@@ -1,5 +1,8 @@
 __version__ = "0.3.1"
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .cli_models import (
     CC,
     CLASS,
@@ -31,6 +34,7 @@ from .models import (
     History,
     HistoryInterval,
     HistoryPeriod,
+    MergePolicy,
     Price,
     PriceOnDate,
     PriceVerificationError,
@@ -39,8 +43,168 @@ from .models import (
     SecurityQuery,
     StrictDate,
     Symbol,
+    merge_candles,
+    new_date,
+    new_price,
+    new_symbol,
 )
 
+if TYPE_CHECKING:
+    from . import indicators, synthetic
+    from .actions import AdjustedColumns, CorporateActions
+    from .adapters import (
+        dump_candles_json,
+        dump_securities_json,
+        validate_candles_json,
+        validate_search_results_json,
+        validate_securities_json,
+    )
+    from .bulk import (
+        RowError,
+        SecurityBatch,
+        SecurityTable,
+        load_securities,
+        validate_securities,
+    )
+    from .cache import PriceCache, PriceCachingDataSource
+    from .calendars import TradingCalendar, get_calendar
+    from .cassette import Cassette, CassetteMiss, RecordingDataSource, ReplayDataSource
+    from .cli_batch import BatchArgs, BatchResult, run_batch, run_batch_cli
+    from .columns import FieldStorage, OHLCVColumns, StoragePolicy
+    from .composite import CompositeDataSource, merge_search_results
+    from .fx import FXConverter
+    from .ingest import iter_columns, iter_histories, read_columns, read_history
+    from .metrics import (
+        CallEvent,
+        InMemorySink,
+        InstrumentedDataSource,
+        LoggingSink,
+        MetricsSink,
+        PrometheusSink,
+    )
+    from .panel import HistoryPanel
+    from .parallel import histories_to_pandas, map_columns, write_parquet
+    from .quality import (
+        IssueKind,
+        QualityIssue,
+        QualityReport,
+        scan_histories,
+        scan_history,
+        scan_panel,
+    )
+    from .ratelimit import RateLimit, RateLimitedDataSource, RetryPolicy, TokenBucket
+    from .registry import (
+        HistoryBatch,
+        HistoryRecord,
+        SecurityRegistry,
+        dump_histories_json,
+        load_histories_json,
+    )
+    from .server import DataSourceServer, RemoteDataSource, serve
+    from .symbols import (
+        ParsedSymbol,
+        SymbolFormat,
+        normalize_exchange,
+        parse_symbol,
+        render_symbol,
+        translate_symbol,
+        translate_symbols,
+    )
+    from .wire import RemoteError
+    from .wrappers import DataSourceWrapper
+
+# Names from the optional-feature modules, imported on first access so that
+# `import pydantic_market_data` only pays for the core models
+_LAZY = {
+    "AdjustedColumns": "actions",
+    "CorporateActions": "actions",
+    "dump_candles_json": "adapters",
+    "dump_securities_json": "adapters",
+    "validate_candles_json": "adapters",
+    "validate_search_results_json": "adapters",
+    "validate_securities_json": "adapters",
+    "RowError": "bulk",
+    "SecurityBatch": "bulk",
+    "SecurityTable": "bulk",
+    "load_securities": "bulk",
+    "validate_securities": "bulk",
+    "PriceCache": "cache",
+    "PriceCachingDataSource": "cache",
+    "TradingCalendar": "calendars",
+    "get_calendar": "calendars",
+    "Cassette": "cassette",
+    "CassetteMiss": "cassette",
+    "RecordingDataSource": "cassette",
+    "ReplayDataSource": "cassette",
+    "BatchArgs": "cli_batch",
+    "BatchResult": "cli_batch",
+    "run_batch": "cli_batch",
+    "run_batch_cli": "cli_batch",
+    "FieldStorage": "columns",
+    "OHLCVColumns": "columns",
+    "StoragePolicy": "columns",
+    "CompositeDataSource": "composite",
+    "merge_search_results": "composite",
+    "FXConverter": "fx",
+    "iter_columns": "ingest",
+    "iter_histories": "ingest",
+    "read_columns": "ingest",
+    "read_history": "ingest",
+    "CallEvent": "metrics",
+    "InMemorySink": "metrics",
+    "InstrumentedDataSource": "metrics",
+    "LoggingSink": "metrics",
+    "MetricsSink": "metrics",
+    "PrometheusSink": "metrics",
+    "HistoryPanel": "panel",
+    "histories_to_pandas": "parallel",
+    "map_columns": "parallel",
+    "write_parquet": "parallel",
+    "IssueKind": "quality",
+    "QualityIssue": "quality",
+    "QualityReport": "quality",
+    "scan_histories": "quality",
+    "scan_history": "quality",
+    "scan_panel": "quality",
+    "RateLimit": "ratelimit",
+    "RateLimitedDataSource": "ratelimit",
+    "RetryPolicy": "ratelimit",
+    "TokenBucket": "ratelimit",
+    "HistoryBatch": "registry",
+    "HistoryRecord": "registry",
+    "SecurityRegistry": "registry",
+    "dump_histories_json": "registry",
+    "load_histories_json": "registry",
+    "DataSourceServer": "server",
+    "RemoteDataSource": "server",
+    "serve": "server",
+    "ParsedSymbol": "symbols",
+    "SymbolFormat": "symbols",
+    "normalize_exchange": "symbols",
+    "parse_symbol": "symbols",
+    "render_symbol": "symbols",
+    "translate_symbol": "symbols",
+    "translate_symbols": "symbols",
+    "RemoteError": "wire",
+    "DataSourceWrapper": "wrappers",
+}
+_SUBMODULES = {"indicators", "synthetic"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return import_module(f".{name}", __name__)
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_LAZY[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
+
 __all__ = [
     "Symbol",
     "Security",
@@ -78,4 +242,82 @@ __all__ = [
     "SearchArgs",
     "HistoryArgs",
     "PatchedCliSettingsSource",
+    "DataSourceWrapper",
+    "RateLimit",
+    "RetryPolicy",
+    "TokenBucket",
+    "RateLimitedDataSource",
+    "CompositeDataSource",
+    "merge_search_results",
+    "CallEvent",
+    "MetricsSink",
+    "InMemorySink",
+    "LoggingSink",
+    "PrometheusSink",
+    "InstrumentedDataSource",
+    "RowError",
+    "SecurityBatch",
+    "SecurityTable",
+    "load_securities",
+    "validate_securities",
+    "OHLCVColumns",
+    "HistoryPanel",
+    "indicators",
+    "MergePolicy",
+    "merge_candles",
+    "IssueKind",
+    "QualityIssue",
+    "QualityReport",
+    "scan_history",
+    "scan_panel",
+    "scan_histories",
+    "TradingCalendar",
+    "get_calendar",
+    "histories_to_pandas",
+    "map_columns",
+    "write_parquet",
+    "PriceCache",
+    "PriceCachingDataSource",
+    "FieldStorage",
+    "StoragePolicy",
+    "validate_candles_json",
+    "validate_securities_json",
+    "validate_search_results_json",
+    "dump_candles_json",
+    "dump_securities_json",
+    "SecurityRegistry",
+    "HistoryBatch",
+    "HistoryRecord",
+    "dump_histories_json",
+    "load_histories_json",
+    "BatchArgs",
+    "BatchResult",
+    "run_batch",
+    "run_batch_cli",
+    "DataSourceServer",
+    "RemoteDataSource",
+    "RemoteError",
+    "serve",
+    "Cassette",
+    "CassetteMiss",
+    "RecordingDataSource",
+    "ReplayDataSource",
+    "synthetic",
+    "CorporateActions",
+    "AdjustedColumns",
+    "FXConverter",
+    "new_price",
+    "new_symbol",
+    "new_date",
+    "ParsedSymbol",
+    "SymbolFormat",
+    "normalize_exchange",
+    "parse_symbol",
+    "render_symbol",
+    "translate_symbol",
+    "translate_symbols",
+    "read_columns",
+    "read_history",
+    "iter_columns",
+    "iter_histories",
 ]
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, Field, PositiveFloat
+
+from .columns import OHLCVColumns
+from .models import FlexibleDate, _construct
+
+if TYPE_CHECKING:
+    from .models import History
+
+_PRICES = ("open", "high", "low", "close")
+
+
+class CorporateActions(BaseModel):
+    """
+    Splits and cash dividends of one security, keyed by ex-date.
+
+    A split maps to its ratio of new to old shares (4.0 for a 4-for-1 split, 0.1
+    for a 1-for-10 reverse split). A dividend maps to the cash amount per share,
+    in the share basis of its ex-date (i.e. not adjusted for later splits).
+    """
+
+    splits: dict[FlexibleDate, PositiveFloat] = Field(default_factory=dict)
+    dividends: dict[FlexibleDate, PositiveFloat] = Field(default_factory=dict)
+
+
+def _days(index: pd.DatetimeIndex) -> np.ndarray:
+    """Calendar day of each timestamp (local wall-clock day for tz-aware indexes)."""
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return np.asarray(index.values.astype("datetime64[D]"))
+
+
+def _dates(days: dict[date, float]) -> np.ndarray:
+    return np.array(list(days), dtype="datetime64[D]").reshape(-1)
+
+
+class AdjustedColumns:
+    """
+    Raw candles with their split/dividend adjustment, kept side by side.
+
+    Each action contributes a factor to every candle before its ex-date: `1 / ratio`
+    for splits, and `1 - amount / previous close` for dividends, using the last raw
+    close before the ex-date. Factors are accumulated in a single backward
+    (suffix) product over the actions sorted by date, then looked up for all
+    candles at once. Prices are multiplied by the combined factor and volumes
+    divided by the split factor. The adjusted columns are computed on first use
+    and cached alongside the raw ones.
+    """
+
+    def __init__(self, raw: OHLCVColumns, actions: CorporateActions, dividends: bool = True):
+        self.raw = raw
+        self.actions = actions
+        self.dividends = dividends
+        days = _days(raw.index)
+
+        split_days = _dates(actions.splits)
+        split_factors = 1.0 / np.array(list(actions.splits.values()), dtype=np.float64)
+        if dividends and actions.dividends:
+            dividend_days = _dates(actions.dividends)
+            amounts = np.array(list(actions.dividends.values()), dtype=np.float64)
+            dividend_factors = 1.0 - amounts / self._previous_close(days, dividend_days)
+            if (dividend_factors <= 0).any():
+                bad = dividend_days[dividend_factors <= 0][0]
+                raise ValueError(f"Dividend on {bad} is not below the previous close")
+        else:
+            dividend_days = np.array([], dtype="datetime64[D]")
+            dividend_factors = np.array([], dtype=np.float64)
+
+        self._action_days, self._price_suffix = self._suffix(
+            np.concatenate([split_days, dividend_days]),
+            np.concatenate([split_factors, dividend_factors]),
+        )
+        self._split_days, self._split_suffix = self._suffix(split_days, split_factors)
+        self.price_factor = self._lookup(self._action_days, self._price_suffix, days)
+        self.volume_factor = 1.0 / self._lookup(self._split_days, self._split_suffix, days)
+
+    def _previous_close(self, days: np.ndarray, ex_days: np.ndarray) -> np.ndarray:
+        """Last non-missing raw close strictly before each ex-date (NaN when there is none)."""
+        order = np.argsort(days, kind="stable")
+        close = self.raw["close"][order]
+        valid = ~np.isnan(close)
+        sorted_days = days[order][valid]
+        close = close[valid]
+        before = np.searchsorted(sorted_days, ex_days, side="left") - 1
+        return np.where(before >= 0, close[np.maximum(before, 0)], np.nan)
+
+    @staticmethod
+    def _suffix(days: np.ndarray, factors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # Dividends before the first candle have no previous close and no effect
+        keep = ~np.isnan(factors)
+        days, factors = days[keep], factors[keep]
+        order = np.argsort(days, kind="stable")
+        days, factors = days[order], factors[order]
+        # suffix[k] = product of factors[k:], with a trailing 1 for "no later action"
+        suffix = np.append(np.cumprod(factors[::-1])[::-1], 1.0)
+        return days, suffix
+
+    @staticmethod
+    def _lookup(days: np.ndarray, suffix: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        # The first action strictly after each target day starts its suffix product
+        return np.asarray(suffix[np.searchsorted(days, targets, side="right")])
+
+    @cached_property
+    def adjusted(self) -> OHLCVColumns:
+        data = {f: self.raw[f] * self.price_factor for f in _PRICES}
+        data["volume"] = self.raw["volume"] * self.volume_factor
+        # Plain float64: adjusted prices rarely fit the raw data's fixed-point storage
+        return OHLCVColumns(self.raw.index, data)
+
+    @cached_property
+    def changed(self) -> np.ndarray:
+        """Positions of candles the actions affect (those before the last ex-date)."""
+        return np.flatnonzero((self.price_factor != 1.0) | (self.volume_factor != 1.0))
+
+    def factor_on(self, day: date | datetime) -> float:
+        """Price adjustment factor applying to a trade on `day`."""
+        target = np.array([day.date() if isinstance(day, datetime) else day], "datetime64[D]")
+        return float(self._lookup(self._action_days, self._price_suffix, target)[0])
+
+    def to_adjusted(self, day: date | datetime, price: float) -> float:
+        """A raw price traded on `day`, expressed in today's adjusted terms."""
+        return price * self.factor_on(day)
+
+    def to_raw(self, day: date | datetime, price: float) -> float:
+        """An adjusted price for `day`, converted back to what actually traded."""
+        return price / self.factor_on(day)
+
+
+def adjust_history(history: History, actions: CorporateActions, dividends: bool = True) -> History:
+    """
+    `history` with split (and optionally dividend) adjusted candles.
+
+    Candles on or after the last ex-date are unaffected and reused as they are;
+    only the others are rebuilt.
+    """
+    adjusted = AdjustedColumns(history.to_columns(), actions, dividends)
+    changed = adjusted.changed
+    candles = list(history.candles)
+    for i, candle in zip(
+        changed.tolist(), adjusted.adjusted.take(changed).to_candles(), strict=True
+    ):
+        candles[i] = candle
+    return _construct(
+        type(history), {"security": history.security, "candles": candles}, {"security", "candles"}
+    )
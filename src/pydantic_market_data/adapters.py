@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from pydantic import TypeAdapter
+
+from .models import OHLCV, SearchResult, Security
+
+# Built once at import: constructing a TypeAdapter compiles its pydantic-core
+# validator, which is far more expensive than a single validation call.
+CANDLES_ADAPTER: TypeAdapter[list[OHLCV]] = TypeAdapter(list[OHLCV])
+SECURITIES_ADAPTER: TypeAdapter[list[Security]] = TypeAdapter(list[Security])
+SEARCH_RESULTS_ADAPTER: TypeAdapter[list[SearchResult]] = TypeAdapter(list[SearchResult])
+
+
+def validate_candles_json(data: bytes | str) -> list[OHLCV]:
+    """
+    Validates a JSON array of candles straight from bytes.
+
+    pydantic-core parses the JSON itself, so no intermediate Python dicts are built.
+    """
+    return CANDLES_ADAPTER.validate_json(data)
+
+
+def validate_securities_json(data: bytes | str) -> list[Security]:
+    """Validates a JSON array of securities straight from bytes."""
+    return SECURITIES_ADAPTER.validate_json(data)
+
+
+def validate_search_results_json(data: bytes | str) -> list[SearchResult]:
+    """Validates a JSON array of search results straight from bytes."""
+    return SEARCH_RESULTS_ADAPTER.validate_json(data)
+
+
+def dump_candles_json(candles: list[OHLCV]) -> bytes:
+    return CANDLES_ADAPTER.dump_json(candles)
+
+
+def dump_securities_json(securities: list[Security]) -> bytes:
+    return SECURITIES_ADAPTER.dump_json(securities)
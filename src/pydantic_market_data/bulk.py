@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+from .models import (
+    _FIGI_RESERVED,
+    Country,
+    CurrencyCode,
+    Security,
+    Symbol,
+    _construct,
+    validate_country_code,
+)
+
+_ISIN_JUNK = {"", "-", "NONE"}  # Same junk values as clean_isin
+
+# Column validators return (cleaned values, error messages) for an array of unique values
+ColumnValidator = Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]]
+
+
+class RowError(BaseModel):
+    """
+    A source row rejected by `load_securities`.
+    """
+
+    row: int
+    field: str
+    message: str
+
+
+class SecurityTable(BaseModel):
+    """
+    Validated security master in columnar form, one column per `Security` field.
+
+    Values are plain normalized strings (alpha-2 country, ISO currency, upper-case
+    ISIN/FIGI), indexed by source row number. Rejected rows are listed in `errors`.
+    """
+
+    frame: pd.DataFrame
+    errors: list[RowError]
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class SecurityBatch(BaseModel):
+    """
+    Result of a bulk load: valid securities with their source row numbers, plus rejects.
+    """
+
+    securities: list[Security]
+    rows: list[int]
+    errors: list[RowError]
+
+
+_UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_DIGITS = "0123456789"
+_FIGI_BODY = "BCDFGHJKLMNPQRSTVWXYZ" + _DIGITS  # Consonants and digits
+
+
+def _position_table(*classes: str) -> np.ndarray:
+    """(width, 128) lookup of the ASCII characters allowed at each position."""
+    table = np.zeros((len(classes), 128), dtype=bool)
+    for pos, allowed in enumerate(classes):
+        table[pos, [ord(ch) for ch in allowed]] = True
+    return table
+
+
+# Positional equivalents of _ISIN_PATTERN and _FIGI_PATTERN
+_ISIN_TABLE = _position_table(*[_UPPER] * 2, *[_UPPER + _DIGITS] * 9, _DIGITS)
+_FIGI_TABLE = _position_table(*[_UPPER] * 2, "G", *[_FIGI_BODY] * 8, _DIGITS)
+
+
+def _codepoints(codes: list[str], width: int) -> np.ndarray:
+    """(n, width) array of code points for strings of exactly `width` characters."""
+    return np.array(codes, dtype=f"<U{width}").view(np.uint32).reshape(-1, width)
+
+
+def _char_values(points: np.ndarray) -> np.ndarray:
+    """Maps [0-9A-Z] code points to the values 0-35 used by ISIN and FIGI checksums."""
+    values = points.astype(np.int16)
+    return np.where(values <= ord("9"), values - ord("0"), values - ord("A") + 10)
+
+
+def _luhn_digit(digits: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    doubled = digits * 2
+    doubled = np.where(doubled > 9, doubled - 9, doubled)
+    return np.where(positions % 2 == 1, doubled, digits)
+
+
+def _isin_luhn_totals(points: np.ndarray) -> np.ndarray:
+    # Letters expand to two digits (A=10 ... Z=35), so each character's distance from
+    # the right end of the digit string is the reversed cumulative sum of the widths.
+    values = _char_values(points)
+    widths = 1 + (values >= 10)
+    right = np.cumsum(widths[:, ::-1], axis=1)[:, ::-1] - widths
+    total = _luhn_digit(values % 10, right) + np.where(
+        values >= 10, _luhn_digit(values // 10, right + 1), 0
+    )
+    return np.asarray(total.sum(axis=1))
+
+
+def _isin_checksums(points: np.ndarray) -> np.ndarray:
+    return np.asarray(_isin_luhn_totals(points) % 10 == 0)
+
+
+def _figi_expected_digits(points: np.ndarray) -> np.ndarray:
+    """Check digit each FIGI should end with, computed from its first 11 characters."""
+    values = _char_values(points[:, :11])
+    weights = np.where(np.arange(11)[::-1] % 2 == 1, 2, 1)
+    weighted = values * weights
+    total = (weighted % 10 + weighted // 10).sum(axis=1)
+    return np.asarray((10 - total % 10) % 10)
+
+
+def _figi_check_digits(points: np.ndarray) -> np.ndarray:
+    return np.asarray(_figi_expected_digits(points) == _char_values(points[:, 11]))
+
+
+def isin_checksums_ok(isins: list[str]) -> np.ndarray:
+    """Vectorized ISIN Luhn check for well-formed 12-character ISINs."""
+    return _isin_checksums(_codepoints(isins, 12))
+
+
+def figi_check_digits_ok(figis: list[str]) -> np.ndarray:
+    """Vectorized FIGI check digit test for well-formed 12-character FIGIs."""
+    return _figi_check_digits(_codepoints(figis, 12))
+
+
+def _is_str(values: np.ndarray) -> np.ndarray:
+    return np.fromiter((isinstance(v, str) for v in values), dtype=bool, count=len(values))
+
+
+def _identifiers(
+    values: np.ndarray,
+    label: str,
+    table: np.ndarray,
+    junk: set[str],
+    checksum: Callable[[np.ndarray], np.ndarray],
+    checksum_error: str,
+    reserved: set[str] | frozenset[str] = frozenset(),
+) -> tuple[np.ndarray, np.ndarray]:
+    cleaned = np.full(len(values), None, dtype=object)
+    errors = np.full(len(values), None, dtype=object)
+    texts: list[str] = []
+    rows: list[int] = []
+    for i, raw in enumerate(values):
+        if not isinstance(raw, str):
+            errors[i] = f"Invalid {label} format: {raw}"
+            continue
+        v = raw.strip().upper()
+        if v in junk:
+            continue
+        if len(v) != table.shape[0]:
+            errors[i] = f"Invalid {label} format: {v}"
+            continue
+        texts.append(v)
+        rows.append(i)
+    if not rows:
+        return cleaned, errors
+
+    index = np.asarray(rows, dtype=np.intp)
+    points = _codepoints(texts, table.shape[0])
+    ascii_ok = (points < 128).all(axis=1)
+    positions = np.arange(table.shape[0])
+    matched = ascii_ok & table[positions, np.where(points < 128, points, 0)].all(axis=1)
+    failed = np.flatnonzero(~matched)
+    if reserved:
+        prefixes = np.array([t[:2] for t in texts], dtype=object)
+        blocked = matched & np.isin(prefixes, list(reserved))
+        for j in np.flatnonzero(blocked):
+            errors[index[j]] = f"Invalid {label} prefix: {prefixes[j]}"
+        matched &= ~blocked
+    for j in failed:
+        errors[index[j]] = f"Invalid {label} format: {texts[j]}"
+
+    checked = np.flatnonzero(matched)
+    ok = checksum(points[checked])
+    for j in checked[~ok]:
+        errors[index[j]] = f"{checksum_error}: {texts[j]}"
+    cleaned[index[checked[ok]]] = np.array(texts, dtype=object)[checked[ok]]
+    return cleaned, errors
+
+
+def _isins(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    return _identifiers(
+        values, "ISIN", _ISIN_TABLE, _ISIN_JUNK, _isin_checksums, "Invalid ISIN checksum"
+    )
+
+
+def _figis(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    return _identifiers(
+        values,
+        "FIGI",
+        _FIGI_TABLE,
+        {""},
+        _figi_check_digits,
+        "Invalid FIGI check digit",
+        reserved=_FIGI_RESERVED,
+    )
+
+
+def _each(convert: Callable[[Any], Any]) -> ColumnValidator:
+    def validator(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        cleaned = np.full(len(values), None, dtype=object)
+        errors = np.full(len(values), None, dtype=object)
+        for i, v in enumerate(values):
+            try:
+                cleaned[i] = convert(v)
+            except ValidationError as e:
+                errors[i] = e.errors()[0]["msg"]
+            except (ValueError, TypeError) as e:
+                errors[i] = str(e)
+        return cleaned, errors
+
+    return validator
+
+
+def _strings(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    is_str = _is_str(values)
+    cleaned = values.copy()
+    cleaned[~is_str] = None
+    errors = np.full(len(values), None, dtype=object)
+    for i in np.flatnonzero(~is_str):
+        errors[i] = f"Input should be a valid string: {values[i]!r}"
+    return cleaned, errors
+
+
+_VALIDATORS: dict[str, ColumnValidator] = {
+    "symbol": _strings,
+    "name": _strings,
+    "exchange": _strings,
+    "country": _each(lambda v: str(Country.model_validate(validate_country_code(v)))),
+    "currency": _each(lambda v: str(CurrencyCode.model_validate(v))),
+    "asset_class": _strings,
+    "isin": _isins,
+    "figi": _figis,
+}
+_REQUIRED = {"symbol", "name"}
+
+
+# Builds one value object per distinct value. Country and CurrencyCode go through
+# pydantic so their roots are CountryAlpha2 / Currency, as with Security.model_validate;
+# trusted rows skip `_validate`, so country names are still mapped to codes here
+_VALUE_OBJECTS: dict[str, Callable[[Any], Any]] = {
+    "symbol": lambda v: _construct(Symbol, {"root": v}, {"root"}),
+    "country": lambda v: Country.model_validate(validate_country_code(v)),
+    "currency": CurrencyCode.model_validate,
+}
+
+
+def _columns(
+    rows: pd.DataFrame | Iterable[Mapping[str, Any]],
+) -> tuple[dict[str, np.ndarray], set[str]]:
+    frame = rows if isinstance(rows, pd.DataFrame) else pd.DataFrame.from_records(list(rows))
+    n = len(frame)
+    columns = {}
+    for name in Security.model_fields:
+        if name in frame.columns:
+            # A copy: to_numpy may return a read-only view or share the caller's data
+            values = np.array(frame[name].to_numpy(dtype=object), copy=True)
+            values[pd.isna(values)] = None
+            columns[name] = values
+        else:
+            columns[name] = np.full(n, None, dtype=object)
+    return columns, set(frame.columns) & set(columns)
+
+
+def _validate_column(
+    name: str, values: np.ndarray, validator: ColumnValidator
+) -> tuple[np.ndarray, np.ndarray]:
+    # Validate each distinct value once: country/currency columns repeat heavily
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    cleaned, errors = validator(np.asarray(uniques, dtype=object))
+    # The extra trailing slot is what missing values (code -1) map to
+    cleaned = np.concatenate([cleaned, np.full(1, None, dtype=object)])
+    errors = np.concatenate([errors, np.full(1, None, dtype=object)])
+    if name in _REQUIRED:
+        errors[-1] = "Field required"
+    return cleaned[codes], errors[codes]
+
+
+def _validate(columns: dict[str, np.ndarray]) -> tuple[np.ndarray, list[RowError]]:
+    """Cleans `columns` in place. Returns the valid row numbers and the row errors."""
+    valid = np.ones(len(columns["symbol"]), dtype=bool)
+    found: list[tuple[int, int, str, str]] = []
+    for order, (name, validator) in enumerate(_VALIDATORS.items()):
+        columns[name], messages = _validate_column(name, columns[name], validator)
+        failed = pd.notna(messages)
+        for row in np.flatnonzero(failed):
+            found.append((int(row), order, name, messages[row]))
+        valid &= ~failed
+    found.sort()
+    errors = [RowError(row=row, field=name, message=msg) for row, _, name, msg in found]
+    return np.flatnonzero(valid), errors
+
+
+def validate_securities(rows: pd.DataFrame | Iterable[Mapping[str, Any]]) -> SecurityTable:
+    """
+    Validates a security master column by column without building model instances.
+
+    Each distinct value is checked once (country and currency columns repeat heavily)
+    and ISIN/FIGI checksums are computed vectorized. Rows failing any check are left
+    out of the table and reported in `errors`, using the model validators' messages.
+    """
+    columns, _ = _columns(rows)
+    rows_ok, errors = _validate(columns)
+    frame = pd.DataFrame({name: values[rows_ok] for name, values in columns.items()}, index=rows_ok)
+    return SecurityTable(frame=frame, errors=errors)
+
+
+def _build(columns: dict[str, np.ndarray], provided: set[str]) -> list[Security]:
+    for name, wrap in _VALUE_OBJECTS.items():
+        # One value object per distinct value, shared by every row that uses it
+        codes, uniques = pd.factorize(columns[name], use_na_sentinel=True)
+        wrapped = np.full(len(uniques) + 1, None, dtype=object)
+        for i, v in enumerate(uniques):
+            wrapped[i] = wrap(v)
+        columns[name] = wrapped[codes]
+    fields = list(Security.model_fields)
+    values = [columns[name].tolist() for name in fields]
+    # Fields count as set when their column was provided, as with model_construct
+    return [
+        _construct(Security, dict(zip(fields, row, strict=True)), set(provided))
+        for row in zip(*values, strict=True)
+    ]
+
+
+def load_securities(
+    rows: pd.DataFrame | Iterable[Mapping[str, Any]], trusted: bool = False
+) -> SecurityBatch:
+    """
+    Builds many securities at once from a DataFrame or an iterable of row mappings.
+
+    Rows are checked with `validate_securities` and the survivors are assembled
+    without going through pydantic again. With `trusted=True` all checks are skipped,
+    for data that was validated before it was stored.
+    """
+    columns, provided = _columns(rows)
+    if trusted:
+        rows_ok = np.arange(len(columns["symbol"]))
+        errors: list[RowError] = []
+    else:
+        rows_ok, errors = _validate(columns)
+        columns = {name: values[rows_ok] for name, values in columns.items()}
+    return SecurityBatch.model_construct(
+        securities=_build(columns, provided), rows=rows_ok.tolist(), errors=errors
+    )
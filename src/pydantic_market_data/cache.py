@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future
+from datetime import date, datetime
+from typing import Any
+
+from .interfaces import DataSource
+from .metrics import MetricsSink
+from .models import History, Price, Symbol, new_price
+from .wrappers import DataSourceWrapper
+
+PriceKey = tuple[str, date]
+
+# Cached stand-in for "the source has no price", so misses are not re-fetched
+_NO_PRICE = object()
+
+
+def price_key(symbol: Symbol.Input, day: date) -> PriceKey:
+    return str(symbol), day.date() if isinstance(day, datetime) else day
+
+
+class PriceCache:
+    """
+    Concurrent map of (symbol, date) to Price, split into independently locked stripes.
+
+    Reads of cached entries take no lock (a dict lookup is atomic); writers only lock
+    the stripe owning the key, so threads working on different symbols do not
+    contend. `None` results are cached too, optionally for `negative_ttl` seconds.
+    """
+
+    def __init__(
+        self,
+        stripes: int = 64,
+        negative_ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if stripes < 1:
+            raise ValueError(f"stripes must be positive: {stripes}")
+        self.negative_ttl = negative_ttl
+        self._clock = clock
+        self._maps: list[dict[PriceKey, Any]] = [{} for _ in range(stripes)]
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        # Keys being fetched right now, so concurrent misses share one source call
+        self._pending: list[dict[PriceKey, Future[Price | None]]] = [{} for _ in range(stripes)]
+
+    def _stripe(self, key: PriceKey) -> int:
+        return hash(key) % len(self._maps)
+
+    def _fresh(self, entry: Any) -> bool:
+        if isinstance(entry, tuple):  # (_NO_PRICE, expires_at)
+            return bool(self._clock() < entry[1])
+        return True
+
+    @staticmethod
+    def _unwrap(entry: Any) -> Price | None:
+        if entry is _NO_PRICE or isinstance(entry, tuple):
+            return None
+        return entry  # type: ignore[no-any-return]
+
+    def lookup(self, key: PriceKey) -> tuple[bool, Price | None]:
+        """(found, price); found is True for cached negative results as well."""
+        entry = self._maps[self._stripe(key)].get(key)
+        if entry is None or not self._fresh(entry):
+            return False, None
+        return True, self._unwrap(entry)
+
+    def get(self, symbol: Symbol.Input, day: date) -> Price | None:
+        return self.lookup(price_key(symbol, day))[1]
+
+    def _entry(self, price: Price | None) -> Any:
+        if price is not None:
+            return price
+        if self.negative_ttl is None:
+            return _NO_PRICE
+        return (_NO_PRICE, self._clock() + self.negative_ttl)
+
+    def put(self, symbol: Symbol.Input, day: date, price: Price | None) -> None:
+        key = price_key(symbol, day)
+        i = self._stripe(key)
+        with self._locks[i]:
+            self._maps[i][key] = self._entry(price)
+
+    def get_or_fetch(
+        self, key: PriceKey, fetch: Callable[[], Price | None]
+    ) -> tuple[bool, Price | None]:
+        """
+        Cached price for `key`, calling `fetch` on a miss. Returns (hit, price).
+
+        Concurrent misses for the same key wait for a single `fetch`; the stripe
+        lock is never held while fetching.
+        """
+        found, price = self.lookup(key)
+        if found:
+            return True, price
+        i = self._stripe(key)
+        with self._locks[i]:
+            entry = self._maps[i].get(key)
+            if entry is not None and self._fresh(entry):
+                return True, self._unwrap(entry)
+            future = self._pending[i].get(key)
+            owner = future is None
+            if future is None:
+                future = self._pending[i][key] = Future()
+        if not owner:
+            return False, future.result()
+        try:
+            price = fetch()
+        except BaseException as e:
+            with self._locks[i]:
+                del self._pending[i][key]
+            future.set_exception(e)
+            raise
+        with self._locks[i]:
+            self._maps[i][key] = self._entry(price)
+            del self._pending[i][key]
+        future.set_result(price)
+        return False, price
+
+    def prefill(self, history: History, field: str = "close") -> int:
+        """
+        Stores the `field` of every candle as that day's price. Returns the count.
+
+        Entries are grouped by stripe so each lock is taken once.
+        """
+        symbol = str(history.security.symbol)
+        by_stripe: dict[int, dict[PriceKey, Price]] = {}
+        for candle in history.candles:
+            value = getattr(candle, field)
+            if value is None:
+                continue
+            key = price_key(symbol, candle.date)
+            by_stripe.setdefault(self._stripe(key), {})[key] = new_price(float(value))
+        for i, entries in by_stripe.items():
+            with self._locks[i]:
+                self._maps[i].update(entries)
+        return sum(len(entries) for entries in by_stripe.values())
+
+    def invalidate(self, symbols: Iterable[Symbol.Input] | None = None) -> None:
+        """Drops the given symbols, or everything when `symbols` is None."""
+        wanted = None if symbols is None else {str(s) for s in symbols}
+        for lock, entries in zip(self._locks, self._maps, strict=True):
+            with lock:
+                if wanted is None:
+                    entries.clear()
+                else:
+                    for key in [k for k in entries if k[0] in wanted]:
+                        del entries[key]
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._maps)
+
+
+class PriceCachingDataSource(DataSourceWrapper):
+    """
+    DataSource wrapper answering dated `get_price` calls from a shared PriceCache.
+
+    Calls without a date (the live price) and all other methods pass through.
+    Histories returned by `history()` prefill the cache when `prefill_history` is set.
+    """
+
+    def __init__(
+        self,
+        source: DataSource,
+        cache: PriceCache | None = None,
+        prefill_history: bool = False,
+        sink: MetricsSink | None = None,
+        name: str = "prices",
+    ):
+        super().__init__(source)
+        self.cache = cache if cache is not None else PriceCache()
+        self.prefill_history = prefill_history
+        self.sink = sink
+        self.name = name
+
+    def get_price(self, symbol: Symbol.Input, date: date | None = None) -> Price | None:
+        if date is None:
+            return super().get_price(symbol, date)
+        hit, price = self.cache.get_or_fetch(
+            price_key(symbol, date), lambda: self._call("get_price", symbol, date)
+        )
+        if self.sink is not None:
+            self.sink.record_cache(self.name, hit)
+        return price
+
+    def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        result = super()._call(method, *args, **kwargs)
+        if method == "history" and self.prefill_history:
+            self.cache.prefill(result)
+        return result
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from contextlib import suppress
+from datetime import date, datetime, timedelta
+from functools import cache
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+from .models import HistoryInterval, HistoryPeriod
+from .symbols import normalize_exchange
+
+# Years covered by the built-in holiday tables; HistoryPeriod.MAX starts at FIRST_YEAR
+FIRST_YEAR = 1970
+LAST_YEAR = 2099
+
+_MINUTES = {
+    HistoryInterval.IM1: 1,
+    HistoryInterval.IM2: 2,
+    HistoryInterval.IM5: 5,
+    HistoryInterval.IM15: 15,
+    HistoryInterval.IM30: 30,
+    HistoryInterval.IM60: 60,
+    HistoryInterval.IM90: 90,
+    HistoryInterval.H1: 60,
+}
+_MONTHS = {
+    HistoryPeriod.MO1: 1,
+    HistoryPeriod.MO3: 3,
+    HistoryPeriod.MO6: 6,
+    HistoryPeriod.Y1: 12,
+    HistoryPeriod.Y2: 24,
+    HistoryPeriod.Y5: 60,
+    HistoryPeriod.Y10: 120,
+}
+_SESSIONS = {HistoryPeriod.D1: 1, HistoryPeriod.D5: 5}
+
+
+class TradingCalendar:
+    """
+    Trading days and regular session hours of one exchange.
+
+    Holidays are a sorted datetime64[D] array wrapped in a `numpy.busdaycalendar`,
+    so session arithmetic over decades is vectorized. Early closes are not modelled.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        timezone: str,
+        open: timedelta,
+        close: timedelta,
+        holidays: Iterable[date] = (),
+        weekmask: str = "1111100",
+    ):
+        self.name = name
+        self.timezone = ZoneInfo(timezone)
+        self.open = open
+        self.close = close
+        self.holidays = np.unique(np.array(list(holidays), dtype="datetime64[D]"))
+        self.busdaycalendar = np.busdaycalendar(weekmask=weekmask, holidays=self.holidays)
+
+    def __repr__(self) -> str:
+        return f"TradingCalendar({self.name!r})"
+
+    def is_session(self, day: date) -> bool:
+        return bool(np.is_busday(np.datetime64(day, "D"), busdaycal=self.busdaycalendar))
+
+    def sessions(self, start: date, end: date) -> pd.DatetimeIndex:
+        """Trading days in [start, end] as a naive, midnight DatetimeIndex."""
+        days = np.arange(np.datetime64(start, "D"), np.datetime64(end, "D") + 1)
+        days = days[np.is_busday(days, busdaycal=self.busdaycalendar)]
+        return pd.DatetimeIndex(days.astype("datetime64[ns]"), name="Date")
+
+    def today(self) -> date:
+        return datetime.now(self.timezone).date()
+
+    def period_range(self, period: HistoryPeriod, end: date | None = None) -> tuple[date, date]:
+        """
+        First and last trading day covered by `period`, counting back from `end`.
+
+        `1d`/`5d` count sessions; month and year periods are calendar spans, `ytd`
+        starts on January 1st and `max` at the start of the holiday tables.
+        """
+        period = HistoryPeriod(period)
+        cal = self.busdaycalendar
+        end_day = np.busday_offset(
+            np.datetime64(end or self.today(), "D"), 0, roll="backward", busdaycal=cal
+        )
+        if period in _SESSIONS:
+            start_day = np.busday_offset(end_day, 1 - _SESSIONS[period], busdaycal=cal)
+        else:
+            if period in _MONTHS:
+                first = (
+                    pd.Timestamp(end_day)
+                    - pd.DateOffset(months=_MONTHS[period])
+                    + pd.Timedelta(days=1)
+                )
+            elif period is HistoryPeriod.YTD:
+                first = pd.Timestamp(pd.Timestamp(end_day).year, 1, 1)
+            else:
+                first = pd.Timestamp(FIRST_YEAR, 1, 1)
+            start_day = np.busday_offset(
+                np.datetime64(first.date(), "D"), 0, roll="forward", busdaycal=cal
+            )
+        return start_day.astype(date), end_day.astype(date)
+
+    def expected_index(
+        self, period: HistoryPeriod, interval: HistoryInterval, end: date | None = None
+    ) -> pd.DatetimeIndex:
+        """
+        Timestamps of every candle a complete history for `period` would contain.
+
+        Daily and longer intervals give naive midnight dates (the first session of
+        each week, month or quarter for `1wk`/`1mo`/`3mo`). Intraday intervals give
+        candle start times within regular hours, localized to the exchange timezone.
+        """
+        interval = HistoryInterval(interval)
+        days = self.sessions(*self.period_range(period, end))
+        if interval in _MINUTES:
+            step = timedelta(minutes=_MINUTES[interval])
+            count = -(-(self.close - self.open) // step)
+            offsets = np.timedelta64(self.open) + np.arange(count) * np.timedelta64(step)
+            wall = (days.values[:, None] + offsets[None, :]).ravel()
+            return pd.DatetimeIndex(wall, name="Date").tz_localize(self.timezone)
+        if interval is HistoryInterval.D1:
+            return days
+        if interval is HistoryInterval.D5:
+            return days[::5]
+        freq = {HistoryInterval.W1: "W", HistoryInterval.MO1: "M", HistoryInterval.MO3: "Q"}
+        buckets = days.to_period(freq[interval])
+        return days[np.r_[True, buckets[1:] != buckets[:-1]]] if len(days) else days
+
+    def missing(
+        self,
+        index: pd.DatetimeIndex,
+        period: HistoryPeriod,
+        interval: HistoryInterval,
+        end: date | None = None,
+    ) -> pd.DatetimeIndex:
+        """Expected timestamps for `period` that `index` (e.g. a cached history) lacks."""
+        return self.expected_index(period, interval, end).difference(index)
+
+
+def _easter(year: int) -> date:
+    """Western Easter Sunday (anonymous Gregorian algorithm)."""
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = divmod(b, 4)
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7  # noqa: E741
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """n-th (1-based, or -1 for last) given weekday of a month."""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _nearest_weekday(day: date) -> date:
+    """US observance: Saturday holidays move to Friday, Sunday ones to Monday."""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def _next_monday(day: date) -> date:
+    return day + timedelta(days=(7 - day.weekday()) % 7) if day.weekday() >= 5 else day
+
+
+def _nyse(year: int) -> list[date]:
+    new_year = date(year, 1, 1)
+    days = [
+        # No Friday substitute when New Year's Day falls on a Saturday
+        new_year + timedelta(days=1) if new_year.weekday() == 6 else new_year,
+        _nth_weekday(year, 2, 0, 3),
+        _easter(year) - timedelta(days=2),
+        _nth_weekday(year, 5, 0, -1),
+        _nearest_weekday(date(year, 7, 4)),
+        _nth_weekday(year, 9, 0, 1),
+        _nth_weekday(year, 11, 3, 4),
+        _nearest_weekday(date(year, 12, 25)),
+    ]
+    if year >= 1998:
+        days.append(_nth_weekday(year, 1, 0, 3))
+    if year >= 2022:
+        days.append(_nearest_weekday(date(year, 6, 19)))
+    return days
+
+
+def _lse(year: int) -> list[date]:
+    easter = _easter(year)
+    christmas, boxing = date(year, 12, 25), date(year, 12, 26)
+    if christmas.weekday() == 5:
+        christmas, boxing = christmas + timedelta(days=2), boxing + timedelta(days=2)
+    elif christmas.weekday() == 6:
+        christmas += timedelta(days=2)
+    elif boxing.weekday() == 5:
+        boxing += timedelta(days=2)
+    days = [
+        _next_monday(date(year, 1, 1)),
+        easter - timedelta(days=2),
+        easter + timedelta(days=1),
+        _nth_weekday(year, 5, 0, -1),
+        _nth_weekday(year, 8, 0, -1),
+        christmas,
+        boxing,
+    ]
+    if year >= 1978:
+        days.append(_nth_weekday(year, 5, 0, 1))
+    return days
+
+
+def _xetra(year: int) -> list[date]:
+    easter = _easter(year)
+    fixed = [(1, 1), (5, 1), (12, 24), (12, 25), (12, 26), (12, 31)]
+    return [
+        easter - timedelta(days=2),
+        easter + timedelta(days=1),
+        *(date(year, month, day) for month, day in fixed),
+    ]
+
+
+def _table(rule: Callable[[int], list[date]]) -> list[date]:
+    return [day for year in range(FIRST_YEAR, LAST_YEAR + 1) for day in rule(year)]
+
+
+_CALENDARS: dict[str, Callable[[], TradingCalendar]] = {
+    "NYSE": lambda: TradingCalendar(
+        "NYSE",
+        "America/New_York",
+        timedelta(hours=9, minutes=30),
+        timedelta(hours=16),
+        _table(_nyse),
+    ),
+    "LSE": lambda: TradingCalendar(
+        "LSE", "Europe/London", timedelta(hours=8), timedelta(hours=16, minutes=30), _table(_lse)
+    ),
+    "XETRA": lambda: TradingCalendar(
+        "XETRA",
+        "Europe/Berlin",
+        timedelta(hours=9),
+        timedelta(hours=17, minutes=30),
+        _table(_xetra),
+    ),
+    "WEEKDAYS": lambda: TradingCalendar("WEEKDAYS", "UTC", timedelta(0), timedelta(days=1)),
+}
+
+# Exchanges (as named by `normalize_exchange`) trading on another one's calendar
+_SHARED = {"US": "NYSE", "NASDAQ": "NYSE", "AMEX": "NYSE"}
+
+
+@cache
+def _calendar(key: str) -> TradingCalendar:
+    return _CALENDARS[key]()
+
+
+def get_calendar(exchange: str | None = None) -> TradingCalendar:
+    """
+    Calendar for an exchange name, MIC or code, built once and cached.
+
+    Exchanges are resolved with `symbols.normalize_exchange`. Unknown or missing
+    exchanges, and those without a holiday table, get a plain Monday-Friday
+    calendar without holidays.
+    """
+    key = (exchange or "WEEKDAYS").strip().upper()
+    with suppress(ValueError):
+        key = normalize_exchange(key)
+    key = _SHARED.get(key, key)
+    return _calendar(key if key in _CALENDARS else "WEEKDAYS")
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import random
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from typing import IO, Any, Literal
+
+from .interfaces import DataSource
+from .wire import METHODS, decode_error, encode_call, encode_error
+from .wrappers import DataSourceWrapper, _Dispatcher
+
+FORMAT = "pydantic-market-data-cassette"
+VERSION = 1
+
+CallKey = tuple[str, bytes]
+
+
+class CassetteMiss(LookupError):
+    """A replayed call that was never recorded."""
+
+
+class Cassette:
+    """
+    Recorded DataSource calls, in call order, stored as (gzipped) NDJSON.
+
+    The file starts with a header line, followed by one line per call holding the
+    method, its arguments, the JSON result or error and the time the call took.
+    Calls are matched on their canonical wire encoding (see `wire.encode_call`),
+    so `history("AAPL")` and `history(symbol="AAPL", period="1mo")` are the same call.
+    Repeated calls keep every recorded outcome, and replay returns them in order.
+    """
+
+    def __init__(self) -> None:
+        self._entries: list[dict[str, Any]] = []
+        self._index: dict[CallKey, list[int]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return iter(list(self._entries))
+
+    def add(self, method: str, args: bytes, outcome: dict[str, Any], elapsed: float) -> None:
+        """Appends a call; `outcome` is `{"result": ...}` or `{"error": ...}` in JSON form."""
+        entry = {"method": method, "args": json.loads(args), **outcome, "elapsed": elapsed}
+        with self._lock:
+            self._index.setdefault((method, args), []).append(len(self._entries))
+            self._entries.append(entry)
+
+    def outcomes(self, key: CallKey) -> list[dict[str, Any]]:
+        return [self._entries[i] for i in self._index.get(key, ())]
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Writes the cassette; paths ending in `.gz` are gzip-compressed."""
+        with self._lock:
+            entries = list(self._entries)
+        with _open(path, "wt") as f:
+            f.write(json.dumps({"format": FORMAT, "version": VERSION}) + "\n")
+            for entry in entries:
+                f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> Cassette:
+        cassette = cls()
+        with _open(path, "rt") as f:
+            header = json.loads(f.readline() or "{}")
+            if header.get("format") != FORMAT or header.get("version") != VERSION:
+                raise ValueError(f"Not a version {VERSION} cassette: {os.fspath(path)}")
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                method = entry["method"]
+                # Re-encode so hand-edited or older files still match canonical calls
+                args = encode_call(method, **entry["args"])
+                outcome = {k: entry[k] for k in ("result", "error") if k in entry}
+                cassette.add(method, args, outcome, float(entry.get("elapsed", 0.0)))
+        return cassette
+
+
+def _open(path: str | os.PathLike[str], mode: Literal["rt", "wt"]) -> IO[str]:
+    if os.fspath(path).endswith(".gz"):
+        return gzip.open(path, mode, encoding="utf-8")
+    return open(path, mode[0], encoding="utf-8")
+
+
+class RecordingDataSource(DataSourceWrapper):
+    """
+    DataSource wrapper recording every call, its result or error and its duration.
+
+    Errors are recorded and re-raised unchanged. Save the recording with
+    `recorder.cassette.save(path)`.
+    """
+
+    def __init__(self, source: DataSource, cassette: Cassette | None = None):
+        super().__init__(source)
+        self.cassette = cassette if cassette is not None else Cassette()
+
+    def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        key = encode_call(method, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            result = super()._call(method, *args, **kwargs)
+        except Exception as e:
+            error = json.loads(encode_error(e))
+            self.cassette.add(method, key, {"error": error}, time.perf_counter() - start)
+            raise
+        elapsed = time.perf_counter() - start
+        encoded = METHODS[method].result.dump_python(result, mode="json")
+        self.cassette.add(method, key, {"result": encoded}, elapsed)
+        return result
+
+
+Latency = float | Mapping[str, float] | Literal["recorded"]
+
+
+class ReplayDataSource(_Dispatcher):
+    """
+    DataSource serving the calls of a Cassette, with optional simulated latency.
+
+    `latency` is a delay in seconds for every call, a per-method mapping, or
+    `"recorded"` to reuse each call's recorded duration. `jitter` adds a uniform
+    random offset in `[-jitter, +jitter]` seconds (never below zero), drawn from a
+    generator seeded with `seed` so runs are reproducible. A call recorded several
+    times replays its outcomes in order, then keeps returning the last one; a call
+    that was never recorded raises CassetteMiss. Every call returns new objects.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette | str | os.PathLike[str],
+        latency: Latency = 0.0,
+        jitter: float = 0.0,
+        seed: int | None = 0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.cassette = cassette if isinstance(cassette, Cassette) else Cassette.load(cassette)
+        self.latency = latency
+        self.jitter = jitter
+        self._random = random.Random(seed)
+        self._sleep = sleep
+        self._positions: dict[CallKey, int] = {}
+        self._lock = threading.Lock()
+
+    def _delay(self, method: str, entry: dict[str, Any]) -> float:
+        if self.latency == "recorded":
+            base = float(entry["elapsed"])
+        elif isinstance(self.latency, Mapping):
+            base = self.latency.get(method, 0.0)
+        else:
+            base = float(self.latency)
+        if self.jitter:
+            with self._lock:
+                base += self._random.uniform(-self.jitter, self.jitter)
+        return max(0.0, base)
+
+    def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        key = (method, encode_call(method, *args, **kwargs))
+        outcomes = self.cassette.outcomes(key)
+        if not outcomes:
+            raise CassetteMiss(f"No recorded {method} call for {key[1].decode()}")
+        with self._lock:
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+        entry = outcomes[min(position, len(outcomes) - 1)]
+        delay = self._delay(method, entry)
+        if delay:
+            self._sleep(delay)
+        if "error" in entry:
+            raise decode_error(json.dumps(entry["error"]))
+        return METHODS[method].result.validate_python(entry["result"])
+
+    def rewind(self) -> None:
+        """Restarts replay of repeated calls from their first recorded outcome."""
+        with self._lock:
+            self._positions.clear()
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import csv
+import json
+import sys
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Literal, TextIO
+
+from pydantic import BaseModel, Field, ValidationError
+
+from .cli_models import FORMAT, LIMIT, PATH, GlobalArgs, HistoryArgs, SearchArgs
+from .interfaces import DataSource
+from .models import PriceOnDate, Security, SecurityQuery, parse_date
+
+Command = Literal["search", "history"]
+
+_MODELS: dict[str, type[GlobalArgs]] = {"search": SearchArgs, "history": HistoryArgs}
+_OUTPUT_FORMATS = ("json", "text")
+
+
+class BatchArgs(GlobalArgs):
+    """Run many search or history queries from a file"""
+
+    command: Command = Field("search", description="Query type when rows have no 'command'")
+    input: PATH = Field(PATH("-"), description="CSV or NDJSON file of queries ('-' for stdin)")
+    input_format: FORMAT | None = Field(
+        None, description="Input format (csv, ndjson); guessed from the file extension"
+    )
+    workers: LIMIT = Field(LIMIT(8), description="Number of queries run concurrently")
+
+
+class BatchResult(BaseModel):
+    """Outcome of one input row; `line` is its 1-based position among the queries."""
+
+    line: int
+    command: Command
+    ok: bool
+    result: Any = None
+    error: str | None = None
+
+
+def _row_error(
+    error_type: str, value: Any, ctx: dict[str, Any] | None = None, loc: tuple[str, ...] = ()
+) -> ValidationError:
+    error: dict[str, Any] = {"type": error_type, "loc": loc, "input": value}
+    if ctx is not None:
+        error["ctx"] = ctx
+    return ValidationError.from_exception_data("BatchQuery", [error])  # type: ignore[list-item]
+
+
+def _json_row(line: str) -> dict[str, Any] | ValidationError:
+    try:
+        row = json.loads(line)
+    except json.JSONDecodeError as e:
+        return _row_error("json_invalid", line, {"error": str(e)})
+    return row if isinstance(row, dict) else _row_error("dict_type", row)
+
+
+def read_rows(
+    stream: Iterable[str], input_format: str
+) -> Iterator[dict[str, Any] | ValidationError]:
+    """
+    Raw query rows from CSV (header row of field names) or NDJSON.
+
+    Empty CSV cells and blank NDJSON lines are skipped; dashes in keys are read as
+    underscores, so both `asset-class` and `asset_class` work. An NDJSON line that
+    is not a JSON object yields a ValidationError in its place.
+    """
+    if input_format == "csv":
+        rows: Iterable[dict[str, Any] | ValidationError] = (
+            {k: v for k, v in row.items() if v not in ("", None)} for row in csv.DictReader(stream)
+        )
+    elif input_format == "ndjson":
+        rows = (_json_row(line) for line in stream if line.strip())
+    else:
+        raise ValueError(f"Unsupported input format: {input_format!r}")
+    for row in rows:
+        if isinstance(row, ValidationError):
+            yield row
+        else:
+            yield {str(k).replace("-", "_"): v for k, v in row.items()}
+
+
+def parse_queries(
+    rows: Iterable[dict[str, Any] | ValidationError], command: Command = "search"
+) -> Iterator[tuple[Command, SearchArgs | HistoryArgs | ValidationError]]:
+    """
+    Validates rows against SearchArgs/HistoryArgs, yielding errors instead of raising.
+
+    Unreadable rows (errors from `read_rows`) and rows with an unknown `command`
+    yield a validation error under the default command.
+    """
+    for row in rows:
+        if isinstance(row, ValidationError):
+            yield command, row
+            continue
+        row_command = row.pop("command", command)
+        if row_command not in _MODELS:
+            expected = " or ".join(map(repr, _MODELS))
+            yield (
+                command,
+                _row_error("literal_error", row_command, {"expected": expected}, ("command",)),
+            )
+            continue
+        try:
+            yield row_command, _MODELS[row_command].model_validate(row)  # type: ignore[misc]
+        except ValidationError as e:
+            yield row_command, e
+
+
+def _criteria(args: SearchArgs | HistoryArgs) -> SecurityQuery:
+    price_on = None
+    if args.date is not None and args.price is not None:
+        price_on = PriceOnDate(date=parse_date(args.date), price=args.price)
+    return SecurityQuery(
+        isin=args.isin,
+        symbol=args.symbol,
+        description=args.desc,
+        exchange=args.exchange,
+        currency=getattr(args, "currency", None),
+        asset_class=getattr(args, "asset_class", None),
+        price_on=price_on,
+    )
+
+
+def _search(source: DataSource, args: SearchArgs) -> list[dict[str, Any]]:
+    term = args.isin or args.symbol or args.desc
+    filters = (args.exchange, args.currency, args.country, args.asset_class, args.date)
+    if term is not None and all(f is None for f in filters):
+        found = source.search(term)[: args.limit]
+    else:
+        match = source.resolve(_criteria(args))
+        found = [match] if match is not None else []
+    return [s.model_dump(mode="json") for s in found]
+
+
+def _history(source: DataSource, args: HistoryArgs) -> dict[str, Any]:
+    symbol: str | None = args.symbol
+    if symbol is None:
+        match: Security | None = source.resolve(_criteria(args))
+        if match is None:
+            raise LookupError("No security matches the query")
+        symbol = str(match.symbol)
+    history = source.history(symbol, args.period)
+    result = history.model_dump(mode="json")
+    if args.date is not None and args.price is not None:
+        result["valid"] = source.validate(symbol, parse_date(args.date), args.price)
+    return result
+
+
+def _execute(source: DataSource, command: Command, args: SearchArgs | HistoryArgs) -> Any:
+    if command == "search":
+        return _search(source, args)  # type: ignore[arg-type]
+    return _history(source, args)  # type: ignore[arg-type]
+
+
+def run_batch(
+    source: DataSource,
+    queries: Iterable[tuple[Command, SearchArgs | HistoryArgs | ValidationError]],
+    workers: int = 8,
+) -> Iterator[BatchResult]:
+    """
+    Runs queries concurrently, yielding results in input order as they complete.
+
+    At most `2 * workers` queries are in flight, so arbitrarily long inputs are
+    streamed with bounded memory. A failing query produces an `ok=False` result.
+    """
+    pending: deque[tuple[int, Command, Future[Any] | ValidationError]] = deque()
+
+    def result(line: int, command: Command, outcome: Future[Any] | ValidationError) -> BatchResult:
+        if isinstance(outcome, ValidationError):
+            errors = "; ".join(
+                f"{'.'.join(map(str, e['loc']))}: {e['msg']}" if e["loc"] else e["msg"]
+                for e in outcome.errors()
+            )
+            return BatchResult(line=line, command=command, ok=False, error=errors)
+        try:
+            return BatchResult(line=line, command=command, ok=True, result=outcome.result())
+        except Exception as e:
+            return BatchResult(
+                line=line, command=command, ok=False, error=f"{type(e).__name__}: {e}"
+            )
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for line, (command, args) in enumerate(queries, start=1):
+            if isinstance(args, ValidationError):
+                pending.append((line, command, args))
+            else:
+                pending.append((line, command, pool.submit(_execute, source, command, args)))
+            # Emit finished queries at the head; block only when the window is full
+            while pending and (
+                len(pending) > 2 * workers
+                or not isinstance(pending[0][2], Future)
+                or pending[0][2].done()
+            ):
+                yield result(*pending.popleft())
+        while pending:
+            yield result(*pending.popleft())
+
+
+def format_result(result: BatchResult, output_format: str = "json") -> str:
+    """One output line: the result as JSON, or a tab-separated summary for `text`."""
+    if output_format == "json":
+        return result.model_dump_json(exclude_none=True)
+    if output_format == "text":
+        if not result.ok:
+            return f"{result.line}\t{result.command}\terror\t{result.error}"
+        if result.command == "search":
+            symbols = ",".join(s["symbol"] for s in result.result)
+            return f"{result.line}\tsearch\tok\t{symbols}"
+        summary = f"{result.result['security']['symbol']}\t{len(result.result['candles'])} candles"
+        if "valid" in result.result:
+            summary += f"\tvalid={result.result['valid']}"
+        return f"{result.line}\thistory\tok\t{summary}"
+    raise ValueError(f"Unsupported output format for batch mode: {output_format!r}")
+
+
+def run_batch_cli(
+    args: BatchArgs, source: DataSource, stdin: TextIO | None = None, stdout: TextIO | None = None
+) -> int:
+    """
+    Entry point for a `batch` subcommand: reads `args.input`, writes one line per query.
+
+    Returns the number of failed queries (usable as an exit status). An output
+    format batch mode cannot write raises ValueError before any query runs.
+    """
+    output_format = str(args.format)
+    if output_format not in _OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format for batch mode: {output_format!r}")
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    input_format = args.input_format or ("csv" if str(args.input).endswith(".csv") else "ndjson")
+    failures = 0
+
+    def emit(stream: Iterable[str]) -> None:
+        nonlocal failures
+        queries = parse_queries(read_rows(stream, input_format), args.command)
+        for result in run_batch(source, queries, args.workers):
+            failures += not result.ok
+            stdout.write(format_result(result, output_format) + "\n")
+            stdout.flush()
+
+    if args.input == "-":
+        emit(stdin)
+    else:
+        with open(args.input, newline="", encoding="utf-8") as f:
+            emit(f)
+    return failures
@@ -1,8 +1,8 @@
-import json
+import copy
 import re
 from argparse import Action, ArgumentParser
 from collections.abc import Callable
-from typing import Any
+from typing import Any, ClassVar
 
 from pydantic import BaseModel, Field, GetCoreSchemaHandler
 from pydantic.fields import FieldInfo
@@ -10,6 +10,7 @@ from pydantic_core import core_schema
 from pydantic_settings import CliSettingsSource, SettingsConfigDict
 
 from .models import Currency, HistoryPeriod
+from .schema_cache import cached_json_schema
 
 # Custom types for better CLI help labels (metavars)
 # We use classes instead of NewType because pydantic-settings uses __qualname__ for help text.
@@ -174,6 +175,31 @@ class HistoryArgs(GlobalArgs):
 class PatchedCliSettingsSource(CliSettingsSource):
     """Custom CLI settings source to refine help text and flags."""
 
+    _cache: ClassVar[dict[tuple[Any, ...], "PatchedCliSettingsSource"]] = {}
+
+    @classmethod
+    def cached(cls, settings_cls: type[Any], **kwargs: Any) -> "PatchedCliSettingsSource":
+        """
+        Source sharing one argparse parser per settings class and options.
+
+        Building the parser walks the whole model, so processes that parse several
+        command lines reuse it and call the source with `args=...`. Each call gets its
+        own shallow copy, since parsing rebinds `env_vars` and fills the unknown-args
+        map, so threads parsing at once don't see each other's values. Options that
+        are not hashable are built fresh every time.
+        """
+        try:
+            key = (cls, settings_cls, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            return cls(settings_cls, **kwargs)
+        shared = cls._cache.get(key)
+        if shared is None:
+            shared = cls._cache[key] = cls(settings_cls, **kwargs)
+        source = copy.copy(shared)
+        source._cli_unknown_args = dict(shared._cli_unknown_args)
+        return source
+
     def _help_format(
         self, field_name: str, field_info: FieldInfo, model_default: Any, is_model_suppressed: bool
     ) -> str:
@@ -199,7 +225,7 @@ class PatchedCliSettingsSource(CliSettingsSource):
                 super().__init__(*args, **akwargs, nargs=0)
 
             def __call__(self, parser, namespace, values, option_string=None):
-                print(json.dumps(model.model_json_schema(), indent=2))
+                print(cached_json_schema(model))
                 parser.exit()
 
         def patched_add_argument(parser: Any, *args: Any, **pkwargs: Any) -> Any:
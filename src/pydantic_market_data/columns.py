@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from datetime import datetime
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, ConfigDict, Field
+
+from .models import OHLCV, _construct
+
+FIELDS = ("open", "high", "low", "close", "volume")
+PRICE_FIELDS = ("open", "high", "low", "close")
+
+# Column names used by History.to_pandas()
+TITLES = {"open": "Open", "high": "High", "low": "Low", "close": "Close", "volume": "Volume"}
+
+
+class FieldStorage(BaseModel):
+    """
+    How one column is held in memory.
+
+    `float64` is exact, `float32` halves memory at ~7 significant digits, and the
+    integer types store `round(value * 10**decimals)` (fixed point). Fixed-point
+    encoding refuses values that would not decode back to the identical float.
+    """
+
+    dtype: Literal["float64", "float32", "int64", "int32"] = "float64"
+    decimals: int = Field(default=0, ge=0, le=18)
+
+    model_config = ConfigDict(frozen=True)
+
+    @property
+    def fixed_point(self) -> bool:
+        return self.dtype in ("int64", "int32")
+
+    def encode(self, values: np.ndarray, field: str = "value") -> np.ndarray:
+        if self.dtype == "float64":
+            return values
+        if self.dtype == "float32":
+            return values.astype(np.float32)
+        info = np.iinfo(self.dtype)
+        missing = np.isnan(values)
+        scaled = np.rint(values * 10.0**self.decimals)
+        present = scaled[~missing]
+        # The minimum is reserved as the missing-value marker
+        if present.size and (present.min() <= info.min or present.max() > info.max):
+            raise ValueError(f"Column {field!r} overflows {self.dtype} at {self.decimals} decimals")
+        encoded = np.where(missing, info.min, scaled).astype(self.dtype)
+        lossy = ~missing & (self.decode(encoded) != values)
+        if lossy.any():
+            raise ValueError(
+                f"Column {field!r} value {values[lossy][0]!r} is not exactly representable "
+                f"with {self.decimals} decimals"
+            )
+        return encoded
+
+    def decode(self, stored: np.ndarray) -> np.ndarray:
+        if self.dtype == "float64":
+            return stored
+        if self.dtype == "float32":
+            return stored.astype(np.float64)
+        values = stored / 10.0**self.decimals
+        values[stored == np.iinfo(self.dtype).min] = np.nan
+        return values
+
+
+class StoragePolicy(BaseModel):
+    """
+    Per-field storage of OHLCVColumns; the default keeps every field as float64.
+    """
+
+    open: FieldStorage = FieldStorage()
+    high: FieldStorage = FieldStorage()
+    low: FieldStorage = FieldStorage()
+    close: FieldStorage = FieldStorage()
+    volume: FieldStorage = FieldStorage()
+
+    model_config = ConfigDict(frozen=True)
+
+    @classmethod
+    def prices(cls, storage: FieldStorage, volume: FieldStorage | None = None) -> StoragePolicy:
+        """`storage` for open/high/low/close, `volume` (default float64) for volume."""
+        return cls(
+            **dict.fromkeys(PRICE_FIELDS, storage),
+            volume=volume if volume is not None else FieldStorage(),
+        )
+
+    @classmethod
+    def float32(cls) -> StoragePolicy:
+        """float32 prices; volume stays float64 since float32 is only exact to 2**24."""
+        return cls.prices(FieldStorage(dtype="float32"))
+
+    @classmethod
+    def fixed_point(cls, decimals: int = 4, volume_decimals: int = 0) -> StoragePolicy:
+        """Lossless scaled-int64 prices and volume."""
+        return cls.prices(
+            FieldStorage(dtype="int64", decimals=decimals),
+            FieldStorage(dtype="int64", decimals=volume_decimals),
+        )
+
+    def __getitem__(self, field: str) -> FieldStorage:
+        return getattr(self, field)  # type: ignore[no-any-return]
+
+
+class OHLCVColumns:
+    """
+    Columnar form of a candle list: a DatetimeIndex plus one float64 array per field.
+
+    Missing values (None on OHLCV) are NaN. This is the representation used for
+    vectorized work on histories; `History.to_columns()` builds it from the candles.
+
+    With a `StoragePolicy` fields may be held as float32 or fixed-point integers;
+    field access always returns float64 (decoding a copy for non-float64 fields).
+    """
+
+    __slots__ = ("index", "policy", "_data")
+
+    def __init__(
+        self,
+        index: pd.DatetimeIndex | list[datetime] | np.ndarray,
+        data: Mapping[str, np.ndarray],
+        policy: StoragePolicy | None = None,
+    ):
+        self.index = pd.DatetimeIndex(index).rename("Date")
+        self.policy = policy
+        n = len(self.index)
+        self._data: dict[str, np.ndarray] = {}
+        for field in FIELDS:
+            values = data.get(field)
+            if values is None:
+                values = np.full(n, np.nan)
+            else:
+                values = np.asarray(values, dtype=np.float64)
+                if values.shape != (n,):
+                    raise ValueError(f"Column {field!r} has shape {values.shape}, expected ({n},)")
+            self._data[field] = policy[field].encode(values, field) if policy else values
+
+    @classmethod
+    def from_candles(
+        cls, candles: Iterable[OHLCV], policy: StoragePolicy | None = None
+    ) -> OHLCVColumns:
+        candles = list(candles)
+        return cls(
+            pd.DatetimeIndex([c.date for c in candles]),
+            {
+                field: np.array([getattr(c, field) for c in candles], dtype=np.float64)
+                for field in FIELDS
+            },
+            policy,
+        )
+
+    @classmethod
+    def _encoded(
+        cls, index: pd.DatetimeIndex, data: dict[str, np.ndarray], policy: StoragePolicy | None
+    ) -> OHLCVColumns:
+        columns = cls.__new__(cls)
+        columns.index = index
+        columns.policy = policy
+        columns._data = data
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        stored = self._data[field]
+        return self.policy[field].decode(stored) if self.policy else stored
+
+    def raw(self, field: str) -> np.ndarray:
+        """The stored (possibly float32 or fixed-point) array of a field."""
+        return self._data[field]
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the field arrays, excluding the index."""
+        return sum(v.nbytes for v in self._data.values())
+
+    def with_storage(self, policy: StoragePolicy | None) -> OHLCVColumns:
+        """Re-encodes the fields with another storage policy (None for plain float64)."""
+        return OHLCVColumns(self.index, {f: self[f] for f in FIELDS}, policy)
+
+    @property
+    def open(self) -> np.ndarray:
+        return self["open"]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self["high"]
+
+    @property
+    def low(self) -> np.ndarray:
+        return self["low"]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self["close"]
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self["volume"]
+
+    def take(self, positions: np.ndarray | slice) -> OHLCVColumns:
+        """Rows at the given positions (or slice), as a new OHLCVColumns."""
+        return OHLCVColumns._encoded(
+            self.index[positions], {f: self._data[f][positions] for f in FIELDS}, self.policy
+        )
+
+    def to_candles(self) -> list[OHLCV]:
+        """Builds OHLCV models without re-validating values that are already typed."""
+        dates = self.index.to_pydatetime()
+        arrays = [self[f] for f in FIELDS]
+        columns = [a.tolist() for a in arrays]
+        if not any(np.isnan(a).any() for a in arrays):
+            # Every field is set on every candle: skip the per-value NaN checks
+            full = {"date", *FIELDS}
+            return [
+                _construct(
+                    OHLCV,
+                    {"date": d, "open": o, "high": h, "low": lo, "close": c, "volume": v},
+                    set(full),
+                )
+                for d, o, h, lo, c, v in zip(dates, *columns, strict=True)
+            ]
+        candles = []
+        for date, *values in zip(dates, *columns, strict=True):
+            row = {"date": date}
+            fields_set = {"date"}
+            for field, value in zip(FIELDS, values, strict=True):
+                if value != value:  # NaN
+                    row[field] = None
+                else:
+                    row[field] = value
+                    fields_set.add(field)
+            candles.append(_construct(OHLCV, row, fields_set))
+        return candles
+
+    def to_pandas(self) -> pd.DataFrame:
+        """DataFrame with the same layout as History.to_pandas()."""
+        return pd.DataFrame({TITLES[f]: self[f] for f in FIELDS}, index=self.index, copy=False)
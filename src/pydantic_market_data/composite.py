@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import date
+from typing import Any
+
+from .interfaces import DataSource
+from .models import (
+    History,
+    HistoryPeriod,
+    Price,
+    Security,
+    SecurityQuery,
+    Symbol,
+)
+
+
+def _security_keys(security: Security) -> set[Hashable]:
+    keys: set[Hashable] = set()
+    if security.isin is not None:
+        keys.add(("isin", str(security.isin)))
+    if security.figi is not None:
+        keys.add(("figi", str(security.figi)))
+    if not keys:
+        keys.add(("symbol", str(security.symbol), security.exchange))
+    return keys
+
+
+def merge_search_results(results: Iterable[list[Security]]) -> list[Security]:
+    """
+    Merges search results from several providers, given in priority order.
+
+    Securities sharing an ISIN or FIGI are collapsed into the first one seen, with its
+    missing fields filled in from the duplicates. Securities without identifiers are
+    deduplicated by (symbol, exchange).
+    """
+    merged: list[Security] = []
+    index: dict[Hashable, int] = {}
+    for batch in results:
+        for security in batch:
+            keys = _security_keys(security)
+            hit = next((index[k] for k in keys if k in index), None)
+            if hit is None:
+                hit = len(merged)
+                merged.append(security)
+            else:
+                kept = merged[hit]
+                missing = {
+                    name: value
+                    for name, value in security
+                    if value is not None and getattr(kept, name) is None
+                }
+                if missing:
+                    merged[hit] = kept.model_copy(update=missing)
+            for key in _security_keys(merged[hit]) | keys:
+                index.setdefault(key, hit)
+    return merged
+
+
+class CompositeDataSource:
+    """
+    DataSource combining several providers listed in priority order.
+
+    Lookups fail over to the next provider when one raises or has no data. With
+    `hedge_after` set, a lookup that has not answered within that many seconds also
+    starts the next provider, and the first usable answer wins. `search` queries all
+    providers concurrently and merges the results with `merge_search_results`.
+    """
+
+    def __init__(
+        self,
+        sources: Sequence[DataSource],
+        hedge_after: float | None = None,
+        max_workers: int | None = None,
+    ):
+        if not sources:
+            raise ValueError("CompositeDataSource needs at least one source")
+        self.sources = list(sources)
+        self.hedge_after = hedge_after
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or 4 * len(self.sources),
+            thread_name_prefix="composite-source",
+        )
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> CompositeDataSource:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _failover(self, method: str, args: tuple[Any, ...], accept: Callable[[Any], bool]) -> Any:
+        error: BaseException | None = None
+        missed = False
+        miss: Any = None
+        for source in self.sources:
+            try:
+                value = getattr(source, method)(*args)
+            except Exception as e:
+                error = e
+                continue
+            if accept(value):
+                return value
+            missed, miss = True, value
+        if not missed and error is not None:
+            raise error
+        return miss
+
+    def _hedged(self, method: str, args: tuple[Any, ...], accept: Callable[[Any], bool]) -> Any:
+        queue = iter(self.sources)
+        pending: set[Future[Any]] = set()
+        error: BaseException | None = None
+        missed = False
+        miss: Any = None
+
+        def launch() -> bool:
+            source = next(queue, None)
+            if source is None:
+                return False
+            pending.add(self._executor.submit(getattr(source, method), *args))
+            return True
+
+        launch()
+        while pending:
+            done, _ = wait(pending, timeout=self.hedge_after, return_when=FIRST_COMPLETED)
+            if not done:
+                # Slow provider: hedge with the next one, keep waiting on both
+                launch()
+                continue
+            for future in done:
+                pending.discard(future)
+                exc = future.exception()
+                if exc is not None:
+                    error = exc
+                elif accept(future.result()):
+                    return future.result()
+                else:
+                    missed, miss = True, future.result()
+            if not pending:
+                launch()
+        if not missed and error is not None:
+            raise error
+        return miss
+
+    def _first(self, method: str, args: tuple[Any, ...], accept: Callable[[Any], bool]) -> Any:
+        if self.hedge_after is None or len(self.sources) == 1:
+            return self._failover(method, args, accept)
+        return self._hedged(method, args, accept)
+
+    def search(self, query: str) -> list[Security]:
+        futures = [self._executor.submit(source.search, query) for source in self.sources]
+        results: list[list[Security]] = []
+        error: BaseException | None = None
+        for future in futures:
+            exc = future.exception()
+            if exc is not None:
+                error = exc
+            else:
+                results.append(future.result())
+        if not results and error is not None:
+            raise error
+        return merge_search_results(results)
+
+    def resolve(self, criteria: SecurityQuery) -> Security | None:
+        return self._first("resolve", (criteria,), lambda v: v is not None)  # type: ignore[no-any-return]
+
+    def history(self, symbol: Symbol.Input, period: HistoryPeriod = HistoryPeriod.MO1) -> History:
+        return self._first("history", (symbol, period), lambda v: bool(v.candles))  # type: ignore[no-any-return]
+
+    def get_price(self, symbol: Symbol.Input, date: date | None = None) -> Price | None:
+        return self._first("get_price", (symbol, date), lambda v: v is not None)  # type: ignore[no-any-return]
+
+    def validate(self, symbol: Symbol.Input, target_date: date, target_price: Price.Input) -> bool:
+        return self._first(  # type: ignore[no-any-return]
+            "validate", (symbol, target_date, target_price), lambda v: True
+        )
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import re
+import threading
+import weakref
+from collections import OrderedDict, deque
+from collections.abc import Iterable
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from .columns import OHLCVColumns
+from .models import CurrencyCode, History, Price, new_price
+
+_PAIR = re.compile(r"^([A-Z]{3})[/_:\- ]?([A-Z]{3})(?:=X)?$")
+
+_PRICES = ("open", "high", "low", "close")
+
+# (id of the source History, target currency)
+ConversionKey = tuple[int, str]
+# What a cached conversion was computed from: candle list, its length, last candle
+# and its date, and the source currency
+Signature = tuple[int, int, int, datetime | None, str]
+
+
+def parse_pair(symbol: str) -> tuple[str, str]:
+    """(base, quote) of an FX pair symbol such as `EURUSD`, `EUR/USD` or `EURUSD=X`."""
+    match = _PAIR.match(symbol.strip().upper())
+    if match is None:
+        raise ValueError(f"Not a currency pair symbol: {symbol!r}")
+    return match.group(1), match.group(2)
+
+
+def _stamps(index: pd.DatetimeIndex) -> np.ndarray:
+    """int64 nanoseconds for as-of joins; naive timestamps are taken as UTC."""
+    if index.tz is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+    return np.asarray(index.as_unit("ns").asi8)  # type: ignore[attr-defined]
+
+
+def _code(currency: CurrencyCode.Input | str) -> str:
+    return str(currency).upper()
+
+
+class FXConverter:
+    """
+    Converts prices between currencies using FX rate histories.
+
+    Each rate history is a `History` of a currency pair (symbol `EURUSD`, `EUR/USD`
+    or `EURUSD=X`) whose closes give the quote currency per unit of base. Pairs are
+    usable in both directions, and currencies without a direct pair are converted
+    through intermediate ones (e.g. GBP -> USD -> JPY).
+
+    Conversion is an as-of join: each timestamp uses the last rate at or before it,
+    looked up for a whole index at once; timestamps before the first rate become
+    NaN (None on candles). The last `cache_size` converted histories are cached
+    per source History instance until rates change; see `convert`.
+    """
+
+    def __init__(self, rates: Iterable[History] = (), cache_size: int = 1024):
+        self._rates: dict[tuple[str, str], tuple[np.ndarray, np.ndarray]] = {}
+        self._graph: dict[str, set[str]] = {}
+        self._cache: OrderedDict[ConversionKey, tuple[weakref.ref[History], Signature, History]] = (
+            OrderedDict()
+        )
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        for history in rates:
+            self.add_rates(history)
+
+    def add_rates(
+        self, history: History, base: str | None = None, quote: str | None = None
+    ) -> None:
+        """Registers a rate history; base/quote default to the pair in its symbol."""
+        if base is None or quote is None:
+            base, quote = parse_pair(str(history.security.symbol))
+        base, quote = _code(base), _code(quote)
+        columns = history.to_columns()
+        close = columns["close"]
+        valid = ~np.isnan(close) & (close > 0)
+        stamps = _stamps(columns.index)[valid]
+        order = np.argsort(stamps, kind="stable")
+        with self._lock:
+            self._rates[(base, quote)] = stamps[order], close[valid][order]
+            self._graph.setdefault(base, set()).add(quote)
+            self._graph.setdefault(quote, set()).add(base)
+            self._cache.clear()
+
+    def _route(self, source: str, target: str) -> list[tuple[str, str]]:
+        """Shortest chain of pairs from source to target (breadth-first)."""
+        previous: dict[str, str] = {source: source}
+        queue = deque([source])
+        while queue and target not in previous:
+            currency = queue.popleft()
+            for neighbour in sorted(self._graph.get(currency, ())):
+                if neighbour not in previous:
+                    previous[neighbour] = currency
+                    queue.append(neighbour)
+        if target not in previous:
+            raise LookupError(f"No FX rates connect {source} to {target}")
+        legs = []
+        currency = target
+        while currency != source:
+            legs.append((previous[currency], currency))
+            currency = previous[currency]
+        return legs[::-1]
+
+    def _leg(self, source: str, target: str, stamps: np.ndarray) -> np.ndarray:
+        if (source, target) in self._rates:
+            rate_stamps, rates = self._rates[(source, target)]
+        else:
+            rate_stamps, inverse = self._rates[(target, source)]
+            rates = 1.0 / inverse
+        # As-of join: position of the last rate at or before each timestamp
+        positions = np.searchsorted(rate_stamps, stamps, side="right") - 1
+        return np.where(positions >= 0, rates[np.maximum(positions, 0)], np.nan)
+
+    def factors(
+        self,
+        source: CurrencyCode.Input | str,
+        target: CurrencyCode.Input | str,
+        index: pd.DatetimeIndex,
+    ) -> np.ndarray:
+        """Multiplier converting `source` amounts to `target` at each timestamp."""
+        source, target = _code(source), _code(target)
+        stamps = _stamps(pd.DatetimeIndex(index))
+        result = np.ones(len(stamps))
+        if source == target:
+            return result
+        for leg_source, leg_target in self._route(source, target):
+            result *= self._leg(leg_source, leg_target, stamps)
+        return result
+
+    def rate(
+        self, source: CurrencyCode.Input | str, target: CurrencyCode.Input | str, at: datetime
+    ) -> float | None:
+        """Units of `target` per unit of `source` as of `at`, or None before the first rate."""
+        value = float(self.factors(source, target, pd.DatetimeIndex([at]))[0])
+        return None if np.isnan(value) else value
+
+    def convert_price(
+        self,
+        price: Price.Input,
+        source: CurrencyCode.Input | str,
+        target: CurrencyCode.Input | str,
+        at: datetime,
+    ) -> Price | None:
+        rate = self.rate(source, target, at)
+        if rate is None:
+            return None
+        value = price.value if isinstance(price, Price) else float(price)
+        return new_price(value * rate)
+
+    def convert_columns(
+        self,
+        columns: OHLCVColumns,
+        source: CurrencyCode.Input | str,
+        target: CurrencyCode.Input | str,
+    ) -> OHLCVColumns:
+        """Converted prices (volume is unchanged) as new float64 columns."""
+        factors = self.factors(source, target, columns.index)
+        data = {f: columns[f] * factors for f in _PRICES}
+        data["volume"] = columns["volume"]
+        return OHLCVColumns(columns.index, data)
+
+    def convert(self, history: History, target: CurrencyCode.Input | str) -> History:
+        """
+        `history` expressed in `target`, with the security's currency updated.
+
+        The source currency is `history.security.currency`. Results are cached by
+        History instance and target (least recently used entries are evicted), so
+        converting the same object again is a lookup. A cached result is recomputed
+        when the history's candle list is replaced, grows or shrinks, its last candle
+        changes or the security's currency changes; after editing the values of
+        existing candles in place, call `invalidate()`.
+        """
+        target = _code(target)
+        source = history.security.currency
+        if source is None:
+            raise ValueError(f"{history.security.symbol} has no currency to convert from")
+        if _code(source) == target:
+            return history
+        key: ConversionKey = (id(history), target)
+        candles = history.candles
+        last = candles[-1] if candles else None
+        signature: Signature = (
+            id(candles),
+            len(candles),
+            id(last),
+            last.date if last is not None else None,
+            _code(source),
+        )
+        with self._lock:
+            cached = self._cache.get(key)
+            # The id may belong to a new object once the original is collected
+            if cached is not None and cached[0]() is history and cached[1] == signature:
+                self._cache.move_to_end(key)
+                return cached[2]
+        columns = self.convert_columns(history.to_columns(), source, target)
+        security = history.security.model_copy(
+            update={"currency": CurrencyCode.model_validate(target)}
+        )
+        converted = History.from_columns(security, columns)
+        with self._lock:
+            self._cache[key] = (weakref.ref(history), signature, converted)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return converted
+
+    def convert_many(
+        self, histories: Iterable[History], target: CurrencyCode.Input | str
+    ) -> list[History]:
+        return [self.convert(history, target) for history in histories]
+
+    def invalidate(self) -> None:
+        """Drops all cached conversions."""
+        with self._lock:
+            self._cache.clear()
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import math
+from collections import deque
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .columns import OHLCVColumns
+from .models import OHLCV, History
+
+
+def _columns(data: History | OHLCVColumns) -> OHLCVColumns:
+    return data.to_columns() if isinstance(data, History) else data
+
+
+def _rolling(values: np.ndarray, window: int) -> np.ndarray:
+    """(n - window + 1, window) view of the trailing windows, no copy."""
+    if window < 1:
+        raise ValueError(f"Window must be positive: {window}")
+    return sliding_window_view(values, window)
+
+
+def _pad(values: np.ndarray, n: int) -> np.ndarray:
+    """Left-pads a shorter result with NaN so it aligns with the candles."""
+    out = np.full(n, np.nan)
+    if len(values):
+        out[n - len(values) :] = values
+    return out
+
+
+def returns(data: History | OHLCVColumns) -> np.ndarray:
+    """Simple close-to-close returns."""
+    close = _columns(data).close
+    out = np.full(len(close), np.nan)
+    out[1:] = close[1:] / close[:-1] - 1.0
+    return out
+
+
+def log_returns(data: History | OHLCVColumns) -> np.ndarray:
+    """Close-to-close log returns."""
+    close = _columns(data).close
+    out = np.full(len(close), np.nan)
+    out[1:] = np.log(close[1:] / close[:-1])
+    return out
+
+
+def sma(data: History | OHLCVColumns, window: int, field: str = "close") -> np.ndarray:
+    """Simple moving average over `window` candles."""
+    values = _columns(data)[field]
+    if len(values) < window:
+        return _pad(np.empty(0), len(values))
+    return _pad(_rolling(values, window).mean(axis=1), len(values))
+
+
+def ema(data: History | OHLCVColumns, span: int, field: str = "close") -> np.ndarray:
+    """Exponential moving average with alpha = 2 / (span + 1), seeded with the first value."""
+    values = _columns(data)[field]
+    return pd.Series(values).ewm(span=span, adjust=False).mean().to_numpy()
+
+
+def rolling_volatility(
+    data: History | OHLCVColumns, window: int, periods_per_year: float | None = None
+) -> np.ndarray:
+    """
+    Sample standard deviation of log returns over `window` returns.
+
+    Pass `periods_per_year` (e.g. 252 for daily candles) to annualize.
+    """
+    rets = log_returns(data)
+    if len(rets) - 1 < window:
+        return _pad(np.empty(0), len(rets))
+    vol = _pad(_rolling(rets[1:], window).std(axis=1, ddof=1), len(rets))
+    if periods_per_year is not None:
+        vol *= math.sqrt(periods_per_year)
+    return vol
+
+
+def true_range(data: History | OHLCVColumns) -> np.ndarray:
+    """High - low, widened to the previous close when the market gapped."""
+    columns = _columns(data)
+    high, low, close = columns.high, columns.low, columns.close
+    tr = high - low
+    if len(tr) > 1:
+        prev_close = close[:-1]
+        tr[1:] = np.maximum.reduce(
+            [tr[1:], np.abs(high[1:] - prev_close), np.abs(low[1:] - prev_close)]
+        )
+    return tr
+
+
+def atr(data: History | OHLCVColumns, window: int = 14) -> np.ndarray:
+    """Average True Range with Wilder smoothing, seeded by the mean of the first window."""
+    tr = true_range(data)
+    if len(tr) < window:
+        return _pad(np.empty(0), len(tr))
+    seeded = tr[window - 1 :].copy()
+    seeded[0] = tr[:window].mean()
+    smoothed = pd.Series(seeded).ewm(alpha=1.0 / window, adjust=False).mean().to_numpy()
+    return _pad(smoothed, len(tr))
+
+
+def vwap(data: History | OHLCVColumns) -> np.ndarray:
+    """Cumulative volume-weighted average of the typical price (high + low + close) / 3."""
+    columns = _columns(data)
+    typical = (columns.high + columns.low + columns.close) / 3.0
+    volume = columns.volume
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.cumsum(typical * volume) / np.cumsum(volume)
+
+
+def _value(candle: OHLCV, field: str) -> float:
+    x = getattr(candle, field)
+    if x is None:
+        raise ValueError(f"Candle at {candle.date} has no {field}")
+    return float(x)
+
+
+def _check_window(window: int, minimum: int = 1, name: str = "window") -> int:
+    if window < minimum:
+        raise ValueError(f"{name} must be at least {minimum}, got {window}")
+    return window
+
+
+class SMA:
+    """Streaming simple moving average, matching `sma()`."""
+
+    def __init__(self, window: int, field: str = "close"):
+        self.window = _check_window(window)
+        self.field = field
+        self._values: deque[float] = deque(maxlen=window)
+        self._sum = 0.0
+        self.value: float | None = None
+
+    def update(self, candle: OHLCV) -> float | None:
+        x = _value(candle, self.field)
+        if len(self._values) == self.window:
+            self._sum -= self._values[0]
+        self._values.append(x)
+        self._sum += x
+        if len(self._values) == self.window:
+            self.value = self._sum / self.window
+        return self.value
+
+
+class EMA:
+    """Streaming exponential moving average, matching `ema()`."""
+
+    def __init__(self, span: int, field: str = "close"):
+        _check_window(span, name="span")
+        self.alpha = 2.0 / (span + 1)
+        self.field = field
+        self.value: float | None = None
+
+    def update(self, candle: OHLCV) -> float | None:
+        x = _value(candle, self.field)
+        self.value = x if self.value is None else self.value + self.alpha * (x - self.value)
+        return self.value
+
+
+class RollingVolatility:
+    """Streaming sample standard deviation of log returns, matching `rolling_volatility()`."""
+
+    def __init__(self, window: int, periods_per_year: float | None = None):
+        # A sample standard deviation needs at least two returns
+        self.window = _check_window(window, minimum=2)
+        self.scale = math.sqrt(periods_per_year) if periods_per_year is not None else 1.0
+        self._returns: deque[float] = deque(maxlen=window)
+        self._prev: float | None = None
+        # Welford's running mean and sum of squared deviations over the window
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.value: float | None = None
+
+    def update(self, candle: OHLCV) -> float | None:
+        close = _value(candle, "close")
+        if self._prev is not None:
+            r = math.log(close / self._prev)
+            if len(self._returns) == self.window:
+                old = self._returns[0]
+                mean = self._mean + (r - old) / self.window
+                self._m2 += (r - old) * (r - mean + old - self._mean)
+                self._mean = mean
+            else:
+                delta = r - self._mean
+                self._mean += delta / (len(self._returns) + 1)
+                self._m2 += delta * (r - self._mean)
+            self._returns.append(r)
+            if len(self._returns) == self.window:
+                var = max(self._m2, 0.0) / (self.window - 1)
+                self.value = math.sqrt(var) * self.scale
+        self._prev = close
+        return self.value
+
+
+class ATR:
+    """Streaming Average True Range with Wilder smoothing, matching `atr()`."""
+
+    def __init__(self, window: int = 14):
+        self.window = _check_window(window)
+        self._prev_close: float | None = None
+        self._seed: list[float] = []
+        self.value: float | None = None
+
+    def update(self, candle: OHLCV) -> float | None:
+        high, low, close = _value(candle, "high"), _value(candle, "low"), _value(candle, "close")
+        tr = high - low
+        if self._prev_close is not None:
+            tr = max(tr, abs(high - self._prev_close), abs(low - self._prev_close))
+        self._prev_close = close
+        if self.value is not None:
+            self.value += (tr - self.value) / self.window
+        else:
+            self._seed.append(tr)
+            if len(self._seed) == self.window:
+                self.value = sum(self._seed) / self.window
+        return self.value
+
+
+class VWAP:
+    """Streaming cumulative VWAP, matching `vwap()`."""
+
+    def __init__(self) -> None:
+        self._pv = 0.0
+        self._volume = 0.0
+        self.value: float | None = None
+
+    def update(self, candle: OHLCV) -> float | None:
+        typical = (_value(candle, "high") + _value(candle, "low") + _value(candle, "close")) / 3.0
+        volume = _value(candle, "volume")
+        self._pv += typical * volume
+        self._volume += volume
+        if self._volume:
+            self.value = self._pv / self._volume
+        return self.value
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import gzip
+import io
+import os
+import re
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Literal, TypeVar
+
+import numpy as np
+import pandas as pd
+
+from .columns import FIELDS, OHLCVColumns, StoragePolicy
+from .models import History, Security
+from .registry import SecurityRegistry
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+FileFormat = Literal["csv", "parquet"]
+
+# Header names recognized (case-insensitively) for each column, besides the field name
+_ALIASES: dict[str, tuple[str, ...]] = {
+    "date": ("date", "datetime", "timestamp", "time"),
+    "symbol": ("symbol", "ticker"),
+}
+
+_OFFSET = re.compile(r"(?:[+-]\d\d:?\d\d|Z)$")
+
+# Parsed rows of one chunk: timestamps, the fields present in the file and the
+# symbols (empty when not read)
+_Chunk = tuple[pd.DatetimeIndex, dict[str, np.ndarray], np.ndarray]
+
+
+def _detect_format(path: str) -> FileFormat:
+    name = path.lower()
+    if name.endswith((".parquet", ".pq")):
+        return "parquet"
+    return "csv"
+
+
+def _resolve(names: list[str], columns: Mapping[str, str] | None, symbols: bool) -> dict[str, str]:
+    """Maps `date`, the fields and (optionally) `symbol` to the file's column names."""
+    by_lower = {name.strip().lower(): name for name in names}
+    wanted: dict[str, str] = {}
+    for key in ("date", *FIELDS, *(("symbol",) if symbols else ())):
+        if columns and key in columns:
+            if columns[key] not in names:
+                raise ValueError(f"Column {columns[key]!r} (for {key}) is not in the file")
+            wanted[key] = columns[key]
+            continue
+        for alias in _ALIASES.get(key, (key,)):
+            if alias in by_lower:
+                wanted[key] = by_lower[alias]
+                break
+    for key in ("date", *(("symbol",) if symbols else ())):
+        if key not in wanted:
+            raise ValueError(f"No {key} column among {names}")
+    return wanted
+
+
+def _timestamps(values: pd.Series) -> pd.DatetimeIndex:
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return pd.DatetimeIndex(values)
+    # Text with UTC offsets (which change across DST, and so between chunks) is
+    # converted to UTC; naive text stays naive
+    utc = bool(len(values)) and _OFFSET.search(str(values.iloc[0])) is not None
+    return pd.DatetimeIndex(pd.to_datetime(values, utc=utc))
+
+
+def _split(frame: pd.DataFrame, wanted: dict[str, str]) -> _Chunk:
+    index = _timestamps(frame[wanted["date"]])
+    data = {f: frame[wanted[f]].to_numpy(np.float64) for f in FIELDS if f in wanted}
+    symbols = frame[wanted["symbol"]].to_numpy(str) if "symbol" in wanted else np.array([])
+    return index, data, symbols
+
+
+def _open(path: str) -> io.BufferedIOBase:
+    return gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb")
+
+
+def _csv_chunks(
+    path: str, columns: Mapping[str, str] | None, symbols: bool, chunk_rows: int, workers: int
+) -> Iterator[_Chunk]:
+    with _open(path) as f:
+        header = pd.read_csv(io.BytesIO(f.readline()), nrows=0).columns.tolist()
+        wanted = _resolve(header, columns, symbols)
+        dtypes: dict[str, Any] = {name: np.float64 for key, name in wanted.items() if key in FIELDS}
+        if "symbol" in wanted:
+            dtypes[wanted["symbol"]] = str
+
+        def parse(block: bytes) -> _Chunk:
+            frame = pd.read_csv(
+                io.BytesIO(block),
+                header=None,
+                names=header,
+                usecols=list(wanted.values()),
+                dtype=dtypes,
+            )
+            return _split(frame, wanted)
+
+        # Whole lines only, so each block parses on its own (no quoted newlines)
+        blocks = iter(lambda: b"".join(islice(f, chunk_rows)), b"")
+        yield from _map(parse, blocks, workers)
+
+
+def _parquet_chunks(
+    path: str, columns: Mapping[str, str] | None, symbols: bool, chunk_rows: int, workers: int
+) -> Iterator[_Chunk]:
+    try:
+        import pyarrow.parquet as pq  # type: ignore[import-not-found, import-untyped]  # noqa: PLC0415
+    except ImportError:
+        raise ImportError(
+            "Reading Parquet requires pyarrow (pip install pydantic-market-data[parquet])"
+        ) from None
+    with pq.ParquetFile(path) as parquet:
+        wanted = _resolve(parquet.schema_arrow.names, columns, symbols)
+        batches = parquet.iter_batches(
+            batch_size=chunk_rows, columns=list(wanted.values()), use_threads=workers > 1
+        )
+        for batch in batches:
+            # Without the pandas metadata a stored index (e.g. `Date` from
+            # `History.to_pandas()`) stays an ordinary column
+            yield _split(batch.to_pandas(ignore_metadata=True), wanted)
+
+
+def _map(fn: Callable[[_T], _R], items: Iterable[_T], workers: int) -> Iterator[_R]:
+    """`map(fn, items)` on a thread pool, in order, with at most `workers + 1` items in flight."""
+    if workers <= 1:
+        yield from map(fn, items)
+        return
+    with ThreadPoolExecutor(workers) as executor:
+        pending: deque[Future[_R]] = deque()
+        for item in items:
+            pending.append(executor.submit(fn, item))
+            if len(pending) > workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _chunks(
+    path: str | os.PathLike[str],
+    format: FileFormat | None,
+    columns: Mapping[str, str] | None,
+    symbols: bool,
+    chunk_rows: int,
+    workers: int,
+) -> Iterator[_Chunk]:
+    path = os.fspath(path)
+    reader = _parquet_chunks if (format or _detect_format(path)) == "parquet" else _csv_chunks
+    return reader(path, columns, symbols, chunk_rows, workers)
+
+
+class _Builder:
+    """Encoded pieces of one series, concatenated once at the end."""
+
+    def __init__(self, policy: StoragePolicy | None):
+        self.policy = policy
+        self.index: list[pd.DatetimeIndex] = []
+        self.data: dict[str, list[np.ndarray]] = {f: [] for f in FIELDS}
+
+    def add(self, index: pd.DatetimeIndex, data: dict[str, np.ndarray]) -> None:
+        self.index.append(index)
+        for field in FIELDS:
+            values = data[field] if field in data else np.full(len(index), np.nan)
+            self.data[field].append(
+                self.policy[field].encode(values, field) if self.policy else values
+            )
+
+    def build(self) -> OHLCVColumns:
+        index = self.index[0].append(self.index[1:]) if self.index else pd.DatetimeIndex([])
+        data = {}
+        for field in FIELDS:
+            # Release each field's pieces as soon as they are joined
+            pieces = self.data.pop(field)
+            data[field] = np.concatenate(pieces) if pieces else np.array([], dtype=np.float64)
+        return OHLCVColumns._encoded(pd.DatetimeIndex(index, name="Date"), data, self.policy)
+
+
+def read_columns(
+    path: str | os.PathLike[str],
+    format: FileFormat | None = None,
+    columns: Mapping[str, str] | None = None,
+    chunk_rows: int = 100_000,
+    workers: int = 1,
+    policy: StoragePolicy | None = None,
+) -> OHLCVColumns:
+    """
+    Reads a single-security CSV or Parquet file into OHLCVColumns, chunk by chunk.
+
+    Only `chunk_rows` rows (per worker) are parsed at a time; each chunk is
+    encoded with `policy` right away and the pieces are joined once at the end,
+    so no DataFrame or OHLCV list of the whole file is built. The format follows
+    the extension (`.parquet`/`.pq`, otherwise CSV, gzipped if `.gz`). Columns are
+    matched case-insensitively to `date` (or `datetime`, `timestamp`, `time`) and
+    the field names, which covers `History.to_pandas()` output; `columns` maps a
+    field (or `date`) to another header. Missing fields are NaN.
+
+    With `workers > 1` CSV chunks are parsed on that many threads, and Parquet is
+    decoded with pyarrow's thread pool. Parquet requires `pyarrow`.
+    """
+    builder = _Builder(policy)
+    for index, data, _ in _chunks(path, format, columns, False, chunk_rows, workers):
+        builder.add(index, data)
+    return builder.build()
+
+
+def read_history(
+    path: str | os.PathLike[str],
+    security: Security,
+    format: FileFormat | None = None,
+    columns: Mapping[str, str] | None = None,
+    chunk_rows: int = 100_000,
+    workers: int = 1,
+) -> History:
+    """A History of `security` from a single-security file; see `read_columns`."""
+    return History.from_columns(security, read_columns(path, format, columns, chunk_rows, workers))
+
+
+def iter_columns(
+    path: str | os.PathLike[str],
+    format: FileFormat | None = None,
+    columns: Mapping[str, str] | None = None,
+    grouped: bool = True,
+    chunk_rows: int = 100_000,
+    workers: int = 1,
+    policy: StoragePolicy | None = None,
+) -> Iterator[tuple[str, OHLCVColumns]]:
+    """
+    (symbol, columns) pairs from a multi-security file with a `symbol` (or `ticker`) column.
+
+    With `grouped` (rows of each symbol are contiguous, as in most vendor dumps)
+    each symbol is yielded as soon as its rows end, so memory is bounded by the
+    largest symbol; a symbol reappearing later raises ValueError. Otherwise all
+    symbols are collected and yielded in order of first appearance.
+    """
+    builders: dict[str, _Builder] = {}
+    done: set[str] = set()
+    for index, data, symbols in _chunks(path, format, columns, True, chunk_rows, workers):
+        # Runs of consecutive rows sharing a symbol
+        starts = [0, *(np.flatnonzero(symbols[1:] != symbols[:-1]) + 1).tolist()]
+        for start, stop in zip(starts, [*starts[1:], len(symbols)], strict=True):
+            symbol = str(symbols[start])
+            if grouped and symbol not in builders:
+                if symbol in done:
+                    raise ValueError(f"Rows of {symbol} are not contiguous; pass grouped=False")
+                for finished in list(builders):
+                    done.add(finished)
+                    yield finished, builders.pop(finished).build()
+            builder = builders.setdefault(symbol, _Builder(policy))
+            builder.add(index[start:stop], {f: v[start:stop] for f, v in data.items()})
+    for symbol, builder in builders.items():
+        yield symbol, builder.build()
+
+
+def iter_histories(
+    path: str | os.PathLike[str],
+    securities: Mapping[str, Security] | SecurityRegistry | None = None,
+    format: FileFormat | None = None,
+    columns: Mapping[str, str] | None = None,
+    grouped: bool = True,
+    chunk_rows: int = 100_000,
+    workers: int = 1,
+) -> Iterator[History]:
+    """
+    One History per symbol of a multi-security file; see `iter_columns`.
+
+    Securities are looked up by symbol in `securities` (a mapping or a
+    SecurityRegistry, whose instances are shared); symbols not found there get a
+    bare Security named after the symbol.
+    """
+    for symbol, data in iter_columns(path, format, columns, grouped, chunk_rows, workers):
+        security = securities.get(symbol) if securities is not None else None
+        if security is None:
+            security = Security(symbol=symbol, name=symbol)
+        yield History.from_columns(security, data)
@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from typing import Any, Protocol
+
+from pydantic import BaseModel, ConfigDict
+
+from .interfaces import DataSource
+from .models import History
+from .wrappers import DataSourceWrapper
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (0, 1, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+
+class CallEvent(BaseModel):
+    """
+    A single DataSource call as seen by InstrumentedDataSource.
+    """
+
+    source: str
+    method: str
+    duration: float
+    error: str | None = None  # Exception class name when the call raised
+    size: int | None = None  # Number of candles / securities / prices returned
+
+    model_config = ConfigDict(frozen=True)
+
+
+class MetricsSink(Protocol):
+    """
+    Receiver for DataSource call and cache metrics.
+    """
+
+    def record_call(self, event: CallEvent) -> None: ...
+
+    def record_cache(self, source: str, hit: bool) -> None: ...
+
+
+class Histogram:
+    """
+    Cumulative bucket histogram in the Prometheus style (upper bounds, plus +Inf).
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """(upper bound, count of observations <= bound) pairs, ending with +Inf."""
+        total = 0
+        pairs = []
+        for bound, count in zip((*self.buckets, float("inf")), self.counts, strict=True):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th quantile."""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return bound
+        return float("inf")
+
+
+class InMemorySink:
+    """
+    Thread-safe sink aggregating call metrics per (source, method).
+    """
+
+    def __init__(
+        self,
+        latency_buckets: Sequence[float] = LATENCY_BUCKETS,
+        size_buckets: Sequence[float] = SIZE_BUCKETS,
+    ):
+        self._latency_buckets = latency_buckets
+        self._size_buckets = size_buckets
+        self._lock = threading.Lock()
+        self.latency: dict[tuple[str, str], Histogram] = {}
+        self.sizes: dict[tuple[str, str], Histogram] = {}
+        self.calls: dict[tuple[str, str], int] = defaultdict(int)
+        self.errors: dict[tuple[str, str, str], int] = defaultdict(int)
+        self.cache: dict[tuple[str, bool], int] = defaultdict(int)
+
+    def record_call(self, event: CallEvent) -> None:
+        key = (event.source, event.method)
+        with self._lock:
+            self.calls[key] += 1
+            if key not in self.latency:
+                self.latency[key] = Histogram(self._latency_buckets)
+            self.latency[key].observe(event.duration)
+            if event.error is not None:
+                self.errors[(*key, event.error)] += 1
+            if event.size is not None:
+                if key not in self.sizes:
+                    self.sizes[key] = Histogram(self._size_buckets)
+                self.sizes[key].observe(event.size)
+
+    def record_cache(self, source: str, hit: bool) -> None:
+        with self._lock:
+            self.cache[(source, hit)] += 1
+
+    def cache_hit_rate(self, source: str) -> float | None:
+        # .get(): indexing the defaultdict would add empty series for unknown sources
+        with self._lock:
+            hits, misses = self.cache.get((source, True), 0), self.cache.get((source, False), 0)
+        return hits / (hits + misses) if hits + misses else None
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Summary per "source.method": calls, errors, mean latency, p95 and total size."""
+        with self._lock:
+            summary: dict[str, dict[str, Any]] = {}
+            for (source, method), hist in self.latency.items():
+                sizes = self.sizes.get((source, method))
+                summary[f"{source}.{method}"] = {
+                    "calls": self.calls[(source, method)],
+                    "errors": sum(
+                        n for (s, m, _), n in self.errors.items() if (s, m) == (source, method)
+                    ),
+                    "mean_latency": hist.sum / hist.count,
+                    "p95_latency": hist.quantile(0.95),
+                    "total_size": int(sizes.sum) if sizes else None,
+                }
+            return summary
+
+
+class LoggingSink:
+    """
+    Sink writing one log record per call, for ad-hoc troubleshooting.
+    """
+
+    def __init__(self, log: logging.Logger | None = None, level: int = logging.DEBUG):
+        self.log = log or logger
+        self.level = level
+
+    def record_call(self, event: CallEvent) -> None:
+        self.log.log(
+            self.level,
+            "%s.%s took %.1fms (size=%s, error=%s)",
+            event.source,
+            event.method,
+            event.duration * 1000,
+            event.size,
+            event.error,
+        )
+
+    def record_cache(self, source: str, hit: bool) -> None:
+        self.log.log(self.level, "%s cache %s", source, "hit" if hit else "miss")
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: Any) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+class PrometheusSink(InMemorySink):
+    """
+    In-memory sink that renders its metrics in the Prometheus text exposition format.
+    """
+
+    def _render_histogram(
+        self, name: str, help_text: str, histograms: dict[tuple[str, str], Histogram]
+    ) -> list[str]:
+        lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+        for (source, method), hist in sorted(histograms.items()):
+            for bound, total in hist.cumulative():
+                labels = _labels(source=source, method=method, le=_format_bound(bound))
+                lines.append(f"{name}_bucket{labels} {total}")
+            labels = _labels(source=source, method=method)
+            lines.append(f"{name}_sum{labels} {hist.sum!r}")
+            lines.append(f"{name}_count{labels} {hist.count}")
+        return lines
+
+    def render(self) -> str:
+        with self._lock:
+            lines = self._render_histogram(
+                "datasource_call_duration_seconds", "DataSource call latency.", self.latency
+            )
+            lines += self._render_histogram(
+                "datasource_payload_size", "Items returned per DataSource call.", self.sizes
+            )
+            lines += [
+                "# HELP datasource_calls_total DataSource calls.",
+                "# TYPE datasource_calls_total counter",
+            ]
+            for (source, method), n in sorted(self.calls.items()):
+                lines.append(f"datasource_calls_total{_labels(source=source, method=method)} {n}")
+            lines += [
+                "# HELP datasource_errors_total DataSource calls that raised.",
+                "# TYPE datasource_errors_total counter",
+            ]
+            for (source, method, error), n in sorted(self.errors.items()):
+                labels = _labels(source=source, method=method, error=error)
+                lines.append(f"datasource_errors_total{labels} {n}")
+            lines += [
+                "# HELP datasource_cache_requests_total Cache lookups by result.",
+                "# TYPE datasource_cache_requests_total counter",
+            ]
+            for (source, hit), n in sorted(self.cache.items()):
+                labels = _labels(source=source, result="hit" if hit else "miss")
+                lines.append(f"datasource_cache_requests_total{labels} {n}")
+        return "\n".join(lines) + "\n"
+
+
+def _payload_size(value: Any) -> int | None:
+    if isinstance(value, History):
+        return len(value.candles)
+    if isinstance(value, list):
+        return len(value)
+    if isinstance(value, bool):
+        return None
+    return 0 if value is None else 1
+
+
+class InstrumentedDataSource(DataSourceWrapper):
+    """
+    DataSource wrapper reporting latency, errors and payload sizes of every call to a sink.
+    """
+
+    def __init__(
+        self,
+        source: DataSource,
+        sink: MetricsSink | None = None,
+        name: str | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        super().__init__(source)
+        self.sink: MetricsSink = sink if sink is not None else InMemorySink()
+        self.name = name or type(source).__name__
+        self._clock = clock
+
+    def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        started = self._clock()
+        try:
+            result = super()._call(method, *args, **kwargs)
+        except Exception as e:
+            self.sink.record_call(
+                CallEvent(
+                    source=self.name,
+                    method=method,
+                    duration=self._clock() - started,
+                    error=type(e).__name__,
+                )
+            )
+            raise
+        self.sink.record_call(
+            CallEvent(
+                source=self.name,
+                method=method,
+                duration=self._clock() - started,
+                size=_payload_size(result),
+            )
+        )
+        return result
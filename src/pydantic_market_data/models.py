@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Callable, Iterable
 from datetime import date, datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Annotated, Any, ClassVar, TypeAlias
+from typing import TYPE_CHECKING, Annotated, Any, ClassVar, TypeAlias, TypeVar
 
 import pandas as pd
 from pydantic import (
@@ -15,17 +16,34 @@ from pydantic import (
 from pydantic_extra_types.country import CountryAlpha2
 from pydantic_extra_types.currency_code import Currency
 
+if TYPE_CHECKING:
+    from .actions import CorporateActions
+    from .columns import OHLCVColumns, StoragePolicy
+    from .symbols import ParsedSymbol
+
 # Re-exported for downstream consumers
 
 
 def parse_date(v: date | str) -> date:
     if isinstance(v, str):
-        return pd.to_datetime(v).date()
+        # Plain ISO dates (the JSON wire format) skip the much slower pandas parser
+        try:
+            return date.fromisoformat(v)
+        except ValueError:
+            return pd.to_datetime(v).date()
     return v
 
 
 def parse_datetime(v: datetime | str) -> datetime:
     if isinstance(v, str):
+        # Naive ISO timestamps take the fast path; anything else (offsets, other
+        # formats) goes through pandas so the result is unchanged
+        try:
+            parsed = datetime.fromisoformat(v)
+        except ValueError:
+            parsed = None
+        if parsed is not None and parsed.tzinfo is None:
+            return parsed
         return pd.to_datetime(v).to_pydatetime()
     return v
 
@@ -40,11 +58,14 @@ def clean_isin(v: str | None) -> str | None:
     return v
 
 
+_ISIN_PATTERN = re.compile(r"^[A-Z]{2}[A-Z0-9]{9}\d$")
+
+
 def validate_isin(v: str | None) -> str | None:
     v = clean_isin(v)
     if v is None:
         return None
-    if not re.match(r"^[A-Z]{2}[A-Z0-9]{9}\d$", v):
+    if not _ISIN_PATTERN.match(v):
         raise ValueError(f"Invalid ISIN format: {v}")
 
     # Luhn checksum validation
@@ -101,6 +122,26 @@ def validate_figi(v: str | None) -> str | None:
     return v
 
 
+_object_setattr = object.__setattr__
+
+_M = TypeVar("_M", bound=BaseModel)
+
+
+def _construct(cls: type[_M], values: dict[str, Any], fields_set: set[str]) -> _M:
+    """
+    Builds a model from already-validated values, skipping pydantic entirely.
+
+    Equivalent to `cls.model_construct(**values)` for models without private attributes
+    or extras when `values` holds every field, but several times cheaper in hot loops.
+    """
+    obj = cls.__new__(cls)
+    _object_setattr(obj, "__dict__", values)
+    _object_setattr(obj, "__pydantic_fields_set__", fields_set)
+    _object_setattr(obj, "__pydantic_extra__", None)
+    _object_setattr(obj, "__pydantic_private__", None)
+    return obj
+
+
 FlexibleDate: TypeAlias = Annotated[date, BeforeValidator(parse_date)]
 FlexibleDatetime: TypeAlias = Annotated[datetime, BeforeValidator(parse_datetime)]
 
@@ -135,6 +176,15 @@ class HistoryPeriod(str, Enum):
     MAX = "max"
 
 
+class MergePolicy(str, Enum):
+    """
+    Which candle wins when merged histories share a timestamp.
+    """
+
+    KEEP_NEWER = "newer"
+    KEEP_OLDER = "older"
+
+
 class Price(RootModel[float]):
     """
     Strict Value Object for prices to avoid primitive obsession everywhere.
@@ -221,6 +271,13 @@ class Symbol(RootModel[str]):
     def value(self) -> str:
         return self.root
 
+    @property
+    def parts(self) -> ParsedSymbol:
+        """Ticker and exchange of a colon-qualified symbol (`AAPL:NSQ`); see `parse_symbol`."""
+        from .symbols import parse_symbol  # noqa: PLC0415
+
+        return parse_symbol(self.root)
+
     def __str__(self) -> str:
         return self.root
 
@@ -273,6 +330,25 @@ class CurrencyCode(RootModel[Currency]):
         return str(self.root)
 
 
+# The classes' compiled pydantic-core validators, bound once. `new_price(1.5)` returns
+# the same validated Price as `Price(1.5)` at about half the cost, skipping the
+# Python-level `RootModel.__init__`; meant for hot loops creating millions of values.
+new_price: Callable[[Price.Input], Price] = Price.__pydantic_validator__.validate_python
+new_symbol: Callable[[Symbol.Input], Symbol] = Symbol.__pydantic_validator__.validate_python
+new_date: Callable[[StrictDate.Input], StrictDate] = (
+    StrictDate.__pydantic_validator__.validate_python
+)
+
+
+def _to_price(v: Price.Input) -> Price:
+    # An exact type check: isinstance against a pydantic model is comparatively slow
+    return v if type(v) is Price else new_price(v)
+
+
+def _to_symbol(v: Symbol.Input) -> Symbol:
+    return v if type(v) is Symbol else new_symbol(v)
+
+
 class PriceVerificationError(Exception):
     """
     Exception raised when price verification fails.
@@ -291,24 +367,12 @@ class PriceVerificationError(Exception):
         source: str | None = None,
     ):
         super().__init__(message)
-        self.symbol = symbol if isinstance(symbol, Symbol) else Symbol(symbol)
+        self.symbol = _to_symbol(symbol)
         self.actual_date = parse_date(actual_date)
-        self.expected_price = (
-            expected_price if isinstance(expected_price, Price) else Price(expected_price)
-        )
-        self.actual_low = (
-            actual_low if isinstance(actual_low, Price) or actual_low is None else Price(actual_low)
-        )
-        self.actual_high = (
-            actual_high
-            if isinstance(actual_high, Price) or actual_high is None
-            else Price(actual_high)
-        )
-        self.actual_close = (
-            actual_close
-            if isinstance(actual_close, Price) or actual_close is None
-            else Price(actual_close)
-        )
+        self.expected_price = _to_price(expected_price)
+        self.actual_low = None if actual_low is None else _to_price(actual_low)
+        self.actual_high = None if actual_high is None else _to_price(actual_high)
+        self.actual_close = None if actual_close is None else _to_price(actual_close)
         self.source = source
 
     def __str__(self) -> str:
@@ -364,6 +428,42 @@ class OHLCV(BaseModel):
     model_config = ConfigDict(validate_assignment=True)
 
 
+def _sorted_by_date(candles: list[OHLCV]) -> list[OHLCV]:
+    if all(a.date <= b.date for a, b in zip(candles, candles[1:], strict=False)):
+        return candles
+    return sorted(candles, key=lambda c: c.date)
+
+
+def merge_candles(
+    older: list[OHLCV], newer: list[OHLCV], policy: MergePolicy = MergePolicy.KEEP_NEWER
+) -> list[OHLCV]:
+    """
+    Merges two candle lists into one sorted by date with unique timestamps.
+
+    Inputs that are already sorted (the usual case) are merged in linear time. On a
+    timestamp conflict `policy` decides whether the candle from `newer` or `older`
+    is kept; duplicates within one list resolve the same way by position.
+    """
+    older, newer = _sorted_by_date(older), _sorted_by_date(newer)
+    keep_newer = MergePolicy(policy) is MergePolicy.KEEP_NEWER
+    merged: list[OHLCV] = []
+    i = j = 0
+    while i < len(older) or j < len(newer):
+        # Ties take the older candle first so the newer one arrives second
+        if j == len(newer) or (i < len(older) and older[i].date <= newer[j].date):
+            candle = older[i]
+            i += 1
+        else:
+            candle = newer[j]
+            j += 1
+        if merged and merged[-1].date == candle.date:
+            if keep_newer:
+                merged[-1] = candle
+        else:
+            merged.append(candle)
+    return merged
+
+
 class History(BaseModel):
     """
     Represents a collection of historical price data.
@@ -372,6 +472,64 @@ class History(BaseModel):
     security: Security
     candles: list[OHLCV]
 
+    @classmethod
+    def from_columns(cls, security: Security, columns: OHLCVColumns) -> History:
+        """
+        Builds a History from columnar data without re-validating the candles.
+        """
+        return _construct(
+            cls, {"security": security, "candles": columns.to_candles()}, {"security", "candles"}
+        )
+
+    def merge(self, other: History, policy: MergePolicy = MergePolicy.KEEP_NEWER) -> History:
+        """
+        Combines this history with `other` for the same security.
+
+        Candles from `other` count as newer. Existing candle instances are reused,
+        so nothing is re-validated.
+        """
+        if other.security.symbol != self.security.symbol:
+            raise ValueError(
+                f"Cannot merge history of {other.security.symbol} into {self.security.symbol}"
+            )
+        return self.append(other.candles, policy)
+
+    def append(
+        self, candles: Iterable[OHLCV], policy: MergePolicy = MergePolicy.KEEP_NEWER
+    ) -> History:
+        """
+        Returns a new History with `candles` merged in by date.
+
+        Only incoming values that are not OHLCV instances are validated.
+        """
+        incoming = [c if isinstance(c, OHLCV) else OHLCV.model_validate(c) for c in candles]
+        return _construct(
+            type(self),
+            {"security": self.security, "candles": merge_candles(self.candles, incoming, policy)},
+            {"security", "candles"},
+        )
+
+    def adjust(self, actions: CorporateActions, dividends: bool = True) -> History:
+        """
+        Returns a new History with prices and volumes adjusted for splits and dividends.
+
+        Factors are computed for all candles at once; see `AdjustedColumns`.
+        Pass `dividends=False` for split-only adjustment.
+        """
+        from .actions import adjust_history  # noqa: PLC0415
+
+        return adjust_history(self, actions, dividends)
+
+    def to_columns(self, policy: StoragePolicy | None = None) -> OHLCVColumns:
+        """
+        Converts the candles to columnar form (one NumPy array per field).
+
+        `policy` selects compact float32 or fixed-point storage per field.
+        """
+        from .columns import OHLCVColumns  # noqa: PLC0415
+
+        return OHLCVColumns.from_candles(self.candles, policy)
+
     def to_pandas(self) -> pd.DataFrame:
         """
         Converts the history to a Pandas DataFrame indexed by Date.
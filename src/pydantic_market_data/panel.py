@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from functools import reduce
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+from .columns import FIELDS, PRICE_FIELDS, TITLES, OHLCVColumns
+from .models import History, Security
+
+
+def ffill_2d(values: np.ndarray, limit: int | None = None) -> np.ndarray:
+    """
+    Forward-fills NaNs down each column of a (T, N) array.
+
+    At most `limit` consecutive NaNs are filled after each valid value.
+    """
+    rows = np.arange(values.shape[0])[:, None]
+    last_valid = np.where(np.isnan(values), 0, rows)
+    np.maximum.accumulate(last_valid, axis=0, out=last_valid)
+    filled = np.take_along_axis(values, last_valid, axis=0)
+    if limit is not None:
+        filled[(rows - last_valid > limit) & np.isnan(values)] = np.nan
+    return filled
+
+
+class HistoryPanel:
+    """
+    Histories of N securities aligned on one shared timestamp index.
+
+    Each field (open, high, low, close, volume) is a single (T, N) float64 array with
+    NaN where a security has no candle, so cross-sectional work needs no per-security
+    DataFrames and no concatenation.
+    """
+
+    def __init__(
+        self,
+        index: pd.DatetimeIndex,
+        securities: Sequence[Security],
+        data: Mapping[str, np.ndarray],
+    ):
+        self.index = pd.DatetimeIndex(index).rename("Date")
+        self.securities = list(securities)
+        self.symbols = [str(s.symbol) for s in self.securities]
+        if len(set(self.symbols)) != len(self.symbols):
+            raise ValueError("HistoryPanel symbols must be unique")
+        shape = (len(self.index), len(self.securities))
+        self._data: dict[str, np.ndarray] = {}
+        for field in FIELDS:
+            values = np.asarray(data[field], dtype=np.float64)
+            if values.shape != shape:
+                raise ValueError(f"Field {field!r} has shape {values.shape}, expected {shape}")
+            self._data[field] = values
+
+    @classmethod
+    def from_histories(
+        cls,
+        histories: Iterable[History],
+        join: Literal["outer", "inner"] = "outer",
+        fill: Literal["ffill"] | None = None,
+        fill_limit: int | None = None,
+    ) -> HistoryPanel:
+        """
+        Aligns histories on the union ("outer") or intersection ("inner") of their dates.
+
+        With `fill="ffill"` price fields are forward-filled over the gaps the alignment
+        introduces; volume is left missing.
+        """
+        histories = list(histories)
+        columns = [h.to_columns() for h in histories]
+        for i, c in enumerate(columns):
+            if c.index.has_duplicates:
+                # Keep the last candle per timestamp, like a dict keyed on date
+                columns[i] = c.take(np.flatnonzero(~c.index.duplicated(keep="last")))
+        index = cls._align([c.index for c in columns], join)
+
+        data = {field: np.full((len(index), len(columns)), np.nan) for field in FIELDS}
+        for j, c in enumerate(columns):
+            positions = index.get_indexer(c.index)
+            present = positions >= 0
+            for field in FIELDS:
+                data[field][positions[present], j] = c[field][present]
+
+        panel = cls(index, [h.security for h in histories], data)
+        if fill == "ffill":
+            return panel.ffill(fill_limit)
+        return panel
+
+    @staticmethod
+    def _align(
+        indexes: list[pd.DatetimeIndex], join: Literal["outer", "inner"]
+    ) -> pd.DatetimeIndex:
+        if not indexes:
+            return pd.DatetimeIndex([])
+        if join == "outer":
+            return reduce(lambda a, b: a.union(b), indexes).sort_values()
+        if join == "inner":
+            return reduce(lambda a, b: a.intersection(b), indexes).sort_values()
+        raise ValueError(f"Unknown join: {join!r}")
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self._data[field]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.index), len(self.securities)
+
+    def ffill(self, limit: int | None = None, fields: Sequence[str] = PRICE_FIELDS) -> HistoryPanel:
+        """Forward-fills the given fields along the time axis."""
+        data = {f: ffill_2d(v, limit) if f in fields else v for f, v in self._data.items()}
+        return HistoryPanel(self.index, self.securities, data)
+
+    def field_frame(self, field: str) -> pd.DataFrame:
+        """One field as a Date x symbol DataFrame sharing the panel's memory."""
+        return pd.DataFrame(self._data[field], index=self.index, columns=self.symbols, copy=False)
+
+    def column(self, symbol: str) -> OHLCVColumns:
+        j = self.symbols.index(symbol)
+        return OHLCVColumns(self.index, {f: v[:, j] for f, v in self._data.items()})
+
+    def history(self, symbol: str, dropna: bool = True) -> History:
+        """Extracts one security as a History, skipping dates where it has no data."""
+        columns = self.column(symbol)
+        if dropna:
+            has_data = ~np.all(np.isnan(np.column_stack([columns[f] for f in FIELDS])), axis=1)
+            columns = columns.take(np.flatnonzero(has_data))
+        return History.from_columns(self.securities[self.symbols.index(symbol)], columns)
+
+    def to_pandas(self) -> pd.DataFrame:
+        """
+        Wide DataFrame indexed by Date with (field, symbol) MultiIndex columns.
+
+        Field names use the Title Case of History.to_pandas().
+        """
+        columns = pd.MultiIndex.from_product(
+            [[TITLES[f] for f in FIELDS], self.symbols], names=["Field", "Symbol"]
+        )
+        values = np.concatenate([self._data[f] for f in FIELDS], axis=1)
+        return pd.DataFrame(values, index=self.index, columns=columns, copy=False)
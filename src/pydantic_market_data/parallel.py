@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Any, Literal, TypeVar
+
+import numpy as np
+import pandas as pd
+
+from .columns import FIELDS, TITLES, OHLCVColumns
+from .models import History, Security
+
+_T = TypeVar("_T")
+
+ParquetCompression = Literal["snappy", "gzip", "brotli", "lz4", "zstd"]
+
+
+class PackedHistories:
+    """
+    Candles of many histories packed into one shared memory block.
+
+    The block holds a (5, N) float64 array of fields followed by N int64 nanosecond
+    timestamps (UTC for timezone-aware histories); history i occupies positions
+    `bounds[i]:bounds[i + 1]`. Worker processes attach to the block by name, so
+    candles cross the process boundary as raw bytes instead of pickled models.
+    """
+
+    def __init__(self, histories: Sequence[History]):
+        columns = [h.to_columns() for h in histories]
+        self.bounds = [0, *accumulate(len(c) for c in columns)]
+        self.dtypes = [str(c.index.dtype) for c in columns]
+        self.size = self.bounds[-1]
+        self._shm = SharedMemory(create=True, size=max(1, 6 * 8 * self.size))
+        try:
+            values, stamps = _views(self._shm, self.size)
+            for c, start, stop in zip(columns, self.bounds, self.bounds[1:], strict=False):
+                for i, field in enumerate(FIELDS):
+                    values[i, start:stop] = c[field]
+                stamps[start:stop] = c.index.as_unit("ns").asi8  # type: ignore[attr-defined]
+            del values, stamps
+        except BaseException:
+            self.close()
+            raise
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def __len__(self) -> int:
+        return len(self.dtypes)
+
+    def columns(self, i: int) -> OHLCVColumns:
+        """History i as OHLCVColumns copied out of the block."""
+        return _unpack(self._shm, self.size, self.bounds[i], self.bounds[i + 1], self.dtypes[i])
+
+    def task(self, i: int) -> tuple[str, int, int, int, str]:
+        return self.name, self.size, self.bounds[i], self.bounds[i + 1], self.dtypes[i]
+
+    def close(self) -> None:
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> PackedHistories:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _views(shm: SharedMemory, size: int) -> tuple[np.ndarray, np.ndarray]:
+    values = np.ndarray((len(FIELDS), size), dtype=np.float64, buffer=shm.buf)
+    stamps = np.ndarray((size,), dtype=np.int64, buffer=shm.buf, offset=len(FIELDS) * 8 * size)
+    return values, stamps
+
+
+def _unpack(shm: SharedMemory, size: int, start: int, stop: int, dtype: str) -> OHLCVColumns:
+    # Copies, so the caller may close the block while the columns are alive
+    values, stamps = _views(shm, size)
+    index = pd.DatetimeIndex(stamps[start:stop].astype("datetime64[ns]"))
+    if "," in dtype:  # timezone-aware, stored as UTC
+        index = index.tz_localize("UTC")
+    index = pd.DatetimeIndex(index.astype(dtype))
+    data = {f: values[i, start:stop].copy() for i, f in enumerate(FIELDS)}
+    del values, stamps
+    return OHLCVColumns(index, data)
+
+
+def _run(
+    func: Callable[..., _T],
+    tasks: list[tuple[str, int, int, int, str]],
+    securities: list[Security],
+    args: tuple,
+) -> list[_T]:
+    """Worker entry point: attaches to the block once per chunk of histories."""
+    name, size = tasks[0][0], tasks[0][1]
+    shm = SharedMemory(name=name)
+    try:
+        return [
+            func(_unpack(shm, size, start, stop, dtype), security, *args)
+            for (_, _, start, stop, dtype), security in zip(tasks, securities, strict=True)
+        ]
+    finally:
+        shm.close()
+
+
+def map_columns(
+    func: Callable[..., _T],
+    histories: Iterable[History],
+    *args: Any,
+    max_workers: int | None = None,
+    chunksize: int = 16,
+) -> list[_T]:
+    """
+    Calls `func(columns, security, *args)` for every history on a process pool.
+
+    Histories are packed into shared memory once in this process; workers rebuild
+    each one as OHLCVColumns, and only the (small) Security models are pickled.
+    `func` and its results must be picklable (a module-level function). Results
+    are returned in input order.
+    """
+    histories = list(histories)
+    with PackedHistories(histories) as packed:
+        starts = range(0, len(packed), chunksize)
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(
+                    _run,
+                    func,
+                    [packed.task(i) for i in range(start, min(start + chunksize, len(packed)))],
+                    [h.security for h in histories[start : start + chunksize]],
+                    args,
+                )
+                for start in starts
+            ]
+            return [result for future in futures for result in future.result()]
+
+
+def histories_to_pandas(histories: Iterable[History]) -> list[pd.DataFrame]:
+    """
+    Same DataFrames as calling `History.to_pandas()` on each history, built in bulk.
+
+    Each DataFrame is built from the history's columns, skipping the per-candle
+    `model_dump()`. This runs in the calling process: reading the candles is the
+    costly step and needs the models themselves, which a pool would have to pickle.
+    As with `to_pandas()`, a field missing from every candle is an object column
+    of None, and one missing from only some candles is float64 with NaN.
+    """
+    frames = []
+    for history in histories:
+        if not history.candles:
+            frames.append(pd.DataFrame())
+            continue
+        frame = history.to_columns().to_pandas()
+        for field in FIELDS:
+            # NaN in the columns is either a missing value or a NaN price
+            if np.isnan(frame[TITLES[field]].to_numpy()).all() and all(
+                getattr(c, field) is None for c in history.candles
+            ):
+                frame[TITLES[field]] = np.full(len(frame), None, dtype=object)
+        frames.append(frame)
+    return frames
+
+
+def parquet_filename(security: Security) -> str:
+    """`<symbol>.parquet` with characters unsafe in file names replaced by `_`."""
+    return re.sub(r"[^A-Za-z0-9._-]", "_", str(security.symbol)) + ".parquet"
+
+
+def _write_parquet(
+    columns: OHLCVColumns,
+    security: Security,
+    directory: str,
+    compression: ParquetCompression | None,
+) -> Path:
+    path = Path(directory) / parquet_filename(security)
+    columns.to_pandas().to_parquet(path, compression=compression)
+    return path
+
+
+def write_parquet(
+    histories: Iterable[History],
+    directory: str | Path,
+    compression: ParquetCompression | None = "snappy",
+    max_workers: int | None = None,
+) -> list[Path]:
+    """
+    Writes each history to `directory/<symbol>.parquet` using a process pool.
+
+    Encoding and compression run in the workers. Requires `pyarrow`
+    (`pip install pydantic-market-data[parquet]`).
+    """
+    histories = list(histories)
+    names = [parquet_filename(h.security) for h in histories]
+    if len(set(names)) != len(names):
+        raise ValueError("Histories must have distinct symbols to be written to one directory")
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    return map_columns(
+        _write_parquet, histories, str(directory), compression, max_workers=max_workers
+    )
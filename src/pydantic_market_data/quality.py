@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from enum import Enum
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, ConfigDict
+
+from .calendars import TradingCalendar, get_calendar
+from .columns import FIELDS, PRICE_FIELDS, OHLCVColumns
+from .models import History, HistoryInterval
+from .panel import HistoryPanel
+
+
+class IssueKind(str, Enum):
+    GAP = "gap"
+    DUPLICATE = "duplicate"
+    UNSORTED = "unsorted"
+    MISSING_CLOSE = "missing_close"
+    NON_POSITIVE = "non_positive"
+    HIGH_BELOW_LOW = "high_below_low"
+    OPEN_OUT_OF_RANGE = "open_out_of_range"
+    CLOSE_OUT_OF_RANGE = "close_out_of_range"
+    ZERO_VOLUME = "zero_volume"
+    OUTLIER = "outlier"
+
+
+class QualityIssue(BaseModel):
+    """
+    One problem found at one candle.
+
+    For gaps `date` is the first candle after the gap and `value` the number of
+    missing intervals; for outliers `value` is the robust z-score of the return.
+    """
+
+    kind: IssueKind
+    date: datetime
+    value: float | None = None
+
+    model_config = ConfigDict(frozen=True)
+
+
+class QualityReport(BaseModel):
+    symbol: str
+    candles: int
+    issues: list[QualityIssue]
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+    @property
+    def counts(self) -> dict[IssueKind, int]:
+        return dict(Counter(issue.kind for issue in self.issues))
+
+
+# Fixed-length intervals; daily, weekly and monthly ones are handled by _missing_intervals
+_STEPS = {
+    HistoryInterval.IM1: pd.Timedelta(minutes=1),
+    HistoryInterval.IM2: pd.Timedelta(minutes=2),
+    HistoryInterval.IM5: pd.Timedelta(minutes=5),
+    HistoryInterval.IM15: pd.Timedelta(minutes=15),
+    HistoryInterval.IM30: pd.Timedelta(minutes=30),
+    HistoryInterval.IM60: pd.Timedelta(minutes=60),
+    HistoryInterval.IM90: pd.Timedelta(minutes=90),
+    HistoryInterval.H1: pd.Timedelta(hours=1),
+}
+_MONTHS = {HistoryInterval.MO1: 1, HistoryInterval.MO3: 3}
+
+
+def _missing_intervals(
+    index: pd.DatetimeIndex, interval: HistoryInterval, calendar: TradingCalendar | None = None
+) -> np.ndarray:
+    """
+    Number of expected candles missing before each candle of a sorted, unique index.
+
+    Daily intervals count business days (sessions of `calendar` when given, so
+    exchange holidays are not gaps); intraday gaps only count within a session
+    day, so overnight and weekend breaks are not reported.
+    """
+    missing = np.zeros(len(index), dtype=np.int64)
+    if len(index) < 2:
+        return missing
+    prev, curr = index[:-1], index[1:]
+    if interval in _STEPS:
+        steps = (curr - prev) // _STEPS[interval]
+        same_day = prev.normalize() == curr.normalize()
+        missing[1:] = np.where(same_day, np.maximum(steps - 1, 0), 0)
+    elif interval in (HistoryInterval.D1, HistoryInterval.D5):
+        days = np.busday_count(
+            prev.values.astype("datetime64[D]"),
+            curr.values.astype("datetime64[D]"),
+            busdaycal=(calendar or get_calendar()).busdaycalendar,
+        )
+        per_candle = 1 if interval is HistoryInterval.D1 else 5
+        missing[1:] = np.maximum(days // per_candle - 1, 0)
+    elif interval is HistoryInterval.W1:
+        weeks = (curr.normalize() - prev.normalize()).days.to_numpy() // 7
+        missing[1:] = np.maximum(weeks - 1, 0)
+    else:
+        months = (curr.year - prev.year) * 12 + (curr.month - prev.month)
+        missing[1:] = np.maximum(np.asarray(months) // _MONTHS[interval] - 1, 0)
+    return missing
+
+
+def _robust_z(values: np.ndarray) -> np.ndarray:
+    """|x - median| / (1.4826 * MAD), or zeros when the spread is degenerate."""
+    finite = values[np.isfinite(values)]
+    if len(finite) < 3:
+        return np.zeros_like(values)
+    median = np.median(finite)
+    mad = 1.4826 * np.median(np.abs(finite - median))
+    if mad == 0:
+        return np.zeros_like(values)
+    with np.errstate(invalid="ignore"):
+        return np.abs(values - median) / mad
+
+
+def _scan(
+    index: pd.DatetimeIndex,
+    data: Mapping[str, np.ndarray],
+    symbols: list[str],
+    interval: HistoryInterval | None,
+    outlier_threshold: float | None,
+    calendar: TradingCalendar | None,
+) -> list[QualityReport]:
+    """Scans (T, N) field arrays; rows where a security has no values at all are ignored."""
+    open_, high, low, close, volume = (data[f] for f in FIELDS)
+    present = ~np.all(np.isnan(np.stack([data[f] for f in FIELDS])), axis=0)
+
+    with np.errstate(invalid="ignore"):
+        masks = {
+            IssueKind.MISSING_CLOSE: present & np.isnan(close),
+            IssueKind.NON_POSITIVE: np.any(np.stack([data[f] for f in PRICE_FIELDS]) <= 0, axis=0),
+            IssueKind.HIGH_BELOW_LOW: high < low,
+            IssueKind.OPEN_OUT_OF_RANGE: (open_ > high) | (open_ < low),
+            IssueKind.CLOSE_OUT_OF_RANGE: (close > high) | (close < low),
+            IssueKind.ZERO_VOLUME: volume == 0,
+        }
+
+    dates = index.to_pydatetime()
+    stamps = index.asi8  # type: ignore[attr-defined]
+    reports = []
+    for j, symbol in enumerate(symbols):
+        rows = np.flatnonzero(present[:, j])
+        issues: list[tuple[IssueKind, int, float | None]] = [
+            (kind, int(i), None) for kind, mask in masks.items() for i in np.flatnonzero(mask[:, j])
+        ]
+
+        col_index = index[rows]
+        if col_index.has_duplicates:
+            dup = col_index.duplicated(keep="first")
+            issues += [(IssueKind.DUPLICATE, int(i), None) for i in rows[dup]]
+        deltas = np.diff(stamps[rows])
+        if (deltas < 0).any():
+            issues += [(IssueKind.UNSORTED, int(i), None) for i in rows[1:][deltas < 0]]
+
+        # Gaps and returns are measured on the sorted, de-duplicated candles
+        order = rows[np.argsort(stamps[rows], kind="stable")]
+        order = order[~index[order].duplicated(keep="last")]
+        if interval is not None:
+            missing = _missing_intervals(index[order], interval, calendar)
+            issues += [
+                (IssueKind.GAP, int(order[k]), float(missing[k])) for k in np.flatnonzero(missing)
+            ]
+        if outlier_threshold is not None and len(order) > 1:
+            c = close[order, j]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                rets = np.log(c[1:] / c[:-1])
+            z = _robust_z(rets)
+            issues += [
+                (IssueKind.OUTLIER, int(order[k + 1]), float(z[k]))
+                for k in np.flatnonzero(z > outlier_threshold)
+            ]
+
+        issues.sort(key=lambda issue: issue[1])
+        reports.append(
+            QualityReport(
+                symbol=symbol,
+                candles=len(rows),
+                issues=[QualityIssue(kind=k, date=dates[i], value=v) for k, i, v in issues],
+            )
+        )
+    return reports
+
+
+def scan_history(
+    history: History | OHLCVColumns,
+    interval: HistoryInterval | None = HistoryInterval.D1,
+    outlier_threshold: float | None = 10.0,
+    symbol: str | None = None,
+    calendar: TradingCalendar | None = None,
+) -> QualityReport:
+    """
+    Checks one history for gaps, duplicates, OHLC inconsistencies and return outliers.
+
+    Pass `interval=None` to skip gap detection or `outlier_threshold=None` to skip
+    the outlier check (robust z-score of log returns). With a `calendar` (see
+    `get_calendar`) daily gaps skip that exchange's holidays.
+    """
+    if isinstance(history, History):
+        symbol = symbol or str(history.security.symbol)
+        columns = history.to_columns()
+    else:
+        columns = history
+    data = {f: columns[f][:, None] for f in FIELDS}
+    return _scan(columns.index, data, [symbol or ""], interval, outlier_threshold, calendar)[0]
+
+
+def scan_panel(
+    panel: HistoryPanel,
+    interval: HistoryInterval | None = HistoryInterval.D1,
+    outlier_threshold: float | None = 10.0,
+    calendar: TradingCalendar | None = None,
+) -> dict[str, QualityReport]:
+    """Scans every security of a panel at once, keyed by symbol."""
+    data = {f: panel[f] for f in FIELDS}
+    reports = _scan(panel.index, data, panel.symbols, interval, outlier_threshold, calendar)
+    return {r.symbol: r for r in reports}
+
+
+def scan_histories(
+    histories: Iterable[History],
+    interval: HistoryInterval | None = HistoryInterval.D1,
+    outlier_threshold: float | None = 10.0,
+    max_workers: int | None = None,
+    calendar: TradingCalendar | None = None,
+) -> list[QualityReport]:
+    """Scans independent histories concurrently, returning reports in input order."""
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(
+            pool.map(
+                lambda h: scan_history(h, interval, outlier_threshold, calendar=calendar),
+                list(histories),
+            )
+        )
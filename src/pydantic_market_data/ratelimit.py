@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from .interfaces import DataSource
+from .wrappers import DataSourceWrapper
+
+
+class RateLimit(BaseModel):
+    """
+    Token bucket settings: `rate` calls per second with bursts of up to `burst` calls.
+    """
+
+    rate: float = Field(gt=0)
+    burst: float = Field(default=1.0, ge=1)
+
+    model_config = ConfigDict(frozen=True)
+
+
+class RetryPolicy(BaseModel):
+    """
+    Retry settings for transient errors, using exponential backoff with full jitter.
+    """
+
+    max_attempts: int = Field(default=3, ge=1)
+    base_delay: float = Field(default=0.5, ge=0)
+    max_delay: float = Field(default=30.0, ge=0)
+    retry_on: tuple[type[BaseException], ...] = (TimeoutError, ConnectionError)
+
+    model_config = ConfigDict(frozen=True)
+
+    def backoff(self, attempt: int, rng: random.Random) -> float:
+        """Delay before retrying after failed attempt number `attempt` (1-based)."""
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return rng.uniform(0, ceiling)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with FIFO reservations.
+
+    Callers reserve tokens under the lock and sleep outside of it: the balance may go
+    negative, so waiters are served in arrival order at exactly the configured rate.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive: {rate}")
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Reserves tokens and returns how many seconds to wait before using them."""
+        if tokens > self.burst:
+            raise ValueError(f"Cannot reserve {tokens} tokens from a bucket of {self.burst}")
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Blocks until the tokens are available. Returns the time spent waiting."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """Holds back every caller for at least `seconds` (e.g. on a vendor Retry-After)."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+class RateLimitedDataSource(DataSourceWrapper):
+    """
+    DataSource wrapper enforcing token bucket rate limits and retrying transient errors.
+
+    `limit` is shared by all methods (the vendor-wide quota), while `method_limits`
+    adds a separate bucket per method name. A call waits on both when both apply.
+    Exceptions carrying a `retry_after` attribute (seconds) pause the buckets so
+    queued callers back off together instead of hammering the vendor.
+    """
+
+    def __init__(
+        self,
+        source: DataSource,
+        limit: RateLimit | None = None,
+        method_limits: Mapping[str, RateLimit] | None = None,
+        retry: RetryPolicy | None = None,
+        *,
+        seed: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        super().__init__(source)
+        self.retry = retry or RetryPolicy()
+        self._sleep = sleep
+        self._rng = random.Random(seed)  # nosec B311 - jitter, not cryptography
+        self._shared = TokenBucket(limit.rate, limit.burst, clock, sleep) if limit else None
+        self._buckets = {
+            method: TokenBucket(m.rate, m.burst, clock, sleep)
+            for method, m in (method_limits or {}).items()
+        }
+
+    def _limiters(self, method: str) -> list[TokenBucket]:
+        buckets = [self._buckets[method]] if method in self._buckets else []
+        if self._shared is not None:
+            buckets.append(self._shared)
+        return buckets
+
+    def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        limiters = self._limiters(method)
+        attempt = 1
+        while True:
+            for bucket in limiters:
+                bucket.acquire()
+            try:
+                return super()._call(method, *args, **kwargs)
+            except self.retry.retry_on as e:
+                if attempt >= self.retry.max_attempts:
+                    raise
+                delay = self.retry.backoff(attempt, self._rng)
+                retry_after = getattr(e, "retry_after", None)
+                if retry_after is not None:
+                    delay = max(delay, float(retry_after))
+                if retry_after is not None and limiters:
+                    # The next acquire() does the waiting, together with everyone queued
+                    for bucket in limiters:
+                        bucket.pause(delay)
+                else:
+                    self._sleep(delay)
+                attempt += 1
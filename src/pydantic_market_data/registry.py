@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
+
+from pydantic import BaseModel
+
+from .models import OHLCV, History, Security, Symbol, _construct
+
+
+def security_key(security: Security) -> str:
+    return str(security.symbol)
+
+
+class SecurityRegistry:
+    """
+    Shared, validated Security instances keyed by symbol.
+
+    Each security is validated once when it is added; histories built through the
+    registry reference that single instance instead of carrying their own copy.
+    """
+
+    def __init__(self, securities: Iterable[Security | Mapping[str, Any]] = ()):
+        self._securities: dict[str, Security] = {}
+        # JSON dumps of registered securities, made on first comparison with a mapping
+        self._dumps: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        for security in securities:
+            self.add(security)
+
+    def add(self, security: Security | Mapping[str, Any]) -> Security:
+        """
+        Registers a security (validating mappings) and returns the shared instance.
+
+        Re-adding an equal security returns the instance already registered; a
+        different security under the same symbol is an error. A mapping equal to
+        the registered instance's JSON dump (as in `dump_histories_json` output)
+        is accepted without validation; any other mapping is validated and compared.
+        """
+        if not isinstance(security, Security):
+            symbol = str(security.get("symbol"))
+            known = self._securities.get(symbol)
+            if known is not None and self._dump(symbol, known) == security:
+                return known
+            security = Security.model_validate(security)
+        key = security_key(security)
+        with self._lock:
+            known = self._securities.setdefault(key, security)
+        if known is not security and known != security:
+            raise ValueError(f"Security {key} is already registered with different details")
+        return known
+
+    def _dump(self, key: str, security: Security) -> dict[str, Any]:
+        dumped = self._dumps.get(key)
+        if dumped is None:
+            dumped = self._dumps[key] = security.model_dump(mode="json")
+        return dumped
+
+    def get(self, symbol: Symbol.Input) -> Security | None:
+        return self._securities.get(str(symbol))
+
+    def __getitem__(self, symbol: Symbol.Input) -> Security:
+        return self._securities[str(symbol)]
+
+    def __contains__(self, symbol: object) -> bool:
+        return str(symbol) in self._securities
+
+    def __len__(self) -> int:
+        return len(self._securities)
+
+    def __iter__(self) -> Iterator[Security]:
+        return iter(list(self._securities.values()))
+
+    def history(self, symbol: Symbol.Input, candles: Iterable[OHLCV]) -> History:
+        """History of a registered security, sharing its instance; candles are not copied."""
+        candles = [c if isinstance(c, OHLCV) else OHLCV.model_validate(c) for c in candles]
+        return _construct(
+            History, {"security": self[symbol], "candles": candles}, {"security", "candles"}
+        )
+
+    def intern(self, history: History) -> History:
+        """The same history pointing at the registry's instance of its security."""
+        security = self.add(history.security)
+        if security is history.security:
+            return history
+        return _construct(
+            History, {"security": security, "candles": history.candles}, {"security", "candles"}
+        )
+
+
+class HistoryRecord(BaseModel):
+    """A history whose security is given by its key in the batch security table."""
+
+    security: str
+    candles: list[OHLCV]
+
+
+class HistoryBatch(BaseModel):
+    """
+    Wire format for many histories: each security once, histories referencing it by key.
+    """
+
+    securities: list[Security]
+    histories: list[HistoryRecord]
+
+
+class _HistoryBatchInput(BaseModel):
+    # Securities stay raw until the registry decides whether they need validating
+    securities: list[dict[str, Any]]
+    histories: list[HistoryRecord]
+
+
+def dump_histories_json(histories: Iterable[History], indent: int | None = None) -> bytes:
+    """Serializes histories as a HistoryBatch, emitting each distinct security once."""
+    registry = SecurityRegistry()
+    records = []
+    for history in histories:
+        registry.add(history.security)
+        records.append(
+            _construct(
+                HistoryRecord,
+                {"security": security_key(history.security), "candles": history.candles},
+                {"security", "candles"},
+            )
+        )
+    batch = _construct(
+        HistoryBatch,
+        {"securities": list(registry), "histories": records},
+        {"securities", "histories"},
+    )
+    return batch.model_dump_json(indent=indent).encode()
+
+
+def load_histories_json(
+    data: bytes | str, registry: SecurityRegistry | None = None
+) -> list[History]:
+    """
+    Loads a HistoryBatch, validating each security at most once.
+
+    Securities already in `registry` are reused without validation when they match
+    the registered instance exactly; new ones are validated and added to it, and a
+    security differing from the registered one raises ValueError, as does a history
+    referencing a key that is neither in the batch nor in `registry`.
+    """
+    registry = registry if registry is not None else SecurityRegistry()
+    batch = _HistoryBatchInput.model_validate_json(data)
+    for security in batch.securities:
+        registry.add(security)
+    for record in batch.histories:
+        if record.security not in registry:
+            raise ValueError(f"History references unknown security {record.security}")
+    return [registry.history(record.security, record.candles) for record in batch.histories]
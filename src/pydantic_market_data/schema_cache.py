@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, get_args
+
+import pydantic
+import pydantic_core
+import pydantic_settings
+from pydantic import BaseModel
+
+from . import __version__
+
+_MEMO: dict[type[BaseModel], str] = {}
+
+_SKIPPED_MODULES = {"builtins", "typing", "pydantic", "pydantic_core", "pydantic_settings"}
+
+
+def schema_cache_dir() -> Path:
+    """
+    Directory of cached schemas for this package version.
+
+    `PYDANTIC_MARKET_DATA_CACHE_DIR` overrides the base directory (default
+    `$XDG_CACHE_HOME/pydantic-market-data`, i.e. `~/.cache/pydantic-market-data`).
+    """
+    base = os.environ.get("PYDANTIC_MARKET_DATA_CACHE_DIR")
+    if not base:
+        xdg = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        base = os.path.join(xdg, "pydantic-market-data")
+    return Path(base) / "schema" / __version__
+
+
+def _sources(model: type[BaseModel]) -> set[str]:
+    """Source files of the model's bases and of every type its fields refer to."""
+    files: set[str] = set()
+    seen: set[int] = set()
+    pending: list[Any] = [model]
+    while pending:
+        tp = pending.pop()
+        if id(tp) in seen:
+            continue
+        seen.add(id(tp))
+        pending.extend(get_args(tp))
+        if not isinstance(tp, type):
+            continue
+        for cls in tp.__mro__:
+            # pydantic's own classes are covered by its version
+            if cls.__module__.partition(".")[0] in _SKIPPED_MODULES:
+                continue
+            try:
+                files.add(inspect.getfile(cls))
+            except TypeError:
+                continue
+            if issubclass(cls, BaseModel):
+                pending.extend(f.annotation for f in cls.model_fields.values())
+    return files
+
+
+def _fingerprint(model: type[BaseModel]) -> str:
+    """
+    Changes whenever the schema may change: pydantic, pydantic-core or pydantic-settings
+    version, or any source file involved.
+
+    Models defined outside this package (e.g. an app's settings class) would otherwise
+    serve a stale schema after an edit, since the package version stays the same.
+    Files of base classes and referenced field types (enums, nested models) count too.
+    """
+    parts = [
+        pydantic.VERSION,
+        pydantic_core.__version__,
+        pydantic_settings.__version__,
+        model.__module__,
+        model.__qualname__,
+    ]
+    for path in sorted(_sources(model)):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        parts += [path, str(stat.st_mtime_ns), str(stat.st_size)]
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()[:16]
+
+
+def _prefix(model: type[BaseModel]) -> str:
+    return f"{model.__module__}.{model.__qualname__}-"
+
+
+def _path(model: type[BaseModel]) -> Path:
+    return schema_cache_dir() / f"{_prefix(model)}{_fingerprint(model)}.json"
+
+
+def cached_json_schema(model: type[BaseModel]) -> str:
+    """
+    `model.model_json_schema()` rendered as indented JSON, memoized in-process and on disk.
+
+    The disk cache is best-effort: unreadable or unwritable cache directories
+    fall back to generating the schema.
+    """
+    text = _MEMO.get(model)
+    if text is not None:
+        return text
+    path = _path(model)
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError:
+        text = json.dumps(model.model_json_schema(), indent=2)
+        _write(path, text)
+        _prune(model, path)
+    _MEMO[model] = text
+    return text
+
+
+def _write(path: Path, text: str) -> None:
+    # Write-then-rename so concurrent CLI runs never read a partial file
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _prune(model: type[BaseModel], current: Path) -> None:
+    """Removes the model's files from older fingerprints and older package versions."""
+    try:
+        stale = [p for p in current.parent.glob(f"{_prefix(model)}*.json") if p != current]
+        stale += [
+            p
+            for version in current.parent.parent.iterdir()
+            if version != current.parent and version.is_dir()
+            for p in version.glob(f"{_prefix(model)}*.json")
+        ]
+        for path in stale:
+            path.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def precompute_schemas(models: Iterable[type[BaseModel]] | None = None) -> list[Path]:
+    """
+    Writes schema cache files ahead of time, e.g. from a post-install or image build step.
+
+    Defaults to the CLI models shipped with this package.
+    """
+    if models is None:
+        from .cli_batch import BatchArgs  # noqa: PLC0415
+        from .cli_models import HistoryArgs, SearchArgs  # noqa: PLC0415
+
+        models = (SearchArgs, HistoryArgs, BatchArgs)
+    paths = []
+    for model in models:
+        _MEMO.pop(model, None)
+        path = _path(model)
+        _write(path, json.dumps(model.model_json_schema(), indent=2))
+        _prune(model, path)
+        paths.append(path)
+    return paths
+
+
+if __name__ == "__main__":  # pragma: no cover
+    for written in precompute_schemas():
+        sys.stdout.write(f"{written}\n")
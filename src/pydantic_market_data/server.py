@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+import contextlib
+import errno
+import http.client
+import logging
+import os
+import socket
+import socketserver
+import stat
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from pydantic import ValidationError
+
+from .interfaces import DataSource
+from .wire import (
+    METHODS,
+    decode_call,
+    decode_error,
+    decode_result,
+    encode_call,
+    encode_error,
+    encode_result,
+)
+from .wrappers import _Dispatcher
+
+logger = logging.getLogger(__name__)
+
+# A filesystem path selects a Unix domain socket, a (host, port) pair selects TCP
+Address = str | os.PathLike[str] | tuple[str, int]
+
+# How often the serve loop checks for shutdown, bounding how long close() blocks
+_POLL_INTERVAL = 0.1
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps connections open, so a client pays the connect cost once
+    protocol_version = "HTTP/1.1"
+    server: _Server
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._reply(200, b'{"status":"ok"}')
+        else:
+            self._reply(404, encode_error(LookupError(f"Not found: {self.path}")))
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        method = self.path.strip("/")
+        if method not in METHODS:
+            self._reply(404, encode_error(LookupError(f"Unknown DataSource method: {method!r}")))
+            return
+        try:
+            args = decode_call(method, body)
+        except ValidationError as e:
+            self._reply(400, encode_error(ValueError(str(e))))
+            return
+        try:
+            result = getattr(self.server.source, method)(*args)
+            payload = encode_result(method, result)
+        except Exception as e:
+            logger.debug("%s%r failed: %r", method, args, e)
+            self._reply(500, encode_error(e))
+            return
+        self._reply(200, payload)
+
+    def _reply(self, status: int, payload: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # The default writes to stderr and needs a (host, port) client address
+        logger.debug(format, *args)
+
+
+class _TCPHandler(_Handler):
+    # Headers and body go out in separate writes; without TCP_NODELAY the
+    # second one waits for the client's delayed ACK
+    disable_nagle_algorithm = True
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    source: DataSource
+
+    def __init__(self, address: Any, handler: type[_Handler]):
+        super().__init__(address, handler)
+        self._connections: set[socket.socket] = set()
+        self._connections_lock = threading.Lock()
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        with self._connections_lock:
+            self._connections.add(request)
+        super().process_request(request, client_address)
+
+    def shutdown_request(self, request: Any) -> None:
+        with self._connections_lock:
+            self._connections.discard(request)
+        super().shutdown_request(request)
+
+    def close_connections(self) -> None:
+        """Disconnects kept-alive clients, whose handler threads outlive `shutdown()`."""
+        with self._connections_lock:
+            connections = list(self._connections)
+        for connection in connections:
+            with contextlib.suppress(OSError):
+                connection.shutdown(socket.SHUT_RDWR)
+
+
+class _UnixServer(_Server):
+    address_family = socket.AF_UNIX
+
+    def server_bind(self) -> None:
+        # HTTPServer.server_bind expects a (host, port) address
+        socketserver.TCPServer.server_bind(self)
+        self.server_name = "localhost"
+        self.server_port = 0
+
+
+def _remove_stale_socket(path: str) -> None:
+    """Deletes a socket file left behind by a server that is no longer running."""
+    try:
+        if not stat.S_ISSOCK(os.stat(path).st_mode):
+            return
+    except FileNotFoundError:
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(path)
+            return
+    raise OSError(errno.EADDRINUSE, f"Another server is listening on {path}")
+
+
+class DataSourceServer:
+    """
+    Hosts a DataSource for other processes, speaking the package's models as JSON over HTTP.
+
+    Every protocol method is served at `POST /<method>` with a JSON object of its
+    arguments (see the `wire` module); `GET /health` answers when the server is up.
+    Listens on a Unix domain socket when `address` is a path, or on TCP for a
+    (host, port) pair. Requests are handled on threads, so the wrapped source (and
+    any caches it holds) must be thread-safe; it stays warm for the server's lifetime.
+    """
+
+    def __init__(self, source: DataSource, address: Address):
+        self.source = source
+        self._server: _Server
+        if isinstance(address, tuple):
+            self._server = _Server(address, _TCPHandler)
+        else:
+            path = os.fspath(address)
+            _remove_stale_socket(path)
+            self._server = _UnixServer(path, _Handler)  # type: ignore[arg-type]
+        self._server.source = source
+        self._thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> Address:
+        """The bound address; for TCP this includes the port picked for port 0."""
+        address = self._server.server_address
+        if isinstance(address, tuple):
+            return str(address[0]), int(address[1])
+        return os.fsdecode(address)
+
+    def serve_forever(self) -> None:
+        """Serves requests in the calling thread until `close()` is called from another."""
+        self._server.serve_forever(poll_interval=_POLL_INTERVAL)
+
+    def start(self) -> DataSourceServer:
+        """Serves requests on a background daemon thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self.serve_forever, name="DataSourceServer", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+        self._server.close_connections()
+        if self._server.address_family == socket.AF_UNIX:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self._server.server_address)  # type: ignore[arg-type]
+
+    def __enter__(self) -> DataSourceServer:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float | None):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+        except BaseException:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class RemoteDataSource(_Dispatcher):
+    """
+    DataSource client for a DataSourceServer.
+
+    Each thread keeps its own persistent connection, so after the first call a
+    lookup costs one local round trip; `close()` closes the connections of all
+    threads. Errors raised by the remote source are
+    re-raised here: builtin exceptions and PriceVerificationError as themselves
+    (with `retry_after` preserved), anything else as `RemoteError`.
+    """
+
+    def __init__(self, address: Address, timeout: float | None = 30.0):
+        self.address = address
+        self.timeout = timeout
+        self._local = threading.local()
+        # Every open connection, whichever thread uses it
+        self._connections: set[http.client.HTTPConnection] = set()
+        self._lock = threading.Lock()
+
+    def _connect(self) -> http.client.HTTPConnection:
+        connection: http.client.HTTPConnection
+        if isinstance(self.address, tuple):
+            host, port = self.address
+            connection = http.client.HTTPConnection(host, port, timeout=self.timeout)
+        else:
+            connection = _UnixHTTPConnection(os.fspath(self.address), self.timeout)
+        with self._lock:
+            self._connections.add(connection)
+        return connection
+
+    def _connection(self) -> http.client.HTTPConnection:
+        connection: http.client.HTTPConnection | None = getattr(self._local, "connection", None)
+        with self._lock:
+            # Gone from the set when close() ran on another thread
+            if connection is not None and connection in self._connections:
+                return connection
+        connection = self._local.connection = self._connect()
+        return connection
+
+    def _drop(self) -> None:
+        """Closes the calling thread's connection."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            with self._lock:
+                self._connections.discard(connection)
+            connection.close()
+            self._local.connection = None
+
+    def _request(self, method: str, path: str, body: bytes | None = None) -> tuple[int, bytes]:
+        for attempt in range(2):
+            connection = self._connection()
+            try:
+                connection.request(method, path, body, {"Content-Type": "application/json"})
+                response = connection.getresponse()
+                return response.status, response.read()
+            except (ConnectionResetError, BrokenPipeError):
+                # Most likely a kept-alive connection the server has since closed
+                # (e.g. after a restart); all calls are reads, so retry once
+                self._drop()
+                if attempt:
+                    raise
+            except BaseException:
+                # A timeout or other failure mid-request leaves the connection
+                # half-used; later calls on this thread need a fresh one
+                self._drop()
+                raise
+        raise AssertionError("unreachable")
+
+    def _call(self, method: str, *args: Any) -> Any:
+        status, data = self._request("POST", f"/{method}", encode_call(method, *args))
+        if status != 200:
+            raise decode_error(data)
+        return decode_result(method, data)
+
+    def health(self) -> bool:
+        """True when the server answers its health check."""
+        try:
+            return self._request("GET", "/health")[0] == 200
+        except OSError:
+            return False
+
+    def close(self) -> None:
+        """Closes every connection; threads calling again open new ones."""
+        with self._lock:
+            connections, self._connections = self._connections, set()
+        for connection in connections:
+            connection.close()
+
+
+def serve(source: DataSource, address: Address) -> None:
+    """Runs a DataSourceServer in the foreground until interrupted (Ctrl+C)."""
+    server = DataSourceServer(source, address)
+    logger.info("Serving %s on %s", type(source).__name__, server.address)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
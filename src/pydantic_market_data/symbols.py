@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from enum import Enum
+from functools import lru_cache
+
+from pydantic import BaseModel, ConfigDict, field_validator
+
+# Distinct symbols remembered by the parse/render caches; plenty for a full universe
+CACHE_SIZE = 1 << 20
+
+
+class SymbolFormat(str, Enum):
+    """Vendor conventions for exchange-qualified symbols."""
+
+    COLON = "colon"  # AAPL:NSQ, VOD:LSE, BRK.B:NYQ (as in Security.symbol)
+    YAHOO = "yahoo"  # AAPL, VOD.L, BRK-B
+    BLOOMBERG = "bloomberg"  # AAPL UW Equity, VOD LN Equity, BRK/B UN Equity
+
+
+# name: (MIC, colon code, Yahoo suffix, Bloomberg exchange code, other aliases).
+# "US" is a US listing without a specific exchange, as Yahoo and Bloomberg's
+# composite code report it.
+_EXCHANGES: dict[str, tuple[str, str, str, str, tuple[str, ...]]] = {
+    "US": ("", "", "", "US", ()),
+    "NASDAQ": ("XNAS", "NSQ", "", "UW", ("NMS", "NGM", "NCM")),
+    "NYSE": ("XNYS", "NYQ", "", "UN", ()),
+    "AMEX": ("XASE", "ASQ", "", "UA", ("NYSE AMERICAN",)),
+    "LSE": ("XLON", "LSE", "L", "LN", ("LON",)),
+    "XETRA": ("XETR", "GER", "DE", "GY", ("ETR",)),
+    "PARIS": ("XPAR", "PAR", "PA", "FP", ("EPA",)),
+    "AMSTERDAM": ("XAMS", "AEX", "AS", "NA", ("AMS",)),
+    "TSX": ("XTSE", "TOR", "TO", "CT", ()),
+    "TSE": ("XTKS", "TYO", "T", "JT", ()),
+    "HKEX": ("XHKG", "HKG", "HK", "HK", ()),
+}
+
+# Exchange names, MICs, colon codes and aliases -> exchange name
+_NAMES = {
+    alias: name
+    for name, (mic, colon, _, _, aliases) in _EXCHANGES.items()
+    for alias in (name, mic, colon, *aliases)
+    if alias
+}
+_BY_COLON = {row[1]: name for name, row in _EXCHANGES.items() if row[1]}
+_BY_YAHOO = {row[2]: name for name, row in _EXCHANGES.items() if row[2]}
+_BY_BLOOMBERG = {row[3]: name for name, row in _EXCHANGES.items()}
+
+# Share classes follow a dot in tickers (BRK.B); Yahoo writes a hyphen (BRK-B)
+# and Bloomberg a slash (BRK/B)
+_YAHOO_CLASS = re.compile(r"-([A-Z])$")
+_BLOOMBERG_CLASS = re.compile(r"/([A-Z])$")
+_SHARE_CLASS = re.compile(r"\.([A-Z])$")
+_YELLOW_KEYS = {"EQUITY"}
+
+
+def normalize_exchange(exchange: str) -> str:
+    """Exchange name for a name, MIC or colon code (e.g. `XNAS` or `NSQ` -> `NASDAQ`)."""
+    key = exchange.strip().upper()
+    if key not in _NAMES:
+        raise ValueError(f"Unknown exchange: {exchange!r}")
+    return _NAMES[key]
+
+
+class ParsedSymbol(BaseModel):
+    """
+    A symbol split into its ticker and exchange.
+
+    The ticker is upper case with any share class after a dot (`BRK.B`); the
+    exchange is a name from the exchange table (`NASDAQ`, `LSE`, ...), `US` for a
+    US listing on an unspecified exchange, or None when the symbol is unqualified.
+    """
+
+    ticker: str
+    exchange: str | None = None
+
+    model_config = ConfigDict(frozen=True)
+
+    @field_validator("ticker")
+    @classmethod
+    def _check_ticker(cls, v: str) -> str:
+        v = v.strip().upper()
+        if not v or any(ch.isspace() or ch == ":" for ch in v):
+            raise ValueError(f"Invalid ticker: {v!r}")
+        return v
+
+    @field_validator("exchange")
+    @classmethod
+    def _check_exchange(cls, v: str | None) -> str | None:
+        return None if v is None else normalize_exchange(v)
+
+    @property
+    def mic(self) -> str | None:
+        """ISO 10383 market identifier code, if the exchange has one."""
+        if self.exchange is None:
+            return None
+        return _EXCHANGES[self.exchange][0] or None
+
+    def render(self, format: SymbolFormat | str = SymbolFormat.COLON) -> str:
+        return render_symbol(self, format)
+
+    def __str__(self) -> str:
+        return self.render()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_symbol(symbol: str, format: SymbolFormat | str = SymbolFormat.COLON) -> ParsedSymbol:
+    """
+    Splits a vendor symbol into ticker and exchange.
+
+    Results are memoized (and shared: ParsedSymbol is immutable), so parsing the
+    same symbols again is a dictionary lookup. Raises ValueError for malformed
+    symbols and exchange codes missing from the table.
+    """
+    format = SymbolFormat(format)
+    text = symbol.strip().upper()
+    exchange: str | None
+    if format is SymbolFormat.COLON:
+        ticker, colon, code = text.rpartition(":")
+        if not colon:
+            ticker, code = code, ""
+        exchange = _lookup(_BY_COLON, code, symbol, format) if code else None
+    elif format is SymbolFormat.YAHOO:
+        ticker, dot, suffix = text.rpartition(".")
+        if not dot:
+            ticker, suffix = suffix, ""
+        exchange = _lookup(_BY_YAHOO, suffix, symbol, format) if suffix else "US"
+        ticker = _YAHOO_CLASS.sub(r".\1", ticker)
+    else:
+        parts = text.split()
+        if parts and parts[-1] in _YELLOW_KEYS:
+            parts.pop()
+        if len(parts) != 2:
+            raise ValueError(f"Not a {format.value} symbol: {symbol!r}")
+        ticker = _BLOOMBERG_CLASS.sub(r".\1", parts[0])
+        exchange = _lookup(_BY_BLOOMBERG, parts[1], symbol, format)
+    return ParsedSymbol(ticker=ticker, exchange=exchange)
+
+
+def _lookup(table: dict[str, str], code: str, symbol: str, format: SymbolFormat) -> str:
+    if code not in table:
+        raise ValueError(f"Unknown {format.value} exchange code {code!r} in {symbol!r}")
+    return table[code]
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def render_symbol(symbol: ParsedSymbol, format: SymbolFormat | str = SymbolFormat.COLON) -> str:
+    """
+    The symbol in a vendor's convention (memoized).
+
+    Bloomberg symbols need an exchange; US exchanges have no Yahoo suffix, and an
+    unqualified or `US` symbol has no colon code either.
+    """
+    format = SymbolFormat(format)
+    ticker, exchange = symbol.ticker, symbol.exchange
+    if format is SymbolFormat.BLOOMBERG:
+        if exchange is None:
+            raise ValueError(f"{ticker} has no exchange to render a {format.value} symbol")
+        return f"{ticker.replace('.', '/')} {_EXCHANGES[exchange][3]} Equity"
+    if exchange is None:
+        return ticker
+    if format is SymbolFormat.YAHOO:
+        root = _SHARE_CLASS.sub(r"-\1", ticker)
+        suffix = _EXCHANGES[exchange][2]
+        return f"{root}.{suffix}" if suffix else root
+    code = _EXCHANGES[exchange][1]
+    return f"{ticker}:{code}" if code else ticker
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def translate_symbol(
+    symbol: str, source: SymbolFormat | str, target: SymbolFormat | str = SymbolFormat.COLON
+) -> str:
+    """A symbol in another vendor convention, e.g. `VOD.L` -> `VOD LN Equity` (memoized)."""
+    return render_symbol(parse_symbol(symbol, source), target)
+
+
+def translate_symbols(
+    symbols: Iterable[str],
+    source: SymbolFormat | str,
+    target: SymbolFormat | str = SymbolFormat.COLON,
+) -> list[str | None]:
+    """
+    `translate_symbol` over a universe, in input order.
+
+    Each distinct symbol is translated once; symbols that cannot be parsed or
+    rendered map to None instead of failing the batch.
+    """
+    symbols = list(symbols)
+    source, target = SymbolFormat(source), SymbolFormat(target)
+    table: dict[str, str | None] = {}
+    for symbol in dict.fromkeys(symbols):
+        try:
+            table[symbol] = translate_symbol(symbol, source, target)
+        except ValueError:
+            table[symbol] = None
+    return [table[symbol] for symbol in symbols]
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from .bulk import (
+    _DIGITS,
+    _FIGI_BODY,
+    _UPPER,
+    _figi_expected_digits,
+    _isin_luhn_totals,
+    load_securities,
+)
+from .calendars import get_calendar
+from .columns import OHLCVColumns
+from .models import History, HistoryInterval, HistoryPeriod, Security
+
+Seed = int | np.random.Generator | None
+
+TRADING_DAYS = 252
+
+# Synthetic listings: (exchange, country, currency); the ISIN prefix is the country
+_LISTINGS = [
+    ("NYSE", "US", "USD"),
+    ("NASDAQ", "US", "USD"),
+    ("LSE", "GB", "GBP"),
+    ("XETRA", "DE", "EUR"),
+]
+
+# Trading days per candle for daily and longer intervals
+_DAYS = {
+    HistoryInterval.D1: 1,
+    HistoryInterval.D5: 5,
+    HistoryInterval.W1: 5,
+    HistoryInterval.MO1: 21,
+    HistoryInterval.MO3: 63,
+}
+
+
+def _alphabet(chars: str) -> np.ndarray:
+    return np.array([ord(ch) for ch in chars], dtype=np.uint32)
+
+
+def _unique_codes(n: int, alphabet: str, width: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    (n, width) code points of n distinct random-looking strings over `alphabet`.
+
+    Row i spells `(offset + i * stride) mod len(alphabet)**width` in base
+    len(alphabet); a stride coprime with that modulus makes every row distinct.
+    """
+    base = len(alphabet)
+    space = base**width
+    if n > space:
+        raise ValueError(f"Cannot generate {n} distinct codes of width {width}")
+    # Bounded so that offset + i * stride stays within int64
+    stride = int(rng.integers(1, min(space, 2**62 // max(n, 1))))
+    while np.gcd(stride, space) != 1:
+        stride += 1
+    offset = int(rng.integers(0, space))
+    numbers = (offset + np.arange(n, dtype=np.int64) * stride) % space
+    digits = numbers[:, None] // base ** np.arange(width - 1, -1, -1, dtype=np.int64) % base
+    return np.asarray(_alphabet(alphabet)[digits])
+
+
+def _strings(points: np.ndarray) -> list[str]:
+    width = points.shape[1]
+    return list(np.ascontiguousarray(points, dtype=np.uint32).view(f"<U{width}").ravel().tolist())
+
+
+def generate_isins(n: int, countries: str | Sequence[str] = "US", seed: Seed = None) -> list[str]:
+    """
+    n distinct ISINs with valid check digits, e.g. for `load_securities` benchmarks.
+
+    `countries` is one prefix for all, or one prefix per ISIN.
+    """
+    rng = np.random.default_rng(seed)
+    prefixes = np.full(n, countries) if isinstance(countries, str) else np.asarray(countries)
+    if prefixes.shape != (n,):
+        raise ValueError(f"Expected {n} country prefixes, got {len(prefixes)}")
+    points = np.empty((n, 12), dtype=np.uint32)
+    points[:, :2] = np.asarray(prefixes, dtype="<U2").view(np.uint32).reshape(n, 2)
+    points[:, 2:11] = _unique_codes(n, _UPPER + _DIGITS, 9, rng)
+    points[:, 11] = ord("0")
+    points[:, 11] += (-_isin_luhn_totals(points) % 10).astype(np.uint32)
+    return _strings(points)
+
+
+def generate_figis(n: int, seed: Seed = None) -> list[str]:
+    """n distinct `BBG` FIGIs with valid check digits."""
+    rng = np.random.default_rng(seed)
+    points = np.empty((n, 12), dtype=np.uint32)
+    points[:, :3] = _alphabet("BBG")
+    points[:, 3:11] = _unique_codes(n, _FIGI_BODY, 8, rng)
+    points[:, 11] = ord("0") + _figi_expected_digits(points).astype(np.uint32)
+    return _strings(points)
+
+
+def generate_securities(n: int, seed: Seed = None) -> list[Security]:
+    """
+    n equities with distinct ticker-like symbols, valid ISINs and FIGIs.
+
+    Listings rotate over NYSE, NASDAQ, LSE and XETRA, with matching country,
+    currency and ISIN prefix. Built with `load_securities(trusted=True)`.
+    """
+    rng = np.random.default_rng(seed)
+    width = 4
+    while len(_UPPER) ** width < n:
+        width += 1
+    symbols = _strings(_unique_codes(n, _UPPER, width, rng)) if n else []
+    listing = np.arange(n) % len(_LISTINGS)
+    exchanges, countries, currencies = (np.array(column) for column in zip(*_LISTINGS, strict=True))
+    frame = pd.DataFrame(
+        {
+            "symbol": symbols,
+            "name": [f"{symbol} Holdings" for symbol in symbols],
+            "exchange": exchanges[listing],
+            "country": countries[listing],
+            "currency": currencies[listing],
+            "asset_class": "Equity",
+            "isin": generate_isins(n, countries[listing].tolist(), rng),
+            "figi": generate_figis(n, rng),
+        }
+    )
+    return load_securities(frame, trusted=True).securities
+
+
+def generate_columns(
+    period: HistoryPeriod = HistoryPeriod.Y1,
+    interval: HistoryInterval = HistoryInterval.D1,
+    exchange: str | None = None,
+    end: date | None = None,
+    start_price: float = 100.0,
+    drift: float = 0.05,
+    volatility: float = 0.2,
+    volume: float = 1_000_000.0,
+    decimals: int | None = 2,
+    seed: Seed = None,
+) -> OHLCVColumns:
+    """
+    Candles following geometric Brownian motion on the exchange's trading calendar.
+
+    `drift` and `volatility` are annualized (252 sessions); `volume` is the mean
+    volume of a full session. Timestamps are `TradingCalendar.expected_index`, so
+    intraday intervals cover regular hours only. Each candle opens at the previous
+    close (plus a small gap), high/low bracket open and close, and prices are
+    rounded to `decimals` (None keeps full precision).
+    """
+    rng = np.random.default_rng(seed)
+    calendar = get_calendar(exchange)
+    interval = HistoryInterval(interval)
+    index = calendar.expected_index(period, interval, end)
+    n = len(index)
+    if interval in _DAYS:
+        sessions = float(_DAYS[interval])
+    else:
+        minutes = int(interval.value[:-1]) * (60 if interval.value.endswith("h") else 1)
+        sessions = minutes / ((calendar.close - calendar.open).total_seconds() / 60)
+    dt = sessions / TRADING_DAYS
+    scale = volatility * np.sqrt(dt)
+
+    log_returns = (drift - 0.5 * volatility**2) * dt + scale * rng.standard_normal(n)
+    close = start_price * np.exp(np.cumsum(log_returns))
+    gaps = np.exp(0.1 * scale * rng.standard_normal(n))
+    open_ = np.concatenate(([start_price], close[:-1])) * gaps
+    top = np.maximum(open_, close)
+    bottom = np.minimum(open_, close)
+    high = top * np.exp(0.5 * scale * np.abs(rng.standard_normal(n)))
+    low = bottom * np.exp(-0.5 * scale * np.abs(rng.standard_normal(n)))
+    volumes = np.round(volume * sessions * rng.lognormal(-0.125, 0.5, n))
+    data = {"open": open_, "high": high, "low": low, "close": close}
+    if decimals is not None:
+        # Rounding is monotonic, so low <= open/close <= high still holds
+        data = {field: np.round(values, decimals) for field, values in data.items()}
+    return OHLCVColumns(index, {**data, "volume": volumes})
+
+
+def generate_history(
+    security: Security,
+    period: HistoryPeriod = HistoryPeriod.Y1,
+    interval: HistoryInterval = HistoryInterval.D1,
+    end: date | None = None,
+    start_price: float = 100.0,
+    drift: float = 0.05,
+    volatility: float = 0.2,
+    volume: float = 1_000_000.0,
+    decimals: int | None = 2,
+    seed: Seed = None,
+) -> History:
+    """A History of `generate_columns` candles on the security's exchange calendar."""
+    columns = generate_columns(
+        period,
+        interval,
+        security.exchange,
+        end,
+        start_price,
+        drift,
+        volatility,
+        volume,
+        decimals,
+        seed,
+    )
+    return History.from_columns(security, columns)
+
+
+def generate_histories(
+    securities: Sequence[Security],
+    period: HistoryPeriod = HistoryPeriod.Y1,
+    interval: HistoryInterval = HistoryInterval.D1,
+    end: date | None = None,
+    seed: Seed = None,
+) -> list[History]:
+    """
+    One history per security with randomized start price, drift and volatility.
+
+    Pass `end` (and `seed`) for reproducible output; it defaults to today.
+    """
+    rng = np.random.default_rng(seed)
+    n = len(securities)
+    start_prices = np.round(np.exp(rng.uniform(np.log(5), np.log(500), n)), 2)
+    drifts = rng.normal(0.05, 0.1, n)
+    volatilities = rng.uniform(0.1, 0.6, n)
+    children = rng.spawn(n)
+    return [
+        generate_history(
+            security,
+            period,
+            interval,
+            end,
+            start_price=float(start_prices[i]),
+            drift=float(drifts[i]),
+            volatility=float(volatilities[i]),
+            seed=children[i],
+        )
+        for i, security in enumerate(securities)
+    ]
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel, RootModel, TypeAdapter, ValidationError
+
+from .models import (
+    FlexibleDate,
+    History,
+    HistoryPeriod,
+    Price,
+    PriceVerificationError,
+    Security,
+    SecurityQuery,
+)
+
+
+class _SearchCall(BaseModel):
+    query: str
+
+
+class _ResolveCall(BaseModel):
+    criteria: SecurityQuery
+
+
+class _HistoryCall(BaseModel):
+    symbol: str
+    period: HistoryPeriod = HistoryPeriod.MO1
+
+
+class _GetPriceCall(BaseModel):
+    symbol: str
+    date: FlexibleDate | None = None
+
+
+class _ValidateCall(BaseModel):
+    symbol: str
+    target_date: FlexibleDate
+    target_price: float
+
+
+class MethodSpec(NamedTuple):
+    """Arguments model and result adapter of one DataSource method."""
+
+    call: type[BaseModel]
+    result: TypeAdapter[Any]
+
+
+METHODS: dict[str, MethodSpec] = {
+    "search": MethodSpec(_SearchCall, TypeAdapter(list[Security])),
+    "resolve": MethodSpec(_ResolveCall, TypeAdapter(Security | None)),
+    "history": MethodSpec(_HistoryCall, TypeAdapter(History)),
+    "get_price": MethodSpec(_GetPriceCall, TypeAdapter(Price | None)),
+    "validate": MethodSpec(_ValidateCall, TypeAdapter(bool)),
+}
+
+
+def _spec(method: str) -> MethodSpec:
+    try:
+        return METHODS[method]
+    except KeyError:
+        raise ValueError(f"Unknown DataSource method: {method!r}") from None
+
+
+def encode_call(method: str, *args: Any, **kwargs: Any) -> bytes:
+    """
+    JSON object of a DataSource call's arguments, bound by name as in the protocol.
+
+    Arguments are validated and defaults filled in, so equal calls encode to equal bytes.
+    Value objects travel as their plain values: the receiving source gets `str`
+    symbols and `float` prices, like most local callers pass.
+    """
+    spec = _spec(method)
+    names = list(spec.call.model_fields)
+    if len(args) > len(names):
+        raise TypeError(f"{method}() takes at most {len(names)} arguments ({len(args)} given)")
+    values = dict(zip(names, args, strict=False))
+    values.update(kwargs)
+    values = {k: v.root if isinstance(v, RootModel) else v for k, v in values.items()}
+    return spec.call.model_validate(values).model_dump_json().encode()
+
+
+def decode_call(method: str, data: bytes | str) -> tuple[Any, ...]:
+    """Positional arguments for `getattr(source, method)(*args)` from `encode_call` output."""
+    spec = _spec(method)
+    call = spec.call.model_validate_json(data)
+    return tuple(getattr(call, name) for name in spec.call.model_fields)
+
+
+def encode_result(method: str, result: Any) -> bytes:
+    return _spec(method).result.dump_json(result)
+
+
+def decode_result(method: str, data: bytes | str) -> Any:
+    return _spec(method).result.validate_json(data)
+
+
+class RemoteError(Exception):
+    """An error raised by a remote DataSource that has no local equivalent."""
+
+    def __init__(self, kind: str, message: str):
+        super().__init__(f"{kind}: {message}")
+        self.kind = kind
+        self.message = message
+
+
+class _Failure(BaseModel):
+    type: str
+    message: str
+    retry_after: float | None = None
+    details: dict[str, Any] | None = None
+
+
+# Builtin exceptions re-raised as themselves, so callers (and wrappers such as the
+# rate limiter's retry policy) can handle remote errors like local ones
+_BUILTIN_ERRORS: dict[str, type[Exception]] = {
+    cls.__name__: cls
+    for cls in (
+        ValueError,
+        TypeError,
+        LookupError,
+        KeyError,
+        IndexError,
+        NotImplementedError,
+        TimeoutError,
+        ConnectionError,
+        ConnectionRefusedError,
+        ConnectionResetError,
+        PermissionError,
+    )
+}
+
+
+def encode_error(error: BaseException) -> bytes:
+    """JSON description of an exception, keeping `retry_after` and price verification data."""
+    details = None
+    if isinstance(error, PriceVerificationError):
+        details = {
+            "symbol": str(error.symbol),
+            "actual_date": error.actual_date.isoformat(),
+            "expected_price": error.expected_price.value,
+            "actual_low": None if error.actual_low is None else error.actual_low.value,
+            "actual_high": None if error.actual_high is None else error.actual_high.value,
+            "actual_close": None if error.actual_close is None else error.actual_close.value,
+            "source": error.source,
+        }
+    retry_after = getattr(error, "retry_after", None)
+    failure = _Failure(
+        type=type(error).__name__,
+        message=str(error.args[0]) if len(error.args) == 1 else str(error),
+        retry_after=None if retry_after is None else float(retry_after),
+        details=details,
+    )
+    return failure.model_dump_json(exclude_none=True).encode()
+
+
+def decode_error(data: bytes | str) -> Exception:
+    """The exception described by `encode_error` output; unknown types become RemoteError."""
+    try:
+        failure = _Failure.model_validate_json(data)
+    except ValidationError:
+        text = data.decode(errors="replace") if isinstance(data, bytes) else data
+        return RemoteError("ProtocolError", text.strip() or "empty error response")
+    error: Exception
+    if failure.type == PriceVerificationError.__name__ and failure.details is not None:
+        error = PriceVerificationError(failure.message, **failure.details)
+    elif failure.type in _BUILTIN_ERRORS:
+        error = _BUILTIN_ERRORS[failure.type](failure.message)
+    else:
+        error = RemoteError(failure.type, failure.message)
+    if failure.retry_after is not None:
+        error.retry_after = failure.retry_after  # type: ignore[attr-defined]
+    return error
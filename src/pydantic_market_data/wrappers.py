@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+
+from .interfaces import DataSource
+from .models import (
+    History,
+    HistoryPeriod,
+    Price,
+    Security,
+    SecurityQuery,
+    Symbol,
+)
+
+
+class _Dispatcher:
+    """
+    The DataSource protocol methods, each routed through a single `_call` hook.
+
+    Base of the wrappers, the remote client and the cassette replayer, which only
+    differ in how they carry out a call.
+    """
+
+    def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError
+
+    def search(self, query: str) -> list[Security]:
+        return self._call("search", query)  # type: ignore[no-any-return]
+
+    def resolve(self, criteria: SecurityQuery) -> Security | None:
+        return self._call("resolve", criteria)  # type: ignore[no-any-return]
+
+    def history(self, symbol: Symbol.Input, period: HistoryPeriod = HistoryPeriod.MO1) -> History:
+        return self._call("history", symbol, period)  # type: ignore[no-any-return]
+
+    def get_price(self, symbol: Symbol.Input, date: date | None = None) -> Price | None:
+        return self._call("get_price", symbol, date)  # type: ignore[no-any-return]
+
+    def validate(self, symbol: Symbol.Input, target_date: date, target_price: Price.Input) -> bool:
+        return self._call("validate", symbol, target_date, target_price)  # type: ignore[no-any-return]
+
+
+class DataSourceWrapper(_Dispatcher):
+    """
+    Base class for decorators around a DataSource.
+
+    Every protocol method is routed through `_call`, so subclasses only override
+    that single hook to add behaviour around the wrapped source.
+    """
+
+    def __init__(self, source: DataSource):
+        self.source = source
+
+    def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        return getattr(self.source, method)(*args, **kwargs)
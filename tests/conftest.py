@@ -0,0 +1,193 @@
+import threading
+import time
+import zlib
+from collections.abc import Sequence
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+import pytest
+
+from pydantic_market_data import (
+    OHLCV,
+    History,
+    HistoryPeriod,
+    Price,
+    PriceVerificationError,
+    Security,
+)
+from pydantic_market_data.columns import FIELDS, PRICE_FIELDS, OHLCVColumns
+from pydantic_market_data.synthetic import generate_columns
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path_factory, monkeypatch):
+    # Keep --schema and cache tests out of the real ~/.cache
+    monkeypatch.setenv("PYDANTIC_MARKET_DATA_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+
+
+@lru_cache
+def _walk(symbol: str, start_price: float) -> OHLCVColumns:
+    return generate_columns(
+        HistoryPeriod.Y1,
+        end=date(2024, 12, 31),
+        start_price=start_price,
+        seed=zlib.crc32(symbol.encode()),
+    )
+
+
+def _make_history(
+    symbol: str,
+    dates: int | Sequence[int | datetime],
+    closes: Sequence[float] | None = None,
+    *,
+    start: datetime = datetime(2024, 1, 1),
+    start_price: float = 100.0,
+    overrides: dict[int, dict[str, float | None]] | None = None,
+) -> History:
+    """
+    History of synthetic candles, the same for the same symbol.
+
+    `dates` is a number of daily candles from `start`, or one datetime or day offset
+    from `start` per candle. Prices follow `generate_columns`, unless `closes` pins
+    flat candles (open = high = low = close); `overrides` maps a candle position to
+    field values.
+    """
+    if isinstance(dates, int):
+        dates = range(dates)
+    dates = [start + timedelta(days=d) if isinstance(d, int) else d for d in dates]
+    walk = _walk(symbol, start_price)
+    candles = []
+    for i, when in enumerate(dates):
+        values: dict[str, float | None] = {field: float(walk[field][i]) for field in FIELDS}
+        if closes is not None:
+            values.update(dict.fromkeys(PRICE_FIELDS, closes[i]))
+        values.update((overrides or {}).get(i, {}))
+        candles.append(OHLCV(date=when, **values))
+    return History(security=Security(symbol=symbol, name=symbol), candles=candles)
+
+
+class FakeClock:
+    """Monotonic clock that only moves when told to, or when `sleep` is called."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class StubSource:
+    """
+    DataSource double recording every call in `calls`, as (method, *args).
+
+    Searches return `results`, or the query and its `.L` listing; `resolve` returns
+    the first search result for the query's symbol. `history` has `candles` daily
+    candles closing at `price` (none without a price) and `validate` accepts prices
+    within 10% of it. Every call waits `delay` seconds, then raises `error`, or
+    `errors[arg]` when its first argument is a key. `peak` is the most calls that
+    were in flight at once.
+    """
+
+    def __init__(
+        self,
+        name="Stub",
+        price=None,
+        *,
+        candles=1,
+        results=None,
+        delay=0.0,
+        error=None,
+        errors=None,
+    ):
+        self.name = name
+        self.price = price
+        self.candles = candles
+        self.results = results
+        self.delay = delay
+        self.error = error
+        self.errors = dict(errors or {})
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _respond(self, method, *args):
+        with self._lock:
+            self.calls.append((method, *args))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            key = args[0] if isinstance(args[0], str) else None
+            error = self.errors.get(key, self.error)
+            if error is not None:
+                raise error
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def _results(self, query):
+        if self.results is not None:
+            return list(self.results)
+        return [Security(symbol=query, name=query), Security(symbol=f"{query}.L", name=query)]
+
+    def search(self, query):
+        self._respond("search", query)
+        return self._results(query)
+
+    def resolve(self, criteria):
+        self._respond("resolve", criteria)
+        if criteria.symbol is None:
+            return None
+        return next(iter(self._results(str(criteria.symbol))), None)
+
+    def history(self, symbol, period=None):
+        self._respond("history", symbol, period)
+        n = 0 if self.price is None else self.candles
+        candles = [
+            OHLCV(date=datetime(2024, 1, 2 + i), close=self.price, volume=10.0) for i in range(n)
+        ]
+        return History(security=Security(symbol=symbol, name=self.name), candles=candles)
+
+    def get_price(self, symbol, date=None):
+        self._respond("get_price", symbol, date)
+        return None if self.price is None else Price(self.price)
+
+    def validate(self, symbol, target_date, target_price):
+        self._respond("validate", symbol, target_date, target_price)
+        low, high = self.price * 0.9, self.price * 1.1
+        if not low <= target_price <= high:
+            raise PriceVerificationError(
+                "Price is outside daily range",
+                symbol,
+                target_date,
+                target_price,
+                actual_low=low,
+                actual_high=high,
+                source=self.name,
+            )
+        return True
+
+
+@pytest.fixture
+def make_history():
+    """History factory: `make_history(symbol, dates, closes=None, ...)`."""
+    return _make_history
+
+
+@pytest.fixture
+def stub_source():
+    """StubSource factory, for tests that need several or differently configured ones."""
+    return StubSource
+
+
+@pytest.fixture
+def clock():
+    """A FakeClock at 0, passed as `clock=clock, sleep=clock.sleep`."""
+    return FakeClock()
@@ -0,0 +1,111 @@
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from pydantic_market_data import AdjustedColumns, CorporateActions, Security
+from pydantic_market_data.synthetic import generate_history
+
+SECURITY = Security(symbol="AAPL", name="Apple Inc")
+
+
+def _reference(history, actions):
+    """Candle-by-candle adjustment, walking backwards through the actions."""
+    rows = [c.model_dump() for c in history.candles]
+    events = sorted(
+        [(d, "split", r) for d, r in actions.splits.items()]
+        + [(d, "dividend", a) for d, a in actions.dividends.items()],
+        reverse=True,
+    )
+    raw_close = {c.date.date(): c.close for c in history.candles}
+    for day, kind, value in events:
+        if kind == "split":
+            factor, volume = 1 / value, value
+        else:
+            before = [d for d in raw_close if d < day]
+            if not before:
+                continue
+            factor, volume = 1 - value / raw_close[max(before)], 1.0
+        for row in rows:
+            if row["date"].date() < day:
+                for field in ("open", "high", "low", "close"):
+                    row[field] *= factor
+                row["volume"] *= volume
+    return rows
+
+
+def test_adjust_matches_candle_by_candle_reference():
+    history = generate_history(SECURITY, "2y", end=date(2024, 6, 28), seed=5)
+    actions = CorporateActions(
+        splits={"2023-03-01": 4, date(2024, 2, 5): 0.5},
+        dividends={"2023-02-10": 0.8, "2023-08-10": 1.1, "2024-05-10": 0.9},
+    )
+    adjusted = history.adjust(actions)
+    expected = _reference(history, actions)
+    for candle, row in zip(adjusted.candles, expected, strict=True):
+        for field in ("open", "high", "low", "close", "volume"):
+            assert getattr(candle, field) == pytest.approx(row[field], rel=1e-12)
+    # Candles after the last ex-date are reused
+    assert adjusted.candles[-1] is history.candles[-1]
+    assert adjusted.candles[0] is not history.candles[0]
+
+
+def test_split_and_dividend_factors(make_history):
+    history = make_history("AAPL", range(6), closes=[100.0] * 6)
+    actions = CorporateActions(splits={"2024-01-03": 2}, dividends={"2024-01-05": 5})
+    adjusted = history.adjust(actions)
+    assert [c.close for c in adjusted.candles] == [47.5, 47.5, 95.0, 95.0, 100.0, 100.0]
+    volumes = [c.volume for c in history.candles]
+    factors = [2, 2, 1, 1, 1, 1]
+    assert [c.volume for c in adjusted.candles] == [
+        v * f for v, f in zip(volumes, factors, strict=True)
+    ]
+    split_only = history.adjust(actions, dividends=False)
+    assert [c.close for c in split_only.candles] == [50, 50, 100, 100, 100, 100]
+
+
+def test_unsorted_and_sparse_candles(make_history):
+    history = make_history("AAPL", [4, 0, 2], closes=[100.0] * 3)
+    history.candles[1].volume = None
+    adjusted = history.adjust(CorporateActions(splits={"2024-01-02": 10}))
+    assert [c.close for c in adjusted.candles] == [100, 10, 100]
+    assert adjusted.candles[1].volume is None
+    assert "volume" not in adjusted.candles[1].model_fields_set
+
+
+def test_dividend_edge_cases(make_history):
+    history = make_history("AAPL", range(3), closes=[100.0] * 3)
+    # Before the first candle there is no previous close, so nothing changes
+    assert history.adjust(CorporateActions(dividends={"2023-12-01": 1})).candles == history.candles
+    with pytest.raises(ValueError, match="not below the previous close"):
+        history.adjust(CorporateActions(dividends={"2024-01-02": 100}))
+    with pytest.raises(ValueError):
+        CorporateActions(splits={"2024-01-02": 0})
+
+
+def test_intraday_uses_local_calendar_day():
+    history = generate_history(SECURITY, "5d", "60m", end=date(2024, 6, 28), seed=1)
+    adjusted = history.adjust(CorporateActions(splits={"2024-06-27": 2}))
+    for raw, adj in zip(history.candles, adjusted.candles, strict=True):
+        factor = 0.5 if raw.date.date() < date(2024, 6, 27) else 1.0
+        assert adj.close == pytest.approx(raw.close * factor)
+
+
+def test_adjusted_columns_side_by_side(make_history):
+    history = make_history("AAPL", range(6), closes=[100.0] * 6)
+    actions = CorporateActions(splits={"2024-01-03": 2}, dividends={"2024-01-05": 5})
+    columns = AdjustedColumns(history.to_columns(), actions)
+    assert columns.adjusted is columns.adjusted
+    np.testing.assert_array_equal(columns.raw["close"], [100.0] * 6)
+    np.testing.assert_allclose(columns.adjusted["close"], [47.5, 47.5, 95, 95, 100, 100])
+    np.testing.assert_array_equal(columns.changed, [0, 1, 2, 3])
+    # Converting trade prices between raw and adjusted terms
+    assert columns.factor_on(datetime(2024, 1, 1, 15)) == pytest.approx(0.475)
+    assert columns.to_adjusted(date(2024, 1, 2), 100.0) == pytest.approx(47.5)
+    assert columns.to_raw(date(2024, 1, 4), 95.0) == pytest.approx(100.0)
+    assert columns.factor_on(date(2024, 2, 1)) == 1.0
+
+
+def test_corporate_actions_json_round_trip():
+    actions = CorporateActions(splits={"2020-08-31": 4}, dividends={date(2024, 5, 10): 0.25})
+    assert CorporateActions.model_validate_json(actions.model_dump_json()) == actions
@@ -0,0 +1,57 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from pydantic_market_data import (
+    OHLCV,
+    SearchResult,
+    Security,
+    dump_candles_json,
+    dump_securities_json,
+    validate_candles_json,
+    validate_search_results_json,
+    validate_securities_json,
+)
+
+_CANDLES = [
+    {"date": "2024-01-02T00:00:00", "open": 1.0, "close": 2.0, "volume": 10},
+    {"date": "2024-01-03 09:30", "close": 3.0},
+    {"date": "2024-01-04T09:30:00Z", "close": 4.0},
+    {"date": "01/05/2024", "close": 5.0},
+]
+
+
+def test_validate_candles_json_matches_models():
+    candles = validate_candles_json(json.dumps(_CANDLES).encode())
+    assert candles == [OHLCV.model_validate(c) for c in _CANDLES]
+    assert candles[1].date == datetime(2024, 1, 3, 9, 30)
+    assert candles[2].date == datetime(2024, 1, 4, 9, 30, tzinfo=timezone.utc)
+    assert candles[3].date == datetime(2024, 1, 5)
+
+
+def test_candles_round_trip():
+    candles = validate_candles_json(json.dumps(_CANDLES[:2]))
+    assert validate_candles_json(dump_candles_json(candles)) == candles
+
+
+def test_validate_securities_json():
+    rows = [
+        {"symbol": "AAPL", "name": "Apple", "country": "United States", "currency": "USD"},
+        {"symbol": "VOD", "name": "Vodafone", "isin": "GB00BH4HKS39"},
+    ]
+    securities = validate_securities_json(json.dumps(rows).encode())
+    assert securities == [Security.model_validate(r) for r in rows]
+    assert str(securities[0].country) == "US"
+    assert validate_securities_json(dump_securities_json(securities)) == securities
+
+    results = validate_search_results_json(json.dumps(rows))
+    assert all(isinstance(r, SearchResult) for r in results)
+
+
+def test_validation_errors_are_reported():
+    with pytest.raises(ValidationError, match="Invalid ISIN"):
+        validate_securities_json(b'[{"symbol": "X", "name": "X", "isin": "US0000000000"}]')
+    with pytest.raises(ValidationError):
+        validate_candles_json(b'[{"close": 1.0}]')
@@ -0,0 +1,181 @@
+import random
+
+import pandas as pd
+import pytest
+
+from pydantic_market_data import (
+    Security,
+    SecurityBatch,
+    SecurityTable,
+    load_securities,
+    validate_securities,
+)
+from pydantic_market_data.bulk import _figis, _isins, figi_check_digits_ok, isin_checksums_ok
+from pydantic_market_data.models import validate_figi, validate_isin
+
+_ROWS = [
+    {
+        "symbol": "AAPL",
+        "name": "Apple Inc",
+        "exchange": "NSQ",
+        "country": "United States",
+        "currency": "USD",
+        "isin": " us0378331005 ",
+        "figi": "BBG000B9XRY4",
+    },
+    {"symbol": "AVGO", "name": "Broadcom", "country": "US", "figi": "BBG00KHY5S69"},
+    {"symbol": "VOD", "name": "Vodafone", "country": "GB", "currency": "GBP", "isin": "-"},
+]
+
+
+def test_isin_checksums_match_scalar_validator():
+    isins = ["US0378331005", "US0378331006", "GB00B03MLX29", "DE000BAY0017", "JP3633400001"]
+    expected = []
+    for isin in isins:
+        try:
+            expected.append(validate_isin(isin) is not None)
+        except ValueError:
+            expected.append(False)
+    assert isin_checksums_ok(isins).tolist() == expected
+    assert expected == [True, False, True, True, True]
+
+
+def test_figi_check_digits_match_scalar_validator():
+    figis = ["BBG000B9XRY4", "BBG00KHY5S69", "BBG000B9XRY3"]
+    assert figi_check_digits_ok(figis).tolist() == [True, True, False]
+    assert validate_figi(figis[0]) == figis[0]
+
+
+def _scalar(validator, value):
+    try:
+        return validator(value), None
+    except ValueError as e:
+        return None, str(e)
+
+
+@pytest.mark.parametrize(
+    ("column", "scalar", "samples"),
+    [
+        (_isins, validate_isin, ["US0378331005", "us0378331005 ", "-", "NONE", "US03783310O5"]),
+        (
+            _figis,
+            validate_figi,
+            ["BBG000B9XRY4", "BSG000B9XRY4", "BBGA00B9XRY4", "", "BBG000B9XRY"],
+        ),
+    ],
+)
+def test_column_validators_match_scalar_validators(column, scalar, samples):
+    rng = random.Random(7)
+    alphabet = "ABGUS0123456789-é "
+    samples = samples + [
+        "".join(rng.choices(alphabet, k=rng.choice([11, 12, 13]))) for _ in range(300)
+    ]
+    cleaned, errors = column(pd.Series(samples, dtype=object).to_numpy())
+    for value, got_clean, got_error in zip(samples, cleaned, errors, strict=True):
+        assert (got_clean, got_error) == _scalar(scalar, value), value
+
+
+def test_load_securities_matches_model_validation():
+    batch = load_securities(_ROWS)
+    assert isinstance(batch, SecurityBatch)
+    assert batch.errors == []
+    assert batch.rows == [0, 1, 2]
+    assert batch.securities == [Security(**row) for row in _ROWS]
+    apple = batch.securities[0]
+    assert str(apple.country) == "US"
+    assert apple.isin == "US0378331005"
+    assert batch.securities[2].isin is None
+
+
+def test_load_securities_value_objects_match_validated_ones():
+    for loaded, row in zip(load_securities(_ROWS).securities, _ROWS, strict=True):
+        validated = Security.model_validate(row)
+        for field in ("symbol", "country", "currency"):
+            ours, theirs = getattr(loaded, field), getattr(validated, field)
+            assert type(ours) is type(theirs)
+            assert type(getattr(ours, "root", None)) is type(getattr(theirs, "root", None))
+    apple = load_securities(_ROWS[:1]).securities[0]
+    assert apple.country.value.short_name == "United States"
+    assert apple.currency.value == "USD"
+    trusted = load_securities(
+        [{"symbol": "SAP", "name": "SAP", "country": "Germany"}], trusted=True
+    )
+    assert trusted.securities[0].country == Security(symbol="SAP", name="SAP", country="DE").country
+
+
+def test_load_securities_reports_error_rows():
+    rows = pd.DataFrame(
+        [
+            {"symbol": "OK", "name": "Fine", "country": "US", "isin": "US0378331005"},
+            {"symbol": "BAD1", "name": "Bad ISIN", "isin": "US0378331006"},
+            {"symbol": "BAD2", "name": "Bad FIGI", "figi": "BSG000B9XRY4"},
+            {"symbol": "BAD3", "name": "Bad country", "country": "Narnia", "currency": "LOL"},
+            {"symbol": "BAD4", "name": None},
+            {"symbol": "OK2", "name": "Also fine", "country": "US"},
+        ]
+    )
+    batch = load_securities(rows)
+    assert [str(s.symbol) for s in batch.securities] == ["OK", "OK2"]
+    assert batch.rows == [0, 5]
+    assert [(e.row, e.field) for e in batch.errors] == [
+        (1, "isin"),
+        (2, "figi"),
+        (3, "country"),
+        (3, "currency"),
+        (4, "name"),
+    ]
+    assert batch.errors[0].message == "Invalid ISIN checksum: US0378331006"
+    assert batch.errors[1].message == "Invalid FIGI prefix: BS"
+    assert "Narnia" in batch.errors[2].message
+    assert batch.errors[4].message == "Field required"
+
+
+def test_load_securities_trusted_skips_validation():
+    rows = [{"symbol": "X", "name": "Unchecked", "country": "US", "isin": "NOT-AN-ISIN"}]
+    batch = load_securities(rows, trusted=True)
+    assert batch.errors == []
+    security = batch.securities[0]
+    assert security.isin == "NOT-AN-ISIN"
+    assert str(security.symbol) == "X"
+    assert str(security.country) == "US"
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_load_securities_empty(trusted):
+    batch = load_securities([], trusted=trusted)
+    assert batch.securities == []
+    assert batch.errors == []
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_load_securities_all_none_column(trusted):
+    batch = load_securities([{"symbol": "A", "name": "N", "isin": None}], trusted=trusted)
+    assert batch.errors == []
+    assert batch.securities[0].isin is None
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_load_securities_leaves_input_frame_unchanged(trusted):
+    # Mixed-type columns: strings next to None and NaN
+    frame = pd.DataFrame(
+        {
+            "symbol": ["A", "B", "C"],
+            "name": ["N", "M", "O"],
+            "isin": ["US0378331005", None, float("nan")],
+            "exchange": [None, "NSQ", float("nan")],
+        }
+    )
+    before = frame.copy()
+    batch = load_securities(frame, trusted=trusted)
+    assert [s.isin for s in batch.securities] == ["US0378331005", None, None]
+    assert [s.exchange for s in batch.securities] == [None, "NSQ", None]
+    pd.testing.assert_frame_equal(frame, before)
+
+
+def test_validate_securities_returns_columnar_table():
+    table = validate_securities(_ROWS + [{"symbol": "BAD", "name": "x", "currency": "LOL"}])
+    assert isinstance(table, SecurityTable)
+    assert list(table.frame.index) == [0, 1, 2]
+    assert list(table.frame["country"]) == ["US", "US", "GB"]
+    assert table.frame.loc[0, "isin"] == "US0378331005"
+    assert [(e.row, e.field) for e in table.errors] == [(3, "currency")]
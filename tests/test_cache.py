@@ -0,0 +1,130 @@
+import threading
+import time
+from datetime import date, datetime
+
+import pytest
+
+from pydantic_market_data import (
+    OHLCV,
+    History,
+    InMemorySink,
+    Price,
+    PriceCache,
+    PriceCachingDataSource,
+    Security,
+)
+
+
+class CountingSource:
+    def __init__(self, prices=None, delay=0.0):
+        self.prices = prices or {}
+        self.delay = delay
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get_price(self, symbol, date=None):
+        with self.lock:
+            self.calls.append((str(symbol), date))
+        time.sleep(self.delay)
+        value = self.prices.get((str(symbol), date))
+        return None if value is None else Price(value)
+
+    def history(self, symbol, period=None):
+        return History(
+            security=Security(symbol=symbol, name=symbol),
+            candles=[
+                OHLCV(date=datetime(2024, 1, 2), close=10.0),
+                OHLCV(date=datetime(2024, 1, 3), close=None),
+                OHLCV(date=datetime(2024, 1, 4), close=11.0),
+            ],
+        )
+
+
+def test_caches_prices_and_missing_prices():
+    source = CountingSource({("AAPL", date(2024, 1, 2)): 185.0})
+    sink = InMemorySink()
+    cached = PriceCachingDataSource(source, sink=sink)
+    for _ in range(3):
+        assert cached.get_price("AAPL", date(2024, 1, 2)).value == 185.0
+        assert cached.get_price("AAPL", date(2024, 1, 6)) is None
+    assert len(source.calls) == 2
+    assert sink.cache_hit_rate("prices") == pytest.approx(4 / 6)
+    # Datetimes share the entry of their day
+    assert cached.get_price("AAPL", datetime(2024, 1, 2, 16)).value == 185.0
+    assert len(source.calls) == 2
+
+
+def test_live_price_is_not_cached():
+    source = CountingSource()
+    cached = PriceCachingDataSource(source)
+    cached.get_price("AAPL")
+    cached.get_price("AAPL")
+    assert len(source.calls) == 2
+
+
+def test_negative_ttl(clock):
+    cache = PriceCache(negative_ttl=60, clock=clock)
+    source = CountingSource()
+    cached = PriceCachingDataSource(source, cache)
+    cached.get_price("AAPL", date(2024, 1, 2))
+    cached.get_price("AAPL", date(2024, 1, 2))
+    assert len(source.calls) == 1
+    clock.now = 61
+    source.prices[("AAPL", date(2024, 1, 2))] = 1.5
+    assert cached.get_price("AAPL", date(2024, 1, 2)).value == 1.5
+    assert len(source.calls) == 2
+
+
+def test_concurrent_misses_share_one_fetch():
+    source = CountingSource({("AAPL", date(2024, 1, 2)): 1.0}, delay=0.05)
+    cached = PriceCachingDataSource(source, PriceCache(stripes=4))
+    results = []
+
+    def lookup():
+        results.append(cached.get_price("AAPL", date(2024, 1, 2)))
+
+    threads = [threading.Thread(target=lookup) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(source.calls) == 1
+    assert [p.value for p in results] == [1.0] * 8
+
+
+def test_fetch_error_is_not_cached():
+    class Failing(CountingSource):
+        def get_price(self, symbol, date=None):
+            super().get_price(symbol, date)
+            raise ConnectionError("down")
+
+    source = Failing()
+    cached = PriceCachingDataSource(source)
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            cached.get_price("AAPL", date(2024, 1, 2))
+    assert len(source.calls) == 2
+
+
+def test_prefill_from_history():
+    source = CountingSource()
+    cached = PriceCachingDataSource(source, prefill_history=True)
+    cached.history("AAPL")
+    assert len(cached.cache) == 2
+    assert cached.get_price("AAPL", date(2024, 1, 4)).value == 11.0
+    assert cached.get_price("AAPL", date(2024, 1, 3)) is None  # not prefilled, so fetched
+    assert source.calls == [("AAPL", date(2024, 1, 3))]
+
+
+def test_put_and_invalidate():
+    cache = PriceCache(stripes=2)
+    cache.put("AAPL", date(2024, 1, 2), Price(1.0))
+    cache.put("MSFT", date(2024, 1, 2), None)
+    assert cache.lookup(("MSFT", date(2024, 1, 2))) == (True, None)
+    cache.invalidate(["AAPL"])
+    assert cache.get("AAPL", date(2024, 1, 2)) is None
+    assert len(cache) == 1
+    cache.invalidate()
+    assert len(cache) == 0
+    with pytest.raises(ValueError):
+        PriceCache(stripes=0)
@@ -0,0 +1,119 @@
+from datetime import date, datetime
+
+import pandas as pd
+import pytest
+
+from pydantic_market_data import (
+    OHLCV,
+    History,
+    HistoryInterval,
+    HistoryPeriod,
+    IssueKind,
+    Security,
+    get_calendar,
+    scan_history,
+)
+
+
+def test_nyse_holidays():
+    nyse = get_calendar("NASDAQ")
+    assert nyse is get_calendar("nyse")
+    holidays = [d for d in nyse.holidays.astype(date) if d.year == 2024]
+    assert holidays == [
+        date(2024, 1, 1),
+        date(2024, 1, 15),
+        date(2024, 2, 19),
+        date(2024, 3, 29),
+        date(2024, 5, 27),
+        date(2024, 6, 19),
+        date(2024, 7, 4),
+        date(2024, 9, 2),
+        date(2024, 11, 28),
+        date(2024, 12, 25),
+    ]
+    # Saturday New Year's Day is not observed on the Friday before
+    assert nyse.is_session(date(2021, 12, 31))
+    assert not nyse.is_session(date(2021, 12, 24))
+
+
+def test_lse_christmas_substitution():
+    lse = get_calendar("XLON")
+    assert not lse.is_session(date(2022, 12, 26))
+    assert not lse.is_session(date(2022, 12, 27))
+    assert lse.is_session(date(2022, 12, 28))
+
+
+@pytest.mark.parametrize(
+    ("exchange", "calendar"),
+    [
+        ("XASE", "NYSE"),
+        ("ASQ", "NYSE"),
+        ("NYSE American", "NYSE"),
+        ("NSQ", "NYSE"),
+        ("US", "NYSE"),
+        ("LON", "LSE"),
+        ("GER", "XETRA"),
+        ("HKEX", "WEEKDAYS"),
+    ],
+)
+def test_exchanges_resolve_like_symbols(exchange, calendar):
+    assert get_calendar(exchange).name == calendar
+
+
+def test_unknown_exchange_uses_weekdays():
+    cal = get_calendar("MOON")
+    assert cal is get_calendar(None)
+    assert cal.is_session(date(2024, 12, 25))
+    assert not cal.is_session(date(2024, 12, 28))
+
+
+def test_period_range():
+    nyse = get_calendar("NYSE")
+    end = date(2024, 7, 6)  # Saturday
+    assert nyse.period_range(HistoryPeriod.D1, end) == (date(2024, 7, 5), date(2024, 7, 5))
+    # 4th of July is skipped
+    assert nyse.period_range(HistoryPeriod.D5, end) == (date(2024, 6, 28), date(2024, 7, 5))
+    assert nyse.period_range(HistoryPeriod.MO1, end)[0] == date(2024, 6, 6)
+    assert nyse.period_range(HistoryPeriod.YTD, end)[0] == date(2024, 1, 2)
+    assert nyse.period_range(HistoryPeriod.MAX, end)[0] == date(1970, 1, 2)
+
+
+def test_expected_index_daily_and_longer():
+    nyse = get_calendar("NYSE")
+    end = date(2024, 12, 31)
+    assert len(nyse.expected_index(HistoryPeriod.Y1, HistoryInterval.D1, end)) == 252
+    months = nyse.expected_index(HistoryPeriod.Y1, HistoryInterval.MO1, end)
+    assert len(months) == 12
+    assert months[0] == pd.Timestamp(2024, 1, 2)
+    weeks = nyse.expected_index(HistoryPeriod.MO1, HistoryInterval.W1, end)
+    assert all(d.weekday() == 0 for d in weeks[1:] if d != pd.Timestamp(2024, 12, 24))
+
+
+def test_expected_index_intraday():
+    grid = get_calendar("NYSE").expected_index("5d", "1h", date(2024, 3, 12))
+    assert len(grid) == 5 * 7
+    assert str(grid.tz) == "America/New_York"
+    assert grid[0] == pd.Timestamp("2024-03-06 09:30", tz="America/New_York")
+    assert grid[-1] == pd.Timestamp("2024-03-12 15:30", tz="America/New_York")
+    xetra = get_calendar("XETRA").expected_index("1d", "15m", date(2024, 3, 12))
+    assert len(xetra) == 34
+
+
+def test_missing_candles():
+    nyse = get_calendar("NYSE")
+    end = date(2024, 7, 12)
+    have = nyse.expected_index("1mo", "1d", end).delete([3, 4])
+    missing = nyse.missing(have, "1mo", "1d", end)
+    assert len(missing) == 2
+    assert nyse.missing(have.union(missing), "1mo", "1d", end).empty
+
+
+def test_scan_with_calendar_skips_holidays():
+    dates = get_calendar("NYSE").sessions(date(2024, 7, 1), date(2024, 7, 12))
+    h = History(
+        security=Security(symbol="X", name="X"),
+        candles=[OHLCV(date=d, open=1, high=1, low=1, close=1, volume=1) for d in dates],
+    )
+    assert scan_history(h).counts == {IssueKind.GAP: 1}
+    assert scan_history(h, calendar=get_calendar("NYSE")).ok
+    assert h.candles[3].date == datetime(2024, 7, 5)
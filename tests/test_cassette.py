@@ -0,0 +1,125 @@
+from datetime import date, datetime
+
+import pytest
+
+from pydantic_market_data import (
+    OHLCV,
+    Cassette,
+    CassetteMiss,
+    History,
+    HistoryPeriod,
+    Price,
+    RecordingDataSource,
+    RemoteError,
+    ReplayDataSource,
+    Security,
+    SecurityQuery,
+)
+
+
+class VendorError(Exception):
+    pass
+
+
+class LiveSource:
+    def __init__(self):
+        self.ticks = 0
+
+    def search(self, query):
+        if query == "BOOM":
+            raise VendorError("vendor down")
+        return [Security(symbol=query, name=query)]
+
+    def resolve(self, criteria):
+        return Security(symbol=criteria.symbol, name="Resolved", isin=criteria.isin)
+
+    def history(self, symbol, period=HistoryPeriod.MO1):
+        candles = [OHLCV(date=datetime(2024, 1, d), close=float(d)) for d in (2, 3, 4)]
+        return History(security=Security(symbol=symbol, name="X"), candles=candles)
+
+    def get_price(self, symbol, date=None):
+        self.ticks += 1
+        return Price(100.0 + self.ticks)
+
+    def validate(self, symbol, target_date, target_price):
+        return True
+
+
+def record():
+    recorder = RecordingDataSource(LiveSource())
+    recorder.search("AAPL")
+    with pytest.raises(VendorError):
+        recorder.search("BOOM")
+    recorder.resolve(SecurityQuery(symbol="MSFT", isin="US0378331005"))
+    recorder.history("AAPL", HistoryPeriod.Y1)
+    recorder.get_price("AAPL")
+    recorder.get_price("AAPL")
+    recorder.validate("AAPL", date(2024, 1, 2), 150.0)
+    return recorder.cassette
+
+
+@pytest.mark.parametrize("name", ["calls.ndjson", "calls.ndjson.gz"])
+def test_record_save_load_replay(tmp_path, name):
+    cassette = record()
+    assert len(cassette) == 7
+    path = tmp_path / name
+    cassette.save(path)
+
+    replay = ReplayDataSource(path)
+    assert replay.search("AAPL") == [Security(symbol="AAPL", name="AAPL")]
+    resolved = replay.resolve(SecurityQuery(symbol="MSFT", isin="US0378331005"))
+    assert resolved.isin == "US0378331005"
+    # Matched on the canonical call, however the arguments are spelled
+    history = replay.history(symbol="AAPL", period="1y")
+    assert isinstance(history, History)
+    assert [c.close for c in history.candles] == [2.0, 3.0, 4.0]
+    assert replay.validate("AAPL", date(2024, 1, 2), Price(150.0)) is True
+
+    # Repeated calls replay in order, then repeat the last outcome
+    assert [replay.get_price("AAPL") for _ in range(3)] == [Price(101), Price(102), Price(102)]
+    replay.rewind()
+    assert replay.get_price("AAPL") == Price(101)
+
+    with pytest.raises(RemoteError, match="VendorError: vendor down"):
+        replay.search("BOOM")
+    with pytest.raises(CassetteMiss, match="MSFT"):
+        replay.history("MSFT")
+
+
+def test_replay_returns_fresh_objects():
+    replay = ReplayDataSource(record())
+    first = replay.history("AAPL", HistoryPeriod.Y1)
+    first.candles.clear()
+    assert len(replay.history("AAPL", HistoryPeriod.Y1).candles) == 3
+
+
+def test_simulated_latency():
+    cassette = record()
+    delays = []
+    replay = ReplayDataSource(cassette, latency={"search": 0.05}, sleep=delays.append)
+    replay.search("AAPL")
+    replay.history("AAPL", HistoryPeriod.Y1)
+    assert delays == [0.05]
+
+    def jittered(seed):
+        delays = []
+        replay = ReplayDataSource(
+            cassette, latency=0.01, jitter=0.02, seed=seed, sleep=delays.append
+        )
+        for _ in range(20):
+            replay.search("AAPL")
+        return delays
+
+    assert jittered(1) == jittered(1) != jittered(2)
+    assert all(0.0 <= d <= 0.03 for d in jittered(1))
+
+    delays = []
+    ReplayDataSource(cassette, latency="recorded", sleep=delays.append).search("AAPL")
+    assert delays == [e["elapsed"] for e in cassette if e["args"] == {"query": "AAPL"}]
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "other.ndjson"
+    path.write_text('{"candles": []}\n')
+    with pytest.raises(ValueError, match="cassette"):
+        Cassette.load(path)
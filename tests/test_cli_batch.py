@@ -0,0 +1,107 @@
+import io
+import json
+
+import pytest
+
+from pydantic_market_data.cli_batch import (
+    BatchArgs,
+    format_result,
+    parse_queries,
+    read_rows,
+    run_batch,
+    run_batch_cli,
+)
+
+
+@pytest.fixture
+def source(stub_source):
+    return stub_source(price=10.0, delay=0.02, errors={"BOOM": ConnectionError("vendor down")})
+
+
+def test_read_rows_csv_and_ndjson():
+    csv_rows = list(read_rows(io.StringIO("symbol,asset-class,limit\nAAPL,,2\n"), "csv"))
+    assert csv_rows == [{"symbol": "AAPL", "limit": "2"}]
+    nd = list(read_rows(io.StringIO('{"symbol": "AAPL"}\n\n{"isin": "X"}\n'), "ndjson"))
+    assert nd == [{"symbol": "AAPL"}, {"isin": "X"}]
+
+
+def test_run_batch_preserves_order_and_reports_errors(source):
+    rows = [
+        {"symbol": "AAPL", "limit": 1},
+        {"symbol": "BOOM"},
+        {"limit": "many"},
+        {"command": "history", "symbol": "MSFT", "date": "2024-01-02", "price": 10.0},
+        {"symbol": "MSFT", "exchange": "NSQ"},
+    ] + [{"symbol": f"S{i}"} for i in range(20)]
+    results = list(run_batch(source, parse_queries(rows), workers=4))
+
+    assert [r.line for r in results] == list(range(1, 26))
+    assert [s["symbol"] for s in results[0].result] == ["AAPL"]
+    assert results[1].error == "ConnectionError: vendor down"
+    assert not results[2].ok and results[2].error.startswith("limit:")
+    assert results[3].command == "history"
+    assert results[3].result["valid"] is True
+    assert results[4].result[0]["symbol"] == "MSFT"
+    assert [call[0] for call in source.calls].count("resolve") == 1
+    assert 1 < source.peak <= 4
+
+
+def test_run_batch_reports_unknown_command(source):
+    rows = [
+        {"symbol": "AAPL"},
+        {"command": "quote", "symbol": "AAPL"},
+        {"command": "history", "symbol": "MSFT"},
+    ]
+    results = list(run_batch(source, parse_queries(rows), workers=2))
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[1].command == "search"
+    assert results[1].error == "command: Input should be 'search' or 'history'"
+    assert results[2].result["security"]["symbol"] == "MSFT"
+
+
+def test_run_batch_cli_reports_unreadable_lines(source):
+    stdin = io.StringIO('{"symbol": "AAPL"}\n{not json\n["AAPL"]\n{"symbol": "MSFT"}\n')
+    out = io.StringIO()
+    assert run_batch_cli(BatchArgs(format="json"), source, stdin=stdin, stdout=out) == 2
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [line["ok"] for line in lines] == [True, False, False, True]
+    assert lines[1]["error"].startswith("Invalid JSON:")
+    assert lines[2]["error"] == "Input should be a valid dictionary"
+    assert lines[3]["result"][0]["symbol"] == "MSFT"
+
+
+def test_run_batch_cli_rejects_output_format_before_querying(source):
+    stdin = io.StringIO('{"symbol": "AAPL"}\n')
+    with pytest.raises(ValueError, match="yaml"):
+        run_batch_cli(BatchArgs(format="yaml"), source, stdin=stdin, stdout=io.StringIO())
+    assert source.calls == []
+
+
+def test_format_result_text(source):
+    results = list(
+        run_batch(
+            source,
+            parse_queries([{"symbol": "AAPL", "limit": 2}, {"command": "history", "symbol": "M"}]),
+        )
+    )
+    assert format_result(results[0], "text") == "1\tsearch\tok\tAAPL,AAPL.L"
+    assert format_result(results[1], "text") == "2\thistory\tok\tM\t1 candles"
+
+
+def test_run_batch_cli_streams_ndjson(source, tmp_path):
+    path = tmp_path / "queries.csv"
+    path.write_text("command,symbol\nsearch,AAPL\nhistory,MSFT\nsearch,BOOM\n")
+    out = io.StringIO()
+    failures = run_batch_cli(
+        BatchArgs(input=str(path), format="json", workers=2), source, stdout=out
+    )
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert failures == 1
+    assert [line["ok"] for line in lines] == [True, True, False]
+    assert lines[1]["result"]["security"]["symbol"] == "MSFT"
+    assert "error" not in lines[0]
+
+    out = io.StringIO()
+    stdin = io.StringIO('{"symbol": "AAPL"}\n')
+    assert run_batch_cli(BatchArgs(format="text"), source, stdin=stdin, stdout=out) == 0
+    assert out.getvalue() == "1\tsearch\tok\tAAPL\n"
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from pydantic_market_data import OHLCV, FieldStorage, History, Security, StoragePolicy
+
+
+@pytest.fixture
+def history():
+    rng = np.random.default_rng(7)
+    prices = np.round(100 + rng.normal(0, 5, 500).cumsum(), 2)
+    candles = [
+        OHLCV(
+            date=datetime(2024, 1, 1) + timedelta(minutes=i),
+            open=p,
+            high=round(p + 0.37, 2),
+            low=round(p - 0.41, 2),
+            close=p,
+            volume=float(rng.integers(0, 10**10)),
+        )
+        for i, p in enumerate(prices)
+    ]
+    candles[3] = OHLCV(date=candles[3].date, close=1.25)  # missing open/high/low/volume
+    return History(security=Security(symbol="X", name="X"), candles=candles)
+
+
+def test_fixed_point_round_trip_is_exact(history):
+    plain = history.to_columns()
+    compact = history.to_columns(StoragePolicy.fixed_point(decimals=2))
+    assert compact.raw("close").dtype == np.int64
+    for field in ("open", "high", "low", "close", "volume"):
+        np.testing.assert_array_equal(compact[field], plain[field])
+    assert compact.to_candles() == history.candles
+
+
+def test_fixed_point_rejects_lossy_values():
+    storage = FieldStorage(dtype="int64", decimals=2)
+    with pytest.raises(ValueError, match="not exactly representable"):
+        storage.encode(np.array([1.25, 1.255]), "close")
+    with pytest.raises(ValueError, match="overflows int32"):
+        FieldStorage(dtype="int32", decimals=4).encode(np.array([500_000.0]), "close")
+
+
+def test_float32_and_int32_halve_memory(history):
+    plain = history.to_columns()
+    half = plain.with_storage(StoragePolicy.float32())
+    assert half.raw("close").dtype == np.float32
+    np.testing.assert_allclose(half.close, plain.close, rtol=1e-7)
+    np.testing.assert_array_equal(half.volume, plain.volume)
+
+    policy = StoragePolicy.prices(
+        FieldStorage(dtype="int32", decimals=2), FieldStorage(dtype="int32")
+    )
+    with pytest.raises(ValueError, match="overflows"):
+        plain.with_storage(policy)  # volumes above 2**31
+    small = plain.with_storage(StoragePolicy.prices(FieldStorage(dtype="int32", decimals=2)))
+    assert small.nbytes == plain.nbytes * 6 // 10
+    np.testing.assert_array_equal(small.high, plain.high)
+
+
+def test_storage_survives_take_and_conversion(history):
+    compact = history.to_columns(StoragePolicy.fixed_point(decimals=2))
+    head = compact.take(slice(0, 5))
+    assert head.policy == compact.policy
+    assert head.raw("open").dtype == np.int64
+    assert np.isnan(head.open[3])
+    assert head.to_pandas().equals(history.to_columns().take(slice(0, 5)).to_pandas())
+    assert History.from_columns(history.security, head).candles == history.candles[:5]
@@ -0,0 +1,101 @@
+import time
+
+import pytest
+
+from pydantic_market_data import (
+    CompositeDataSource,
+    Price,
+    Security,
+    SecurityQuery,
+    merge_search_results,
+)
+
+
+def test_failover_skips_errors_and_misses(stub_source):
+    sources = [
+        stub_source("broken", error=ConnectionError("down")),
+        stub_source("empty"),
+        stub_source("good", price=10.0),
+    ]
+    with CompositeDataSource(sources) as composite:
+        assert composite.get_price("AAPL") == Price(10.0)
+        assert composite.history("AAPL").security.name == "good"
+    assert [len(s.calls) for s in sources] == [2, 2, 2]
+
+
+def test_failover_stops_at_first_answer(stub_source):
+    sources = [stub_source("first", price=1.0), stub_source("second", price=2.0)]
+    with CompositeDataSource(sources) as composite:
+        assert composite.get_price("AAPL") == Price(1.0)
+    assert sources[1].calls == []
+
+
+def test_failover_returns_miss_when_nobody_has_data(stub_source):
+    sources = [stub_source("broken", error=ConnectionError()), stub_source("empty", results=[])]
+    with CompositeDataSource(sources) as composite:
+        assert composite.get_price("AAPL") is None
+        assert composite.resolve(SecurityQuery(symbol="AAPL")) is None
+
+
+def test_failover_raises_when_every_source_fails(stub_source):
+    sources = [stub_source("a", error=ConnectionError()), stub_source("b", error=TimeoutError())]
+    with CompositeDataSource(sources) as composite, pytest.raises(TimeoutError):
+        composite.get_price("AAPL")
+
+
+def test_hedge_takes_first_answer(stub_source):
+    slow = stub_source("slow", price=1.0, delay=0.5)
+    fast = stub_source("fast", price=2.0)
+    with CompositeDataSource([slow, fast], hedge_after=0.02) as composite:
+        started = time.perf_counter()
+        assert composite.get_price("AAPL") == Price(2.0)
+        assert time.perf_counter() - started < 0.4
+
+
+def test_hedge_does_not_fire_for_fast_primary(stub_source):
+    primary = stub_source("primary", price=1.0)
+    backup = stub_source("backup", price=2.0)
+    with CompositeDataSource([primary, backup], hedge_after=1.0) as composite:
+        assert composite.get_price("AAPL") == Price(1.0)
+    assert backup.calls == []
+
+
+def test_hedge_fails_over_immediately_on_error(stub_source):
+    broken = stub_source("broken", error=ConnectionError())
+    good = stub_source("good", price=3.0)
+    with CompositeDataSource([broken, good], hedge_after=10.0) as composite:
+        started = time.perf_counter()
+        assert composite.get_price("AAPL") == Price(3.0)
+        assert time.perf_counter() - started < 1.0
+
+
+def test_merge_search_results_deduplicates_by_isin_and_figi():
+    primary = [
+        Security(symbol="AAPL", name="Apple Inc", isin="US0378331005"),
+        Security(symbol="MSFT", name="Microsoft", exchange="NSQ"),
+    ]
+    secondary = [
+        Security(symbol="AAPL.O", name="APPLE", isin="US0378331005", figi="BBG000B9XRY4"),
+        Security(symbol="AAPL:US", name="Apple", figi="BBG000B9XRY4", currency="USD"),
+        Security(symbol="MSFT", name="Microsoft Corp", exchange="NSQ"),
+        Security(symbol="MSFT", name="Microsoft Corp", exchange="LSE"),
+    ]
+    merged = merge_search_results([primary, secondary])
+    assert [str(s.symbol) for s in merged] == ["AAPL", "MSFT", "MSFT"]
+    apple = merged[0]
+    assert apple.name == "Apple Inc"
+    assert str(apple.figi) == "BBG000B9XRY4"
+    assert str(apple.currency) == "USD"
+    assert merged[2].exchange == "LSE"
+
+
+def test_composite_search_merges_and_tolerates_errors(stub_source):
+    sources = [
+        stub_source("a", results=[Security(symbol="AAPL", name="Apple", isin="US0378331005")]),
+        stub_source("b", error=ConnectionError()),
+        stub_source("c", results=[Security(symbol="AAPL.O", name="Apple", isin="US0378331005")]),
+    ]
+    with CompositeDataSource(sources) as composite:
+        results = composite.search("apple")
+    assert len(results) == 1
+    assert str(results[0].symbol) == "AAPL"
@@ -0,0 +1,149 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pydantic_market_data import OHLCV, FXConverter, History, Price, Security
+from pydantic_market_data.fx import parse_pair
+
+
+def _rates(symbol, closes, start=datetime(2024, 1, 1), step=timedelta(days=1)):
+    return History(
+        security=Security(symbol=symbol, name=symbol),
+        candles=[OHLCV(date=start + i * step, close=c) for i, c in enumerate(closes)],
+    )
+
+
+def _prices(currency, days=(1, 2, 3, 4), close=100.0):
+    return History(
+        security=Security(symbol="SAP", name="SAP SE", currency=currency),
+        candles=[
+            OHLCV(
+                date=datetime(2024, 1, d, 17),
+                open=close,
+                high=close + 2,
+                low=close - 2,
+                close=close,
+                volume=50,
+            )
+            for d in days
+        ],
+    )
+
+
+def test_parse_pair():
+    assert parse_pair("EURUSD") == ("EUR", "USD")
+    assert parse_pair("eur/usd") == ("EUR", "USD")
+    assert parse_pair("GBPJPY=X") == ("GBP", "JPY")
+    with pytest.raises(ValueError):
+        parse_pair("AAPL")
+
+
+def test_convert_history_as_of():
+    fx = FXConverter([_rates("EURUSD", [1.10, 1.20, 1.30])])
+    converted = fx.convert(_prices("EUR", days=(1, 2, 3, 4)), "USD")
+    assert str(converted.security.currency) == "USD"
+    # Jan 4 has no rate of its own and takes Jan 3's
+    assert [c.close for c in converted.candles] == pytest.approx([110, 120, 130, 130])
+    assert [c.high for c in converted.candles] == pytest.approx([112.2, 122.4, 132.6, 132.6])
+    assert [c.volume for c in converted.candles] == [50] * 4
+
+
+def test_inverse_and_cross_rates():
+    fx = FXConverter([_rates("EURUSD", [1.25] * 3), _rates("USDJPY", [150.0] * 3)])
+    back = fx.convert(_prices("USD", close=125.0), "EUR")
+    assert back.candles[0].close == pytest.approx(100.0)
+    cross = fx.convert(_prices("EUR"), "JPY")
+    assert cross.candles[0].close == pytest.approx(100 * 1.25 * 150)
+    assert fx.rate("JPY", "EUR", datetime(2024, 1, 2)) == pytest.approx(1 / 187.5)
+    with pytest.raises(LookupError, match="CHF"):
+        fx.convert(_prices("CHF"), "USD")
+
+
+def test_before_first_rate_and_same_currency():
+    fx = FXConverter([_rates("EURUSD", [1.1], start=datetime(2024, 1, 3))])
+    converted = fx.convert(_prices("EUR"), "USD")
+    assert [c.close for c in converted.candles] == [
+        None,
+        None,
+        pytest.approx(110),
+        pytest.approx(110),
+    ]
+    assert fx.rate("EUR", "USD", datetime(2024, 1, 1)) is None
+    usd = _prices("USD")
+    assert fx.convert(usd, "USD") is usd
+    with pytest.raises(ValueError, match="no currency"):
+        fx.convert(_prices(None), "USD")
+
+
+def test_timezone_aware_index():
+    fx = FXConverter(
+        [_rates("EURUSD", [1.0, 2.0], start=datetime(2024, 1, 1, 12), step=timedelta(hours=1))]
+    )
+    # 13:30 in Paris is 12:30 UTC, so the 12:00 UTC rate applies
+    paris = timezone(timedelta(hours=1))
+    factors = fx.factors(
+        "EUR", "USD", pd.DatetimeIndex([datetime(2024, 1, 1, 13, 30, tzinfo=paris)])
+    )
+    np.testing.assert_array_equal(factors, [1.0])
+
+
+def test_convert_price():
+    fx = FXConverter([_rates("EURUSD", [1.1, 1.2])])
+    assert fx.convert_price(Price(10), "EUR", "USD", datetime(2024, 1, 2, 9)) == Price(12.0)
+    assert fx.convert_price(10, "EUR", "USD", datetime(2023, 1, 1)) is None
+
+
+def test_conversion_cache():
+    fx = FXConverter([_rates("EURUSD", [1.1, 1.2, 1.3])])
+    history = _prices("EUR")
+    first = fx.convert(history, "USD")
+    assert fx.convert(history, "USD") is first
+    other = _prices("EUR")
+    assert fx.convert_many([history, other], "USD") == [first, first]
+    assert fx.convert(other, "USD") is not first
+    fx.add_rates(_rates("EUR/USD", [2.0, 2.0, 2.0]))
+    refreshed = fx.convert(history, "USD")
+    assert refreshed is not first
+    assert refreshed.candles[0].close == pytest.approx(200.0)
+
+
+def test_conversion_cache_sees_earlier_changes():
+    fx = FXConverter([_rates("EURUSD", [2.0] * 4)], cache_size=2)
+    raw = _prices("EUR")
+    assert [c.close for c in fx.convert(raw, "USD").candles] == [200.0] * 4
+    # Same symbol, length, first/last date and last close, different earlier candles
+    changed = raw.model_copy(
+        update={
+            "candles": [c.model_copy(update={"close": 50.0}) for c in raw.candles[:2]]
+            + raw.candles[2:]
+        }
+    )
+    assert [c.close for c in fx.convert(changed, "USD").candles] == [100.0, 100.0, 200.0, 200.0]
+
+    for _ in range(3):
+        fx.convert(_prices("EUR"), "USD")
+    assert len(fx._cache) == 2
+
+
+def test_conversion_cache_sees_in_place_changes():
+    fx = FXConverter([_rates("EURUSD", [2.0] * 4)])
+    history = _prices("EUR")
+    first = fx.convert(history, "USD")
+    # Growing the candle list
+    extra = history.candles.pop()
+    assert len(fx.convert(history, "USD").candles) == 3
+    history.candles.append(extra)
+    assert len(fx.convert(history, "USD").candles) == 4
+    # Replacing the list, then the last candle
+    history.candles = [c.model_copy(update={"close": 50.0}) for c in history.candles]
+    assert fx.convert(history, "USD").candles[0].close == pytest.approx(100.0)
+    history.candles[-1] = history.candles[-1].model_copy(update={"close": 10.0})
+    assert fx.convert(history, "USD").candles[-1].close == pytest.approx(20.0)
+    # Editing a candle's values in place needs invalidate()
+    history.candles[0].close = 1.0
+    assert fx.convert(history, "USD").candles[0].close == pytest.approx(100.0)
+    fx.invalidate()
+    assert fx.convert(history, "USD").candles[0].close == pytest.approx(2.0)
+    assert first.candles[0].close == pytest.approx(200.0)
@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pydantic_market_data import OHLCV, History, Security, indicators
+
+
+@pytest.fixture
+def history():
+    rng = np.random.default_rng(42)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 60)))
+    start = datetime(2024, 1, 1)
+    candles = [
+        OHLCV(
+            date=start + timedelta(days=i),
+            open=c * 0.999,
+            high=c * 1.01,
+            low=c * 0.99,
+            close=c,
+            volume=float(1000 + i),
+        )
+        for i, c in enumerate(close)
+    ]
+    return History(security=Security(symbol="X", name="X"), candles=candles)
+
+
+def _stream(indicator, history):
+    return np.array([np.nan if v is None else v for v in map(indicator.update, history.candles)])
+
+
+def test_returns(history):
+    close = history.to_pandas()["Close"]
+    assert np.allclose(indicators.returns(history), close.pct_change(), equal_nan=True)
+    assert np.allclose(
+        indicators.log_returns(history), np.log(close / close.shift()), equal_nan=True
+    )
+
+
+def test_sma_matches_pandas(history):
+    expected = history.to_pandas()["Close"].rolling(10).mean().to_numpy()
+    assert np.allclose(indicators.sma(history, 10), expected, equal_nan=True)
+    assert np.allclose(_stream(indicators.SMA(10), history), expected, equal_nan=True)
+
+
+def test_ema_streaming_matches_vectorized(history):
+    expected = indicators.ema(history, 12)
+    assert np.allclose(_stream(indicators.EMA(12), history), expected)
+
+
+def test_rolling_volatility(history):
+    close = history.to_pandas()["Close"]
+    expected = np.log(close / close.shift()).rolling(20).std().to_numpy() * np.sqrt(252)
+    vectorized = indicators.rolling_volatility(history, 20, periods_per_year=252)
+    assert np.allclose(vectorized, expected, equal_nan=True)
+    streamed = _stream(indicators.RollingVolatility(20, periods_per_year=252), history)
+    assert np.allclose(streamed, expected, equal_nan=True)
+
+
+def test_rolling_volatility_streaming_does_not_drift():
+    rng = np.random.default_rng(7)
+    close = 1e4 * np.exp(np.cumsum(rng.normal(0, 0.02, 5000)))
+    start = datetime(2024, 1, 1)
+    candles = [OHLCV(date=start + timedelta(days=i), close=c) for i, c in enumerate(close)]
+    history = History(security=Security(symbol="X", name="X"), candles=candles)
+    streamed = _stream(indicators.RollingVolatility(5), history)
+    expected = indicators.rolling_volatility(history, 5)
+    assert np.allclose(streamed, expected, rtol=1e-9, atol=0, equal_nan=True)
+
+
+def test_atr_streaming_matches_vectorized(history):
+    vectorized = indicators.atr(history, 14)
+    assert np.isnan(vectorized[:13]).all()
+    assert vectorized[13] == pytest.approx(indicators.true_range(history)[:14].mean())
+    assert np.allclose(_stream(indicators.ATR(14), history), vectorized, equal_nan=True)
+
+
+def test_true_range_uses_previous_close():
+    candles = [
+        OHLCV(date=datetime(2024, 1, 1), high=10, low=9, close=10),
+        OHLCV(date=datetime(2024, 1, 2), high=13, low=12, close=12.5),
+    ]
+    h = History(security=Security(symbol="X", name="X"), candles=candles)
+    assert indicators.true_range(h).tolist() == [1.0, 3.0]
+
+
+def test_vwap(history):
+    df = history.to_pandas()
+    typical = (df["High"] + df["Low"] + df["Close"]) / 3
+    expected = ((typical * df["Volume"]).cumsum() / df["Volume"].cumsum()).to_numpy()
+    assert np.allclose(indicators.vwap(history), expected)
+    assert np.allclose(_stream(indicators.VWAP(), history), expected)
+
+
+def test_indicators_accept_columns(history):
+    columns = history.to_columns()
+    assert np.allclose(indicators.sma(columns, 5), indicators.sma(history, 5), equal_nan=True)
+
+
+def test_short_history():
+    h = History(
+        security=Security(symbol="X", name="X"),
+        candles=[OHLCV(date=datetime(2024, 1, 1), high=1, low=1, close=1, volume=1)],
+    )
+    assert np.isnan(indicators.sma(h, 5)).all()
+    assert np.isnan(indicators.atr(h, 5)).all()
+    assert np.isnan(indicators.rolling_volatility(h, 5)).all()
+    assert pd.isna(indicators.returns(h)[0])
+
+
+def test_streaming_rejects_missing_values():
+    with pytest.raises(ValueError, match="no close"):
+        indicators.SMA(3).update(OHLCV(date=datetime(2024, 1, 1)))
+    with pytest.raises(ValueError, match="no close"):
+        indicators.ATR(3).update(OHLCV(date=datetime(2024, 1, 1), high=2, low=1))
+
+
+@pytest.mark.parametrize(
+    ("make", "match"),
+    [
+        (lambda: indicators.SMA(0), "window must be at least 1"),
+        (lambda: indicators.EMA(0), "span must be at least 1"),
+        (lambda: indicators.RollingVolatility(1), "window must be at least 2"),
+        (lambda: indicators.ATR(0), "window must be at least 1"),
+    ],
+)
+def test_streaming_rejects_bad_windows(make, match):
+    with pytest.raises(ValueError, match=match):
+        make()
@@ -0,0 +1,119 @@
+import gzip
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pydantic_market_data import (
+    SecurityRegistry,
+    StoragePolicy,
+    iter_columns,
+    iter_histories,
+    read_columns,
+    read_history,
+    write_parquet,
+)
+
+
+def _multi_csv(path, histories):
+    frames = [h.to_pandas().reset_index().assign(Ticker=str(h.security.symbol)) for h in histories]
+    pd.concat(frames).to_csv(path, index=False)
+
+
+@pytest.mark.parametrize(("chunk_rows", "workers"), [(100_000, 1), (3, 1), (4, 3)])
+def test_read_columns_csv(make_history, tmp_path, chunk_rows, workers):
+    history = make_history("AAPL", 10)
+    path = tmp_path / "aapl.csv"
+    history.to_pandas().to_csv(path)
+
+    columns = read_columns(path, chunk_rows=chunk_rows, workers=workers)
+    pd.testing.assert_frame_equal(columns.to_pandas(), history.to_pandas(), check_freq=False)
+
+    loaded = read_history(path, history.security, chunk_rows=chunk_rows, workers=workers)
+    assert loaded == history
+
+
+def test_read_columns_gzip_aliases_and_policy(tmp_path):
+    path = tmp_path / "prices.csv.gz"
+    with gzip.open(path, "wt") as f:
+        f.write("timestamp,px_last,OPEN,extra\n2024-01-02,10.5,10.0,x\n2024-01-03,11.25,,y\n")
+
+    columns = read_columns(
+        path, columns={"close": "px_last"}, chunk_rows=1, policy=StoragePolicy.fixed_point(2)
+    )
+    assert columns.raw("close").dtype == np.int64
+    assert columns.close.tolist() == [10.5, 11.25]
+    assert columns.open[0] == 10.0
+    assert np.isnan(columns.open[1])
+    assert np.isnan(columns.volume).all()
+    assert list(columns.index) == [pd.Timestamp("2024-01-02"), pd.Timestamp("2024-01-03")]
+
+
+def test_read_columns_requires_date(tmp_path):
+    path = tmp_path / "bad.csv"
+    path.write_text("close\n1.0\n")
+    with pytest.raises(ValueError, match="No date column"):
+        read_columns(path)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_iter_histories_grouped(make_history, tmp_path, workers):
+    histories = [make_history("AAPL", 5), make_history("MSFT", 1), make_history("SAP", 7)]
+    path = tmp_path / "universe.csv"
+    _multi_csv(path, histories)
+    registry = SecurityRegistry([h.security for h in histories[:1]])
+
+    loaded = list(iter_histories(path, registry, chunk_rows=2, workers=workers))
+    assert loaded == histories
+    assert loaded[0].security is registry["AAPL"]
+
+
+def test_iter_columns_interleaved(make_history, tmp_path):
+    histories = [make_history("AAPL", 4), make_history("MSFT", 4)]
+    frame = pd.concat(
+        h.to_pandas().reset_index().assign(Symbol=str(h.security.symbol)) for h in histories
+    ).sort_values(["Date", "Symbol"])
+    path = tmp_path / "interleaved.csv"
+    frame.to_csv(path, index=False)
+
+    with pytest.raises(ValueError, match="not contiguous"):
+        list(iter_columns(path, chunk_rows=3))
+
+    loaded = dict(iter_columns(path, grouped=False, chunk_rows=3))
+    assert list(loaded) == ["AAPL", "MSFT"]
+    for history in histories:
+        expected = history.to_columns().to_pandas()
+        pd.testing.assert_frame_equal(
+            loaded[str(history.security.symbol)].to_pandas(), expected, check_freq=False
+        )
+
+
+def test_read_parquet(make_history, tmp_path):
+    pytest.importorskip("pyarrow")
+    history = make_history("AAPL", 10)
+    [path] = write_parquet([history], tmp_path, max_workers=1)
+
+    assert read_history(path, history.security, chunk_rows=3, workers=2) == history
+
+
+def test_read_columns_offsets_become_utc(tmp_path):
+    index = pd.date_range("2024-03-08 15:00", periods=4, freq="D", tz="America/New_York")
+    frame = pd.DataFrame({"Close": [1.0, 2.0, 3.0, 4.0]}, index=index.rename("Date"))
+    path = tmp_path / "dst.csv"
+    frame.to_csv(path)
+
+    columns = read_columns(path, chunk_rows=2)
+    assert str(columns.index.tz) == "UTC"
+    assert columns.index.equals(index.tz_convert("UTC"))
+
+
+def test_iter_histories_parquet(make_history, tmp_path):
+    pytest.importorskip("pyarrow")
+    histories = [make_history("AAPL", 5), make_history("MSFT", 3)]
+    frame = pd.concat(
+        h.to_pandas().reset_index().assign(Symbol=str(h.security.symbol)) for h in histories
+    )
+    path = tmp_path / "universe.parquet"
+    frame.to_parquet(path)
+
+    assert list(iter_histories(path, chunk_rows=2, workers=2)) == histories
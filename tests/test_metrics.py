@@ -0,0 +1,108 @@
+import logging
+
+import pytest
+
+from pydantic_market_data import (
+    CallEvent,
+    InMemorySink,
+    InstrumentedDataSource,
+    LoggingSink,
+    PrometheusSink,
+)
+from pydantic_market_data.metrics import Histogram
+
+
+class StepClock:
+    def __init__(self, step: float):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
+
+
+def test_histogram_buckets_and_quantile():
+    hist = Histogram([0.1, 1.0])
+    for value in (0.05, 0.1, 0.5, 3.0):
+        hist.observe(value)
+    assert hist.cumulative() == [(0.1, 2), (1.0, 3), (float("inf"), 4)]
+    assert hist.quantile(0.5) == 0.1
+    assert hist.quantile(0.75) == 1.0
+    assert hist.count == 4
+    assert hist.sum == pytest.approx(3.65)
+
+
+def test_instrumented_source_records_calls(stub_source):
+    sink = InMemorySink()
+    stub = stub_source(price=1.0, candles=3, errors={"BOOM": ConnectionError("vendor down")})
+    source = InstrumentedDataSource(stub, sink, name="stub", clock=StepClock(0.02))
+    source.search("apple")
+    source.history("AAPL")
+    source.history("AAPL")
+    with pytest.raises(ConnectionError):
+        source.get_price("BOOM")
+
+    assert sink.calls[("stub", "history")] == 2
+    assert sink.sizes[("stub", "history")].sum == 6
+    assert sink.sizes[("stub", "search")].sum == 2
+    assert sink.errors[("stub", "get_price", "ConnectionError")] == 1
+    assert sink.latency[("stub", "search")].sum == pytest.approx(0.02)
+
+    summary = sink.snapshot()
+    assert summary["stub.history"]["calls"] == 2
+    assert summary["stub.history"]["total_size"] == 6
+    assert summary["stub.get_price"]["errors"] == 1
+    assert summary["stub.get_price"]["total_size"] is None
+
+
+def test_instrumented_source_defaults(stub_source):
+    source = InstrumentedDataSource(stub_source())
+    source.search("apple")
+    assert isinstance(source.sink, InMemorySink)
+    assert source.sink.calls[("StubSource", "search")] == 1
+
+
+def test_cache_hit_rate():
+    sink = InMemorySink()
+    assert sink.cache_hit_rate("cache") is None
+    assert not sink.cache  # querying does not create series
+    for hit in (True, True, True, False):
+        sink.record_cache("cache", hit)
+    assert sink.cache_hit_rate("cache") == 0.75
+
+
+def test_prometheus_render():
+    sink = PrometheusSink(latency_buckets=[0.1, 1.0])
+    sink.record_call(CallEvent(source='ya"hoo', method="history", duration=0.5, size=20))
+    sink.record_call(CallEvent(source='ya"hoo', method="history", duration=2.0, error="Timeout"))
+    sink.record_cache("prices", hit=False)
+    assert sink.cache_hit_rate("other") is None
+    text = sink.render()
+    assert 'source="other"' not in text
+    assert "# TYPE datasource_call_duration_seconds histogram" in text
+    assert (
+        'datasource_call_duration_seconds_bucket{source="ya\\"hoo",method="history",le="0.1"} 0'
+        in text
+    )
+    assert (
+        'datasource_call_duration_seconds_bucket{source="ya\\"hoo",method="history",le="1.0"} 1'
+        in text
+    )
+    assert (
+        'datasource_call_duration_seconds_bucket{source="ya\\"hoo",method="history",le="+Inf"} 2'
+        in text
+    )
+    assert 'datasource_call_duration_seconds_count{source="ya\\"hoo",method="history"} 2' in text
+    assert 'datasource_calls_total{source="ya\\"hoo",method="history"} 2' in text
+    assert 'datasource_errors_total{source="ya\\"hoo",method="history",error="Timeout"} 1' in text
+    assert 'datasource_cache_requests_total{source="prices",result="miss"} 1' in text
+    assert text.endswith("\n")
+
+
+def test_logging_sink(stub_source, caplog):
+    source = InstrumentedDataSource(stub_source(price=1.0, candles=3), LoggingSink(), name="stub")
+    with caplog.at_level(logging.DEBUG, logger="pydantic_market_data.metrics"):
+        source.history("AAPL")
+    assert "stub.history took" in caplog.text
+    assert "size=3" in caplog.text
@@ -3,7 +3,15 @@ from datetime import date, datetime
 import pytest
 from pydantic import ValidationError
 
-from pydantic_market_data import OHLCV, History, PriceOnDate, Security, SecurityQuery, Symbol
+from pydantic_market_data import (
+    OHLCV,
+    History,
+    MergePolicy,
+    PriceOnDate,
+    Security,
+    SecurityQuery,
+    Symbol,
+)
 from pydantic_market_data.models import clean_isin, validate_figi, validate_isin
 
 
@@ -69,6 +77,41 @@ def test_history_to_pandas():
     assert df.iloc[0]["Close"] == 100.0
 
 
+def _candles(days, close):
+    return [OHLCV(date=datetime(2023, 1, d), close=close) for d in days]
+
+
+def test_history_merge_overlap():
+    security = Security(symbol="TEST", name="Test")
+    cached = History(security=security, candles=_candles([1, 2, 3], 1.0))
+    fresh = History(security=security, candles=_candles([3, 4], 2.0))
+
+    merged = cached.merge(fresh)
+    assert [c.date.day for c in merged.candles] == [1, 2, 3, 4]
+    assert [c.close for c in merged.candles] == [1.0, 1.0, 2.0, 2.0]
+    assert merged.candles[0] is cached.candles[0]
+    assert len(cached.candles) == 3
+
+    kept = cached.merge(fresh, policy=MergePolicy.KEEP_OLDER)
+    assert [c.close for c in kept.candles] == [1.0, 1.0, 1.0, 2.0]
+    assert kept.candles[2] is cached.candles[2]
+
+
+def test_history_append_unsorted_and_duplicates():
+    h = History(security=Security(symbol="TEST", name="Test"), candles=_candles([5, 1], 1.0))
+    appended = h.append([{"date": "2023-01-03", "close": 3.0}, *_candles([1, 1], 2.0)])
+    assert [c.date.day for c in appended.candles] == [1, 3, 5]
+    assert appended.candles[0].close == 2.0
+    assert h.append([], policy="older").candles == _candles([1, 5], 1.0)
+
+
+def test_history_merge_rejects_other_security():
+    a = History(security=Security(symbol="A", name="A"), candles=[])
+    b = History(security=Security(symbol="B", name="B"), candles=[])
+    with pytest.raises(ValueError, match="Cannot merge"):
+        a.merge(b)
+
+
 def test_flexible_date_parsing():
     # ISO Format
     p1 = PriceOnDate(price=100.0, date="2023-01-01")
@@ -0,0 +1,28 @@
+import subprocess
+import sys
+
+import pytest
+
+import pydantic_market_data
+
+
+def test_all_names_resolve():
+    for name in pydantic_market_data.__all__:
+        assert getattr(pydantic_market_data, name) is not None, name
+    assert set(pydantic_market_data.__all__) <= set(dir(pydantic_market_data))
+
+
+def test_optional_modules_load_on_first_access():
+    code = (
+        "import sys, pydantic_market_data as p\n"
+        "assert 'pydantic_market_data.server' not in sys.modules\n"
+        "assert 'pydantic_market_data.ingest' not in sys.modules\n"
+        "p.serve\n"
+        "assert 'pydantic_market_data.server' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError, match="no_such_name"):
+        pydantic_market_data.no_such_name  # noqa: B018
@@ -0,0 +1,117 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pydantic_market_data import OHLCV, History, HistoryPanel, OHLCVColumns, Security
+from pydantic_market_data.panel import ffill_2d
+
+nan = np.nan
+
+
+@pytest.fixture
+def histories(make_history):
+    return [
+        make_history("AAA", [0, 1, 2, 4], [1.0, 2.0, 3.0, 5.0]),
+        make_history("BBB", [1, 2, 3], [20.0, 30.0, 40.0]),
+    ]
+
+
+def test_ohlcv_columns_round_trip():
+    h = History(
+        security=Security(symbol="X", name="X"),
+        candles=[
+            OHLCV(date=datetime(2024, 1, 1), close=1.5, volume=10),
+            OHLCV(date=datetime(2024, 1, 2), open=2.0, close=2.5),
+        ],
+    )
+    cols = h.to_columns()
+    assert len(cols) == 2
+    assert cols.close.tolist() == [1.5, 2.5]
+    assert np.isnan(cols.open[0])
+    assert np.isnan(cols.volume[1])
+    assert cols.index.name == "Date"
+
+    rebuilt = History.from_columns(h.security, cols)
+    assert rebuilt.candles == h.candles
+    assert rebuilt.candles[0].open is None
+
+    df = cols.to_pandas()
+    pd.testing.assert_series_equal(df["Close"], h.to_pandas()["Close"])
+
+
+def test_ffill_2d_with_limit():
+    values = np.array([[nan, 1.0], [1.0, nan], [nan, nan], [nan, nan], [4.0, nan]])
+    filled = ffill_2d(values)
+    assert np.array_equal(filled[:, 0], [nan, 1.0, 1.0, 1.0, 4.0], equal_nan=True)
+    assert np.array_equal(filled[:, 1], [1.0, 1.0, 1.0, 1.0, 1.0])
+    limited = ffill_2d(values, limit=1)
+    assert np.array_equal(limited[:, 0], [nan, 1.0, 1.0, nan, 4.0], equal_nan=True)
+    assert np.array_equal(limited[:, 1], [1.0, 1.0, nan, nan, nan], equal_nan=True)
+
+
+def test_panel_outer_join(histories):
+    panel = HistoryPanel.from_histories(histories)
+    assert panel.shape == (5, 2)
+    assert panel.symbols == ["AAA", "BBB"]
+    assert np.array_equal(panel["close"][:, 0], [1.0, 2.0, 3.0, nan, 5.0], equal_nan=True)
+    assert np.array_equal(panel["close"][:, 1], [nan, 20.0, 30.0, 40.0, nan], equal_nan=True)
+
+
+def test_panel_inner_join(histories):
+    panel = HistoryPanel.from_histories(histories, join="inner")
+    assert list(panel.index) == [pd.Timestamp(2024, 1, 2), pd.Timestamp(2024, 1, 3)]
+    assert panel["close"].tolist() == [[2.0, 20.0], [3.0, 30.0]]
+
+
+def test_panel_forward_fill_prices_only(histories):
+    panel = HistoryPanel.from_histories(histories, fill="ffill")
+    assert panel["close"][3, 0] == 3.0
+    assert panel["close"][4, 1] == 40.0
+    assert np.isnan(panel["close"][0, 1])
+    assert np.isnan(panel["volume"][3, 0])
+
+
+def test_panel_duplicate_dates_keep_last(make_history):
+    h = make_history("DUP", [0, 0, 1], [1.0, 1.5, 2.0])
+    panel = HistoryPanel.from_histories([h])
+    assert panel["close"][:, 0].tolist() == [1.5, 2.0]
+
+
+def test_panel_to_pandas_multiindex(histories):
+    df = HistoryPanel.from_histories(histories).to_pandas()
+    assert df.columns.names == ["Field", "Symbol"]
+    assert df[("Close", "BBB")].iloc[1] == 20.0
+    assert df.index.name == "Date"
+    assert df.shape == (5, 10)
+
+
+def test_panel_field_frame_shares_memory(histories):
+    panel = HistoryPanel.from_histories(histories)
+    frame = panel.field_frame("close")
+    assert list(frame.columns) == ["AAA", "BBB"]
+    assert np.shares_memory(frame.to_numpy(), panel["close"])
+
+
+def test_panel_history_extraction(histories):
+    panel = HistoryPanel.from_histories(histories)
+    bbb = panel.history("BBB")
+    assert [c.close for c in bbb.candles] == [20.0, 30.0, 40.0]
+    assert bbb.security is histories[1].security
+
+
+def test_panel_rejects_duplicate_symbols(histories):
+    with pytest.raises(ValueError, match="unique"):
+        HistoryPanel.from_histories([histories[0], histories[0]])
+
+
+def test_panel_validates_shapes():
+    with pytest.raises(ValueError, match="shape"):
+        HistoryPanel(
+            pd.DatetimeIndex([datetime(2024, 1, 1)]),
+            [Security(symbol="A", name="A")],
+            {f: np.zeros((2, 1)) for f in ("open", "high", "low", "close", "volume")},
+        )
+    with pytest.raises(ValueError, match="shape"):
+        OHLCVColumns([datetime(2024, 1, 1)], {"close": np.zeros(3)})
@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pydantic_market_data import (
+    OHLCV,
+    History,
+    Security,
+    histories_to_pandas,
+    map_columns,
+    write_parquet,
+)
+from pydantic_market_data.parallel import PackedHistories
+
+
+def _last_close(columns, security, offset):
+    return str(security.symbol), float(columns.close[-1]) + offset, str(columns.index.tz)
+
+
+def test_packed_round_trip(make_history):
+    histories = [
+        make_history("A", 3),
+        make_history("B", 0),
+        make_history("C", 5, start=datetime(2024, 1, 1, tzinfo=timezone.utc)),
+    ]
+    with PackedHistories(histories) as packed:
+        assert packed.bounds == [0, 3, 3, 8]
+        c = packed.columns(2)
+        assert str(c.index.tz) == "UTC"
+        assert c.index[0] == pd.Timestamp("2024-01-01", tz="UTC")
+        np.testing.assert_array_equal(c.volume, [x.volume for x in histories[2].candles])
+        assert len(packed.columns(1)) == 0
+
+
+def test_histories_to_pandas_matches_to_pandas(make_history):
+    histories = [make_history("A", 10), make_history("B", 0), make_history("C", 4)]
+    frames = histories_to_pandas(histories)
+    for history, frame in zip(histories, frames, strict=True):
+        pd.testing.assert_frame_equal(frame, history.to_pandas())
+
+
+def test_histories_to_pandas_missing_fields():
+    start = datetime(2024, 1, 1)
+    history = History(
+        security=Security(symbol="A", name="A"),
+        candles=[
+            OHLCV(date=start, close=1.0, volume=5.0),
+            OHLCV(date=start + timedelta(days=1), close=2.0, high=float("nan")),
+        ],
+    )
+    (frame,) = histories_to_pandas([history])
+    pd.testing.assert_frame_equal(frame, history.to_pandas())
+    assert frame["Open"].tolist() == [None, None]
+    assert np.isnan(frame["Volume"].iloc[1])
+
+
+def test_map_columns_runs_in_workers(make_history):
+    histories = [make_history(f"S{i}", i + 1) for i in range(5)]
+    results = map_columns(_last_close, histories, 1.0, max_workers=2, chunksize=2)
+    assert results == [
+        (f"S{i}", h.candles[-1].close + 1.0, "None") for i, h in enumerate(histories)
+    ]
+
+
+def test_write_parquet(make_history, tmp_path):
+    pytest.importorskip("pyarrow")
+    histories = [make_history("AAPL:NSQ", 5), make_history("MSFT", 3)]
+    paths = write_parquet(histories, tmp_path, max_workers=2)
+    assert [p.name for p in paths] == ["AAPL_NSQ.parquet", "MSFT.parquet"]
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(paths[0]), histories[0].to_pandas(), check_freq=False
+    )
+
+
+def test_write_parquet_rejects_clashing_names(make_history, tmp_path):
+    with pytest.raises(ValueError, match="distinct symbols"):
+        write_parquet([make_history("A/B", 1), make_history("A:B", 1)], tmp_path)
@@ -1,6 +1,17 @@
 from datetime import date
 
-from pydantic_market_data import Price, PriceVerificationError, Symbol
+import pytest
+from pydantic import ValidationError
+
+from pydantic_market_data import (
+    Price,
+    PriceVerificationError,
+    StrictDate,
+    Symbol,
+    new_date,
+    new_price,
+    new_symbol,
+)
 
 
 def test_price_verification_error_primitives():
@@ -61,3 +72,26 @@ def test_price_verification_error_no_details():
     )
 
     assert str(err) == "[TSLA] No data found"
+
+
+def test_price_verification_error_validates_other_inputs():
+    err = PriceVerificationError("m", "AAPL", "2023-01-01", expected_price="150.5", actual_close=7)
+
+    assert type(err.expected_price) is Price
+    assert err.expected_price.value == 150.5
+    assert err.actual_close.value == 7.0
+
+    with pytest.raises(ValidationError):
+        PriceVerificationError("m", "AAPL", "2023-01-01", expected_price="n/a")
+
+
+def test_fast_constructors_match_validated_ones():
+    assert new_price(1.5) == Price(1.5)
+    assert type(new_price(1)) is Price
+    assert new_symbol("AAPL") == Symbol("AAPL")
+    assert new_date(date(2023, 1, 1)) == StrictDate(date(2023, 1, 1))
+
+    price = Price(2.0)
+    assert new_price(price) is price
+    with pytest.raises(ValidationError):
+        new_price("n/a")
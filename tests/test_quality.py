@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from pydantic_market_data import (
+    HistoryInterval,
+    HistoryPanel,
+    IssueKind,
+    scan_histories,
+    scan_history,
+    scan_panel,
+)
+
+
+def _weekdays(n, start=datetime(2024, 1, 1)):
+    return list(pd.bdate_range(start, periods=n).to_pydatetime())
+
+
+def test_clean_history(make_history):
+    report = scan_history(make_history("X", _weekdays(30)))
+    assert report.ok
+    assert report.candles == 30
+    assert report.symbol == "X"
+
+
+def test_ohlc_inconsistencies(make_history):
+    h = make_history(
+        "X",
+        _weekdays(6),
+        overrides={
+            1: {"high": 8.0},
+            2: {"close": 12.0},
+            3: {"open": 5.0},
+            4: {"volume": 0},
+            5: {"close": None, "low": -1.0},
+        },
+    )
+    report = scan_history(h, outlier_threshold=None)
+    assert report.counts == {
+        IssueKind.HIGH_BELOW_LOW: 1,
+        IssueKind.OPEN_OUT_OF_RANGE: 2,
+        IssueKind.CLOSE_OUT_OF_RANGE: 2,
+        IssueKind.ZERO_VOLUME: 1,
+        IssueKind.MISSING_CLOSE: 1,
+        IssueKind.NON_POSITIVE: 1,
+    }
+    assert [i.date for i in report.issues] == sorted(i.date for i in report.issues)
+
+
+def test_daily_gaps_skip_weekends(make_history):
+    dates = _weekdays(10)
+    del dates[3:5]  # Thu 4th and Fri 5th missing
+    report = scan_history(make_history("X", dates))
+    assert report.counts == {IssueKind.GAP: 1}
+    assert report.issues[0].date == datetime(2024, 1, 8)
+    assert report.issues[0].value == 2
+
+
+def test_intraday_gaps_ignore_overnight(make_history):
+    day1 = [datetime(2024, 1, 2, 9, 30) + timedelta(minutes=5 * i) for i in range(6)]
+    day2 = [datetime(2024, 1, 3, 9, 30) + timedelta(minutes=5 * i) for i in range(6)]
+    del day2[2]
+    report = scan_history(make_history("X", day1 + day2), HistoryInterval.IM5)
+    assert [(i.kind, i.date, i.value) for i in report.issues] == [
+        (IssueKind.GAP, datetime(2024, 1, 3, 9, 45), 1.0)
+    ]
+
+
+def test_weekly_and_monthly_gaps(make_history):
+    weeks = [datetime(2024, 1, 1) + timedelta(weeks=w) for w in (0, 1, 4)]
+    assert scan_history(make_history("X", weeks), HistoryInterval.W1).issues[0].value == 2
+    months = [datetime(2024, m, 1) for m in (1, 2, 5)]
+    assert scan_history(make_history("X", months), HistoryInterval.MO1).issues[0].value == 2
+
+
+def test_duplicates_unsorted_and_outliers(make_history):
+    dates = _weekdays(30)
+    dates[10] = dates[9]
+    dates[20], dates[21] = dates[21], dates[20]
+    h = make_history("X", dates, overrides={25: {"close": 30.0, "high": 31.0}})
+    report = scan_history(h)
+    assert report.counts[IssueKind.DUPLICATE] == 1
+    assert report.counts[IssueKind.UNSORTED] == 1
+    assert report.counts[IssueKind.OUTLIER] == 2  # the jump and the fall back
+    assert IssueKind.GAP in report.counts  # the duplicated slot left a missing day
+
+
+def test_panel_and_many_histories(make_history):
+    a = make_history("A", _weekdays(10), overrides={2: {"high": 8.0}})
+    dates = _weekdays(10)
+    del dates[5]
+    b = make_history("B", dates)
+    reports = scan_panel(HistoryPanel.from_histories([a, b]))
+    assert reports["A"].counts == {
+        IssueKind.HIGH_BELOW_LOW: 1,
+        IssueKind.OPEN_OUT_OF_RANGE: 1,
+        IssueKind.CLOSE_OUT_OF_RANGE: 1,
+    }
+    assert reports["B"].counts == {IssueKind.GAP: 1}
+    assert reports["B"].candles == 9
+
+    many = scan_histories([a, b], max_workers=2)
+    assert [r.symbol for r in many] == ["A", "B"]
+    assert many[0].counts == reports["A"].counts
+    assert many[1].counts == reports["B"].counts
@@ -0,0 +1,132 @@
+from datetime import date
+
+import pytest
+
+from pydantic_market_data import (
+    RateLimit,
+    RateLimitedDataSource,
+    RetryPolicy,
+    Security,
+    TokenBucket,
+)
+
+
+class FlakySource:
+    def __init__(self, failures: int, error: Exception):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    def search(self, query: str) -> list[Security]:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        return [Security(symbol=query, name=query)]
+
+    def get_price(self, symbol, date=None):
+        self.calls += 1
+        return None
+
+
+def test_token_bucket_fifo_reservations(clock):
+    bucket = TokenBucket(rate=1.0, burst=2, clock=clock, sleep=clock.sleep)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(1.0)
+    assert bucket.reserve() == pytest.approx(2.0)
+
+    clock.now = 10.0
+    # Refill is capped at the burst size
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_token_bucket_rejects_oversized_reservation():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1.0, burst=1).reserve(2)
+
+
+def test_token_bucket_pause(clock):
+    bucket = TokenBucket(rate=2.0, burst=4, clock=clock, sleep=clock.sleep)
+    bucket.pause(5.0)
+    assert bucket.reserve() == pytest.approx(5.5)
+
+
+def test_rate_limited_source_throttles_calls(clock):
+    inner = FlakySource(failures=0, error=ConnectionError())
+    source = RateLimitedDataSource(
+        inner, limit=RateLimit(rate=10, burst=1), clock=clock, sleep=clock.sleep
+    )
+    for _ in range(3):
+        source.search("AAPL")
+    assert inner.calls == 3
+    assert clock.sleeps == pytest.approx([0.1, 0.1])
+
+
+def test_rate_limited_source_per_method_bucket(clock):
+    inner = FlakySource(failures=0, error=ConnectionError())
+    source = RateLimitedDataSource(
+        inner,
+        method_limits={"search": RateLimit(rate=1, burst=1)},
+        clock=clock,
+        sleep=clock.sleep,
+    )
+    source.get_price("AAPL", date(2024, 1, 2))
+    source.get_price("AAPL", date(2024, 1, 3))
+    assert clock.sleeps == []
+    source.search("AAPL")
+    source.search("AAPL")
+    assert clock.sleeps == pytest.approx([1.0])
+
+
+def test_rate_limited_source_retries_transient_errors(clock):
+    inner = FlakySource(failures=2, error=ConnectionError("reset"))
+    source = RateLimitedDataSource(
+        inner,
+        retry=RetryPolicy(max_attempts=3, base_delay=1.0),
+        seed=1,
+        clock=clock,
+        sleep=clock.sleep,
+    )
+    result = source.search("AAPL")
+    assert str(result[0].symbol) == "AAPL"
+    assert inner.calls == 3
+    assert len(clock.sleeps) == 2
+    assert 0 <= clock.sleeps[0] <= 1.0
+    assert 0 <= clock.sleeps[1] <= 2.0
+
+
+def test_rate_limited_source_gives_up_after_max_attempts(clock):
+    inner = FlakySource(failures=5, error=TimeoutError())
+    source = RateLimitedDataSource(
+        inner, retry=RetryPolicy(max_attempts=2), clock=clock, sleep=clock.sleep
+    )
+    with pytest.raises(TimeoutError):
+        source.search("AAPL")
+    assert inner.calls == 2
+
+
+def test_rate_limited_source_does_not_retry_other_errors():
+    inner = FlakySource(failures=1, error=KeyError("bad"))
+    source = RateLimitedDataSource(inner, sleep=lambda s: None)
+    with pytest.raises(KeyError):
+        source.search("AAPL")
+    assert inner.calls == 1
+
+
+def test_rate_limited_source_honours_retry_after(clock):
+    class Throttled(ConnectionError):
+        retry_after = 7.0
+
+    inner = FlakySource(failures=1, error=Throttled())
+    source = RateLimitedDataSource(
+        inner,
+        limit=RateLimit(rate=100, burst=10),
+        retry=RetryPolicy(base_delay=0.1),
+        clock=clock,
+        sleep=clock.sleep,
+    )
+    source.search("AAPL")
+    assert inner.calls == 2
+    assert clock.sleeps == pytest.approx([7.01])
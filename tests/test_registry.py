@@ -0,0 +1,94 @@
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from pydantic_market_data import (
+    OHLCV,
+    History,
+    HistoryBatch,
+    Security,
+    SecurityRegistry,
+    dump_histories_json,
+    load_histories_json,
+)
+
+_APPLE = {"symbol": "AAPL", "name": "Apple", "country": "United States", "isin": "US0378331005"}
+
+
+def _candles(n):
+    return [OHLCV(date=datetime(2024, 1, d + 1), close=float(d)) for d in range(n)]
+
+
+def test_registry_shares_instances():
+    registry = SecurityRegistry([_APPLE])
+    apple = registry["AAPL"]
+    assert registry.add(_APPLE) is apple
+    assert registry.add(Security.model_validate(_APPLE)) is apple
+    a = registry.history("AAPL", _candles(2))
+    b = registry.history("AAPL", [{"date": "2024-01-05", "close": 1.0}])
+    assert a.security is b.security is apple
+    assert b.candles[0].date == datetime(2024, 1, 5)
+    assert "AAPL" in registry and len(registry) == 1
+
+
+def test_registry_rejects_conflicting_security():
+    registry = SecurityRegistry([_APPLE])
+    with pytest.raises(ValueError, match="already registered"):
+        registry.add(Security(symbol="AAPL", name="Other"))
+    with pytest.raises(ValueError, match="already registered"):
+        registry.add({**_APPLE, "name": "Other"})
+    # A mapping that validates to the registered security is accepted
+    assert registry.add({**_APPLE, "country": "US"}) is registry["AAPL"]
+
+
+def test_load_rejects_conflicting_known_security():
+    registry = SecurityRegistry([_APPLE])
+    other = Security.model_validate({**_APPLE, "isin": None})
+    payload = dump_histories_json([History(security=other, candles=_candles(1))])
+    with pytest.raises(ValueError, match="already registered"):
+        load_histories_json(payload, registry)
+
+
+def test_load_rejects_unknown_security_key():
+    payload = '{"securities": [], "histories": [{"security": "MSFT", "candles": []}]}'
+    with pytest.raises(ValueError, match="unknown security MSFT"):
+        load_histories_json(payload, SecurityRegistry([_APPLE]))
+
+
+def test_intern_replaces_copies():
+    registry = SecurityRegistry()
+    first = History(security=Security.model_validate(_APPLE), candles=_candles(1))
+    second = History(security=Security.model_validate(_APPLE), candles=_candles(2))
+    assert registry.intern(first) is first
+    interned = registry.intern(second)
+    assert interned.security is first.security
+    assert interned.candles is second.candles
+
+
+def test_batch_round_trip_emits_each_security_once():
+    apple = Security.model_validate(_APPLE)
+    msft = Security(symbol="MSFT", name="Microsoft")
+    histories = [
+        History(security=apple, candles=_candles(2)),
+        History(security=msft, candles=_candles(1)),
+        History(security=apple, candles=_candles(3)),
+    ]
+    payload = dump_histories_json(histories)
+    raw = json.loads(payload)
+    assert [s["symbol"] for s in raw["securities"]] == ["AAPL", "MSFT"]
+    assert [h["security"] for h in raw["histories"]] == ["AAPL", "MSFT", "AAPL"]
+    HistoryBatch.model_validate_json(payload)
+
+    loaded = load_histories_json(payload)
+    assert loaded == histories
+    assert loaded[0].security is loaded[2].security
+
+
+def test_load_skips_validation_of_known_securities():
+    registry = SecurityRegistry([_APPLE])
+    payload = dump_histories_json([History(security=registry["AAPL"], candles=_candles(1))])
+    with patch.object(Security, "model_validate", side_effect=AssertionError("revalidated")):
+        loaded = load_histories_json(payload, registry)
+    assert loaded[0].security is registry["AAPL"]
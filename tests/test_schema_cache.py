@@ -0,0 +1,107 @@
+import json
+
+import pytest
+
+from pydantic_market_data import schema_cache
+from pydantic_market_data.cli_batch import BatchArgs
+from pydantic_market_data.cli_models import HistoryArgs, PatchedCliSettingsSource, SearchArgs
+from pydantic_market_data.schema_cache import cached_json_schema, precompute_schemas
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYDANTIC_MARKET_DATA_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(schema_cache, "_MEMO", {})
+    return tmp_path
+
+
+def test_cached_json_schema_matches_model_schema(cache_dir):
+    text = cached_json_schema(SearchArgs)
+    assert text == json.dumps(SearchArgs.model_json_schema(), indent=2)
+    files = list((cache_dir / "schema").rglob("*.json"))
+    assert len(files) == 1
+    assert files[0].read_text(encoding="utf-8") == text
+
+
+def test_cached_json_schema_reads_disk_copy(monkeypatch):
+    text = cached_json_schema(HistoryArgs)
+    monkeypatch.setattr(schema_cache, "_MEMO", {})
+
+    def fail(*args, **kwargs):
+        raise AssertionError("schema regenerated")
+
+    monkeypatch.setattr(HistoryArgs, "model_json_schema", fail)
+    assert cached_json_schema(HistoryArgs) == text
+
+
+def test_cached_json_schema_unwritable_directory(tmp_path, monkeypatch):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    monkeypatch.setenv("PYDANTIC_MARKET_DATA_CACHE_DIR", str(blocker))
+    assert json.loads(cached_json_schema(SearchArgs))["title"] == "SearchArgs"
+
+
+def test_precompute_schemas():
+    paths = precompute_schemas()
+    assert [p.exists() for p in paths] == [True, True, True]
+    assert json.loads(paths[2].read_text(encoding="utf-8"))["title"] == BatchArgs.__name__
+
+
+def test_patched_cli_settings_source_cached():
+    first = PatchedCliSettingsSource.cached(SearchArgs, cli_prog_name="md")
+    second = PatchedCliSettingsSource.cached(SearchArgs, cli_prog_name="md")
+    assert second is not first
+    assert second._root_parser is first._root_parser
+    other = PatchedCliSettingsSource.cached(SearchArgs, cli_prog_name="other")
+    assert other._root_parser is not first._root_parser
+    first(args=["--symbol", "AAPL"])
+    second(args=["--symbol", "MSFT"])
+    assert first()["symbol"] == "AAPL"
+    assert second()["symbol"] == "MSFT"
+
+
+def test_fingerprint_covers_pydantic_settings_version(monkeypatch):
+    before = schema_cache._fingerprint(SearchArgs)
+    monkeypatch.setattr(schema_cache.pydantic_settings, "__version__", "0.0.0")
+    assert schema_cache._fingerprint(SearchArgs) != before
+
+
+def test_fingerprint_covers_base_classes_and_field_types(tmp_path, monkeypatch):
+    (tmp_path / "fp_base.py").write_text(
+        "import enum\nfrom pydantic import BaseModel\n"
+        "class Kind(str, enum.Enum):\n    A = 'a'\n"
+        "class Base(BaseModel):\n    x: int = 0\n"
+    )
+    (tmp_path / "fp_types.py").write_text("import enum\nclass Size(str, enum.Enum):\n    S = 's'\n")
+    (tmp_path / "fp_child.py").write_text(
+        "from fp_base import Base\nfrom fp_types import Size\n"
+        "class Child(Base):\n    size: Size | None = None\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    from fp_child import Child  # noqa: PLC0415
+
+    before = schema_cache._fingerprint(Child)
+    for name in ("fp_base.py", "fp_types.py"):
+        path = tmp_path / name
+        path.write_text(path.read_text() + "# edited\n")
+        after = schema_cache._fingerprint(Child)
+        assert after != before
+        before = after
+
+
+def test_stale_fingerprints_are_pruned(cache_dir):
+    directory = schema_cache.schema_cache_dir()
+    old_version = directory.parent / "0.0.1"
+    stale = [
+        directory / f"{schema_cache._prefix(SearchArgs)}0123456789abcdef.json",
+        old_version / f"{schema_cache._prefix(SearchArgs)}fedcba9876543210.json",
+    ]
+    other = directory / f"{schema_cache._prefix(HistoryArgs)}0123456789abcdef.json"
+    for path in [*stale, other]:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("{}")
+
+    cached_json_schema(SearchArgs)
+    assert not any(p.exists() for p in stale)
+    assert other.exists()
+    assert len(list(directory.glob(f"{schema_cache._prefix(SearchArgs)}*.json"))) == 1
@@ -0,0 +1,187 @@
+import os
+import socket
+import threading
+import time
+from datetime import date
+
+import pytest
+
+from pydantic_market_data import (
+    DataSourceServer,
+    History,
+    HistoryPeriod,
+    Price,
+    PriceVerificationError,
+    RemoteDataSource,
+    RemoteError,
+    Security,
+    SecurityQuery,
+)
+from pydantic_market_data.wire import decode_call, decode_error, encode_call, encode_error
+
+
+class VendorError(Exception):
+    pass
+
+
+@pytest.fixture
+def source(stub_source):
+    limited = ConnectionError("rate limited")
+    limited.retry_after = 2.5
+    errors = {"BOOM": VendorError("vendor down"), "LIMIT": limited}
+    return stub_source("stub", price=100.0, candles=3, errors=errors)
+
+
+@pytest.fixture(params=["unix", "tcp"])
+def server(request, source, tmp_path):
+    address = str(tmp_path / "md.sock") if request.param == "unix" else ("127.0.0.1", 0)
+    with DataSourceServer(source, address) as server:
+        yield server
+
+
+@pytest.fixture
+def connect():
+    """RemoteDataSource factory closing every client it made at teardown."""
+    clients = []
+
+    def connect(address, **kwargs):
+        client = RemoteDataSource(address, **kwargs)
+        clients.append(client)
+        return client
+
+    yield connect
+    for client in clients:
+        client.close()
+
+
+def test_round_trip(server, source, connect):
+    client = connect(server.address)
+    assert client.health()
+
+    found = client.search("AAPL")
+    assert found == [Security(symbol="AAPL", name="AAPL"), Security(symbol="AAPL.L", name="AAPL")]
+
+    assert str(client.resolve(SecurityQuery(symbol="MSFT")).symbol) == "MSFT"
+    assert source.calls[-1] == ("resolve", SecurityQuery(symbol="MSFT"))
+    assert client.resolve(SecurityQuery(isin="US0378331005")) is None
+
+    history = client.history("AAPL", HistoryPeriod.Y1)
+    assert isinstance(history, History)
+    assert [c.close for c in history.candles] == [100.0, 100.0, 100.0]
+    assert source.calls[-1] == ("history", "AAPL", HistoryPeriod.Y1)
+
+    assert client.get_price("AAPL", date(2024, 1, 2)) == Price(100.0)
+    assert client.validate("AAPL", date(2024, 1, 2), 105.0) is True
+    assert source.calls[-1] == ("validate", "AAPL", date(2024, 1, 2), 105.0)
+    source.price = None
+    assert client.get_price("AAPL") is None
+
+
+def test_errors_are_reraised(server, connect):
+    client = connect(server.address)
+
+    with pytest.raises(RemoteError, match="VendorError: vendor down") as info:
+        client.search("BOOM")
+    assert info.value.kind == "VendorError"
+
+    with pytest.raises(ConnectionError, match="rate limited") as info:
+        client.search("LIMIT")
+    assert info.value.retry_after == 2.5
+
+    with pytest.raises(PriceVerificationError) as info:
+        client.validate("AAPL", date(2024, 1, 2), 5000.0)
+    assert str(info.value) == "[AAPL] stub: Price is outside daily range (Range: 90.00 - 110.00)"
+    assert info.value.actual_date == date(2024, 1, 2)
+
+    # The connection survives errors
+    assert str(client.search("AAPL")[0].symbol) == "AAPL"
+
+
+def test_bad_requests(server, connect):
+    client = connect(server.address)
+    status, body = client._request("POST", "/history", b'{"period": "nope"}')
+    assert status == 400
+    status, body = client._request("POST", "/drop_tables", b"{}")
+    assert status == 404
+    with pytest.raises(LookupError, match="drop_tables"):
+        raise decode_error(body)
+
+
+def test_concurrent_clients(server, connect):
+    client = connect(server.address)
+    results = []
+
+    def work():
+        for _ in range(20):
+            results.append(client.get_price("AAPL", date(2024, 1, 2)))
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == [Price(100.0)] * 80
+
+    # close() reaches the connections the worker threads opened
+    assert len(client._connections) == 4
+    opened = list(client._connections)
+    client.close()
+    assert not client._connections
+    assert all(c.sock is None for c in opened)
+    assert client.get_price("AAPL", date(2024, 1, 2)) == Price(100.0)
+
+
+def test_client_reconnects_after_restart(source, tmp_path, connect):
+    path = str(tmp_path / "md.sock")
+    client = connect(path)
+    with DataSourceServer(source, path):
+        assert client.search("AAPL")
+    assert not os.path.exists(path)
+    with DataSourceServer(source, path):
+        assert str(client.search("MSFT")[0].symbol) == "MSFT"
+    assert not client.health()
+
+
+def test_client_recovers_after_timeout(server, source, connect):
+    client = connect(server.address, timeout=0.2)
+    source.delay = 0.5
+    with pytest.raises(TimeoutError):
+        client.search("AAPL")
+    source.delay = 0.0
+    assert str(client.search("AAPL")[0].symbol) == "AAPL"
+
+
+def test_stale_socket_replaced_live_socket_refused(source, tmp_path, connect):
+    path = str(tmp_path / "md.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+    with DataSourceServer(source, path) as server:
+        assert connect(path).search("AAPL")
+        with pytest.raises(OSError, match="Another server"):
+            DataSourceServer(source, path)
+        assert server.address == path
+
+
+def test_wire_encoding_is_canonical():
+    a = encode_call("history", "AAPL")
+    b = encode_call("history", symbol="AAPL", period=HistoryPeriod.MO1)
+    assert a == b
+    assert decode_call("history", a) == (
+        decode_call("history", b)[0],
+        HistoryPeriod.MO1,
+    )
+    with pytest.raises(TypeError):
+        encode_call("search", "a", "b")
+    with pytest.raises(ValueError, match="Unknown DataSource method"):
+        encode_call("drop_tables")
+    assert b'"retry_after":1.0' in encode_error(type("E", (Exception,), {"retry_after": 1})("x"))
+
+
+def test_warm_calls_are_fast(server, connect):
+    client = connect(server.address)
+    client.get_price("AAPL", date(2024, 1, 2))
+    start = time.perf_counter()
+    for _ in range(50):
+        client.get_price("AAPL", date(2024, 1, 2))
+    assert (time.perf_counter() - start) / 50 < 0.02
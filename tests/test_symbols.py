@@ -0,0 +1,84 @@
+import pytest
+from pydantic import ValidationError
+
+from pydantic_market_data import (
+    ParsedSymbol,
+    Security,
+    SymbolFormat,
+    normalize_exchange,
+    parse_symbol,
+    render_symbol,
+    translate_symbol,
+    translate_symbols,
+)
+
+
+def test_parse_colon_symbols():
+    assert parse_symbol("AAPL:NSQ") == ParsedSymbol(ticker="AAPL", exchange="NASDAQ")
+    assert parse_symbol(" brk.b:nyq ") == ParsedSymbol(ticker="BRK.B", exchange="NYSE")
+    assert parse_symbol("VOD") == ParsedSymbol(ticker="VOD")
+    assert parse_symbol("AAPL:NSQ").mic == "XNAS"
+
+
+def test_parse_vendor_symbols():
+    assert parse_symbol("VOD.L", "yahoo") == ParsedSymbol(ticker="VOD", exchange="LSE")
+    assert parse_symbol("BRK-B", SymbolFormat.YAHOO) == ParsedSymbol(ticker="BRK.B", exchange="US")
+    assert parse_symbol("SAP GY Equity", "bloomberg") == ParsedSymbol(
+        ticker="SAP", exchange="XETRA"
+    )
+    assert parse_symbol("BRK/B UN", "bloomberg") == ParsedSymbol(ticker="BRK.B", exchange="NYSE")
+
+
+def test_parse_is_memoized():
+    assert parse_symbol("MSFT:NSQ") is parse_symbol("MSFT:NSQ")
+
+
+@pytest.mark.parametrize(
+    ("symbol", "format"),
+    [("AAPL:XYZ", "colon"), ("7203.XX", "yahoo"), ("AAPL", "bloomberg"), (":NSQ", "colon")],
+)
+def test_parse_rejects_unknown_or_malformed(symbol, format):
+    with pytest.raises(ValueError):
+        parse_symbol(symbol, format)
+
+
+def test_render_formats():
+    brk = ParsedSymbol(ticker="brk.b", exchange="XNYS")
+    assert brk.exchange == "NYSE"
+    assert render_symbol(brk, "colon") == str(brk) == "BRK.B:NYQ"
+    assert brk.render("yahoo") == "BRK-B"
+    assert brk.render("bloomberg") == "BRK/B UN Equity"
+    assert ParsedSymbol(ticker="7203", exchange="TSE").render("yahoo") == "7203.T"
+
+    with pytest.raises(ValueError):
+        ParsedSymbol(ticker="AAPL").render("bloomberg")
+    with pytest.raises(ValidationError):
+        ParsedSymbol(ticker="AAPL", exchange="Nowhere")
+
+
+def test_translate_round_trips():
+    for symbol in ["AAPL:NSQ", "VOD:LSE", "SAP:GER", "BRK.B:NYQ", "MC:PAR"]:
+        bloomberg = translate_symbol(symbol, "colon", "bloomberg")
+        assert translate_symbol(bloomberg, "bloomberg", "colon") == symbol
+    assert translate_symbol("VOD.L", "yahoo", "bloomberg") == "VOD LN Equity"
+    assert translate_symbol("AAPL", "yahoo", "bloomberg") == "AAPL US Equity"
+
+
+def test_translate_symbols_bulk():
+    symbols = ["VOD.L", "AAPL", "BAD.XX", "VOD.L", "SAP.DE"]
+    assert translate_symbols(symbols, "yahoo", "colon") == [
+        "VOD:LSE",
+        "AAPL",
+        None,
+        "VOD:LSE",
+        "SAP:GER",
+    ]
+
+
+def test_normalize_exchange_and_symbol_parts():
+    assert normalize_exchange("xnas") == normalize_exchange("NSQ") == "NASDAQ"
+    with pytest.raises(ValueError):
+        normalize_exchange("MOON")
+
+    security = Security(symbol="AAPL:NSQ", name="Apple Inc")
+    assert security.symbol.parts == ParsedSymbol(ticker="AAPL", exchange="NASDAQ")
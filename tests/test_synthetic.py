@@ -0,0 +1,88 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from pydantic_market_data import History, HistoryInterval, HistoryPeriod, Security, get_calendar
+from pydantic_market_data.bulk import figi_check_digits_ok, isin_checksums_ok
+from pydantic_market_data.models import validate_figi, validate_isin
+from pydantic_market_data.synthetic import (
+    generate_columns,
+    generate_figis,
+    generate_histories,
+    generate_history,
+    generate_isins,
+    generate_securities,
+)
+
+END = date(2024, 6, 28)
+
+
+def test_identifiers_are_valid_and_distinct():
+    isins = generate_isins(5000, seed=1)
+    figis = generate_figis(5000, seed=1)
+    assert len(set(isins)) == len(set(figis)) == 5000
+    assert isin_checksums_ok(isins).all()
+    assert figi_check_digits_ok(figis).all()
+    for isin, figi in zip(isins[:100], figis[:100], strict=True):
+        assert validate_isin(isin) == isin
+        assert validate_figi(figi) == figi
+    assert all(isin.startswith("US") for isin in isins)
+    assert generate_isins(3, ["GB", "DE", "JP"], seed=2)[2].startswith("JP")
+    with pytest.raises(ValueError):
+        generate_isins(3, ["GB"])
+
+
+def test_generate_securities():
+    securities = generate_securities(1000, seed=3)
+    assert len({str(s.symbol) for s in securities}) == 1000
+    first = securities[0]
+    # Securities pass full model validation
+    assert Security.model_validate(first.model_dump()) == first
+    listings = {(s.exchange, str(s.country), str(s.currency), str(s.isin)[:2]) for s in securities}
+    assert listings == {
+        ("NYSE", "US", "USD", "US"),
+        ("NASDAQ", "US", "USD", "US"),
+        ("LSE", "GB", "GBP", "GB"),
+        ("XETRA", "DE", "EUR", "DE"),
+    }
+    assert generate_securities(10, seed=4) == generate_securities(10, seed=4)
+
+
+def test_generate_columns_is_consistent_and_reproducible():
+    columns = generate_columns(HistoryPeriod.Y5, end=END, seed=7)
+    again = generate_columns(HistoryPeriod.Y5, end=END, seed=7)
+    assert columns.index.equals(get_calendar().expected_index(HistoryPeriod.Y5, "1d", END))
+    for field in ("open", "high", "low", "close", "volume"):
+        np.testing.assert_array_equal(columns[field], again[field])
+    assert (columns["low"] <= np.minimum(columns["open"], columns["close"])).all()
+    assert (columns["high"] >= np.maximum(columns["open"], columns["close"])).all()
+    assert (columns["low"] > 0).all()
+    assert (columns["volume"] > 0).all()
+    np.testing.assert_array_equal(columns["close"], np.round(columns["close"], 2))
+
+    log_returns = np.diff(np.log(generate_columns("max", end=END, decimals=None, seed=1)["close"]))
+    assert np.std(log_returns) * np.sqrt(252) == pytest.approx(0.2, rel=0.05)
+
+
+def test_intraday_follows_exchange_hours():
+    columns = generate_columns("5d", HistoryInterval.IM5, exchange="LSE", end=END, seed=1)
+    assert len(columns) == 5 * 102
+    assert str(columns.index.tz) == "Europe/London"
+    assert columns.index[0].hour == 8
+
+
+def test_generate_histories():
+    securities = generate_securities(4, seed=1)
+    histories = generate_histories(securities, HistoryPeriod.Y1, end=END, seed=9)
+    assert all(isinstance(h, History) for h in histories)
+    assert [h.security for h in histories] == securities
+    # Each exchange's own holidays are skipped
+    assert len(histories[2].candles) != len(histories[0].candles)
+    closes = {round(h.candles[0].close, 2) for h in histories}
+    assert len(closes) == 4
+    repeat = generate_histories(securities, HistoryPeriod.Y1, end=END, seed=9)
+    assert repeat[3].candles == histories[3].candles
+
+    history = generate_history(securities[0], "1mo", "1d", end=END, seed=1)
+    assert History.model_validate(history.model_dump()) == history